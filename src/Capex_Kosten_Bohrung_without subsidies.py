@@ -1,6 +1,6 @@
 import numpy as np
 import pandas as pd
-from scipy.stats import truncnorm
+from mc_engine import TruncNormal
 
 #Parameter
 N_SIM = 10_000
@@ -8,8 +8,8 @@ RNG = np.random.default_rng(42)
 
 # Trunkierte Normalverteilung für die Pipeline-Länge
 def truncated_normal(mean, std, low, upp, size, rng):
-    a, b = (low - mean) / std, (upp - mean) / std
-    return truncnorm.rvs(a, b, loc=mean, scale=std, size=size, random_state=rng)
+    # inverse Verteilungsfunktion (ein Durchlauf) statt truncnorm.rvs
+    return TruncNormal(mean, std, low, upp).sample(rng, size)
 
 # Pipeline-Länge [m] und -Kosten [€]
 length = truncated_normal(mean=2000, std=500, low=1000, upp=3000, size=N_SIM, rng=RNG)
@@ -1,13 +1,19 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from pathlib import Path
-import zipfile
-from scipy.stats import norm
+
+from cost_analytic import PolyCurve, analytic_cost
+from mc_adaptive import adaptive_mc
+from mc_engine import Uniform
+
+# Bohrkosten je Bohrung: a·z² + b·z + c (€), zwei Bohrungen
+A, B, C = 0.131223, 2_508.990455, 1_643_364.545458
 
 
 def drilling_cost(depth_m: np.ndarray) -> np.ndarray:
 
-    return 2 * (0.131223 * depth_m ** 2 + 2_508.990455 * depth_m + 1_643_364.545458)
+    return 2 * (A * depth_m ** 2 + B * depth_m + C)
+
+# dieselbe Kurve als Polynom (aufsteigende Koeffizienten) für die exakte Verteilung
+DRILLING_CURVE = PolyCurve((2 * C, 2 * B, 2 * A))
 
 def mc_drilling_cost(
         n_samples: int = 100_000,
@@ -15,14 +21,29 @@ def mc_drilling_cost(
         depth_max: float = 4_000,
         seed: int = 42,
         plot: bool = True,
+        rtol: float | None = None,
+        curve=None,
 ):
-    rng = np.random.default_rng(seed)
-
-    # a) sample depths ~ U(depth_min, depth_max)
-    depths = rng.uniform(depth_min, depth_max, n_samples)
-
-    # b) deterministic costs for each depth
-    costs = drilling_cost(depths)
+    # curve: kalibrierte Kurve je Bohrung (calibration.CalibratedCurve) → Koeffizienten
+    # werden mit der Tiefe gezogen; None = feste Koeffizienten von drilling_cost
+    cost_fn = drilling_cost if curve is None else (lambda z: 2 * curve.sample(z, rng))
+    if rtol is None:
+        rng = np.random.default_rng(seed)
+
+        # a) sample depths ~ U(depth_min, depth_max)
+        depths = rng.uniform(depth_min, depth_max, n_samples)
+
+        # b) costs for each depth (deterministic with the fixed curve)
+        costs = cost_fn(depths)
+    else:
+        # a+b) adaptive: draw in batches until the 95 % CIs of mean and
+        #      P10/P50/P90 are below rtol (n_samples is the upper limit)
+        rng = np.random.default_rng([seed, 1])      # Koeffizienten-Ziehungen der Kurve
+        res = adaptive_mc(
+            lambda rng, n: rng.uniform(depth_min, depth_max, n),
+            monitor=cost_fn, rtol=rtol, max_samples=n_samples, seed=seed,
+        )
+        depths, costs, n_samples = res["samples"], res["values"], res["n"]
 
     # c) descriptive statistics
     mean = costs.mean()
@@ -36,8 +57,25 @@ def mc_drilling_cost(
     print(f"10th percentile: {p10:,.0f} €")
     print(f"90th percentile: {p90:,.0f} €")
 
+    # Kontrolle: exakte Verteilung (z ~ U, Kosten monoton in z) → P10/P50/P90 ohne Stichprobenfehler.
+    # Kalibrierte Kurve: nur Polynome bis Grad 2 (Punktschätzer, ohne Koeffizienten-Unsicherheit),
+    # und nur wenn der Scheitel außerhalb [depth_min, depth_max] liegt – sonst keine Kontrolle
+    exact = None
+    if curve is None:
+        exact = analytic_cost(DRILLING_CURVE, Uniform(depth_min, depth_max))
+    elif curve.model == "poly" and curve.degree <= 2:
+        try:
+            exact = analytic_cost(curve.poly_curve(2), Uniform(depth_min, depth_max))
+        except ValueError:
+            pass
+    if exact is not None:
+        e10, e50, e90 = exact.percentile([10, 50, 90])
+        print(f"Analytic       : mean {exact.mean:,.0f} €, P10 {e10:,.0f} €, P50 {e50:,.0f} €, P90 {e90:,.0f} €")
+
     # d) plots
     if plot:
+        import matplotlib.pyplot as plt
+
         # 1. Histogramm der Monte-Carlo-Ergebnisse
         weights = np.ones_like(costs) * 100 / n_samples
         plt.figure()
@@ -55,25 +93,24 @@ def mc_drilling_cost(
         plt.tight_layout()
         plt.show()
 
-        # 2. Normalverteilung als eigene Balken-Abbildung
+    # 2. exakte Verteilung als eigene Balken-Abbildung (statt Normal-Näherung):
+    #    Anteil je Balken = F(rechte Kante) − F(linke Kante)
+    if plot and exact is not None:
+        import matplotlib.pyplot as plt
+
         plt.figure()
 
-        # Gleiche x-Achse wie Histogramm
-        x_vals = np.linspace((mean - 4 * std), (mean + 4 * std), 1000)
-        bin_edges = np.linspace((mean - 4 * std), (mean + 4 * std), 51)  # 50 Balken
+        bin_edges = np.linspace(*exact.range(), 51)  # 50 Balken über den Kostenbereich
         bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
         bin_width = bin_edges[1] - bin_edges[0]
+        frequencies = exact.bin_probabilities(bin_edges) * 100
 
-        # Wahrscheinlichkeitsdichte * binbreite * 100 ergibt geschätzte %-Häufigkeit
-        pdf_vals = norm.pdf(bin_centers, loc=mean, scale=std)
-        frequencies = pdf_vals * bin_width * 100 * n_samples
-
-        plt.bar(bin_centers / 1e6, frequencies / n_samples, width=bin_width / 1e6, color='blue', edgecolor='black',
+        plt.bar(bin_centers / 1e6, frequencies, width=bin_width / 1e6, color='blue', edgecolor='black',
                 alpha=0.8)
 
         plt.xlabel("costs (Mio. €)")
         plt.ylabel("frequency (%)")
-        plt.title("Normal distribution")
+        plt.title("Exact distribution (analytic)")
         plt.legend()
         plt.tight_layout()
         plt.show()
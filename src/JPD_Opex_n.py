@@ -1,6 +1,5 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.stats import multivariate_normal
 from scipy.interpolate import interp1d
 
 # Diskrete Stützpunkte der Pumpenkosten
@@ -26,77 +25,89 @@ sigma_fix = (122284.96 - 102673.75) / (2 * 1.2816)
 # Anzahl Simulationen
 n_sim = 10000
 
-# Zufällige Pumpenleistungen zwischen 10 % und 20 %
-pumpenleistung_samples = np.random.uniform(10, 20, n_sim)
-
-# Arrays vorbereiten
-fix_costs = []
-var_costs = []
-total_opex = []
 
 # Simulation
-for pct in pumpenleistung_samples:
-    mu_var = interp_mu_var(pct)
-    sigma_var = interp_sigma_var(pct)
-
-    # Unabhängige Normalverteilungen
-    fix_sample = np.random.normal(mu_fix, sigma_fix)
-    var_sample = np.random.normal(mu_var, sigma_var)
-
-    total = fix_sample + var_sample
-
-    fix_costs.append(fix_sample)
-    var_costs.append(var_sample)
-    total_opex.append(total)
-
-fix_costs = np.array(fix_costs)
-var_costs = np.array(var_costs)
-total_opex = np.array(total_opex)
-
-# P10, P50, P90 berechnen
-p10 = np.percentile(total_opex, 10)
-p50 = np.percentile(total_opex, 50)
-p90 = np.percentile(total_opex, 90)
-
-# -----------------------------------------
-# Plot 1: 3D Scatter Plot (separat)
-# -----------------------------------------
-fig1 = plt.figure(figsize=(10, 6))
-ax = fig1.add_subplot(111, projection='3d')
-
-sc = ax.scatter(fix_costs, var_costs, pumpenleistung_samples,
-                c=pumpenleistung_samples, cmap='viridis', s=2, alpha=0.5)
-
-ax.set_xlabel('Fixkosten (€)')
-ax.set_ylabel('Variable Kosten (€)')
-ax.set_zlabel('Pumpenleistung [%]')
-ax.set_title('3D Scatter Plot: Opex Simulation')
-
-cb = plt.colorbar(sc, ax=ax, pad=0.1)
-cb.set_label('Pumpenleistung [%]')
-
-plt.tight_layout()
-plt.show()
-
-# -----------------------------------------
-# Plot 2: Histogramm (separat)
-# -----------------------------------------
-plt.figure(figsize=(10, 6))
-
-counts, bins, patches = plt.hist(total_opex, bins=50, color='skyblue', edgecolor='black', density=True, alpha=0.7)
-
-plt.axvline(p10, color='red', linestyle='--', linewidth=2, label=f'P10 = {p10:,.0f} €')
-plt.axvline(p50, color='black', linestyle='-', linewidth=2, label=f'P50 = {p50:,.0f} €')
-plt.axvline(p90, color='green', linestyle='--', linewidth=2, label=f'P90 = {p90:,.0f} €')
-
-plt.title('Histogramm der Gesamt-OPEX-Kosten')
-plt.xlabel('Gesamt-OPEX (€)')
-plt.ylabel('Dichte')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-
-print(f"P10 OPEX: {p10:,.2f} €")
-print(f"P50 OPEX: {p50:,.2f} €")
-print(f"P90 OPEX: {p90:,.2f} €")
+def simulate_opex(n_sim, rng):
+    # Zufällige Pumpenleistungen zwischen 10 % und 20 %
+    pumpenleistung_samples = rng.uniform(10, 20, n_sim)
+
+    # Arrays vorbereiten
+    fix_costs = []
+    var_costs = []
+    total_opex = []
+
+    for pct in pumpenleistung_samples:
+        mu_var = interp_mu_var(pct)
+        sigma_var = interp_sigma_var(pct)
+
+        # Unabhängige Normalverteilungen
+        fix_sample = rng.normal(mu_fix, sigma_fix)
+        var_sample = rng.normal(mu_var, sigma_var)
+
+        total = fix_sample + var_sample
+
+        fix_costs.append(fix_sample)
+        var_costs.append(var_sample)
+        total_opex.append(total)
+
+    return pumpenleistung_samples, np.array(fix_costs), np.array(var_costs), np.array(total_opex)
+
+
+if __name__ == "__main__":
+    from mc_trace import stage, trace_run
+
+    with trace_run("opex", verbose=True):
+        rng = np.random.default_rng(42)
+        with stage("sample+evaluate", n_sim):
+            pumpenleistung_samples, fix_costs, var_costs, total_opex = simulate_opex(n_sim, rng)
+
+        # P10, P50, P90 berechnen
+        with stage("reduce", n_sim):
+            p10 = np.percentile(total_opex, 10)
+            p50 = np.percentile(total_opex, 50)
+            p90 = np.percentile(total_opex, 90)
+
+        with stage("render", n_sim):
+            # -----------------------------------------
+            # Plot 1: 3D Scatter Plot (separat)
+            # -----------------------------------------
+            fig1 = plt.figure(figsize=(10, 6))
+            ax = fig1.add_subplot(111, projection='3d')
+
+            sc = ax.scatter(fix_costs, var_costs, pumpenleistung_samples,
+                            c=pumpenleistung_samples, cmap='viridis', s=2, alpha=0.5)
+
+            ax.set_xlabel('Fixkosten (€)')
+            ax.set_ylabel('Variable Kosten (€)')
+            ax.set_zlabel('Pumpenleistung [%]')
+            ax.set_title('3D Scatter Plot: Opex Simulation')
+
+            cb = plt.colorbar(sc, ax=ax, pad=0.1)
+            cb.set_label('Pumpenleistung [%]')
+
+            plt.tight_layout()
+
+            # -----------------------------------------
+            # Plot 2: Histogramm (separat)
+            # -----------------------------------------
+            plt.figure(figsize=(10, 6))
+
+            counts, bins, patches = plt.hist(total_opex, bins=50, color='skyblue', edgecolor='black', density=True, alpha=0.7)
+
+            plt.axvline(p10, color='red', linestyle='--', linewidth=2, label=f'P10 = {p10:,.0f} €')
+            plt.axvline(p50, color='black', linestyle='-', linewidth=2, label=f'P50 = {p50:,.0f} €')
+            plt.axvline(p90, color='green', linestyle='--', linewidth=2, label=f'P90 = {p90:,.0f} €')
+
+            plt.title('Histogramm der Gesamt-OPEX-Kosten')
+            plt.xlabel('Gesamt-OPEX (€)')
+            plt.ylabel('Dichte')
+            plt.legend()
+            plt.grid(True)
+            plt.tight_layout()
+
+    print(f"P10 OPEX: {p10:,.2f} €")
+    print(f"P50 OPEX: {p50:,.2f} €")
+    print(f"P90 OPEX: {p90:,.2f} €")
+
+    # Fenster erst nach dem Trace öffnen, damit Wartezeit nicht mitgemessen wird
+    plt.show()
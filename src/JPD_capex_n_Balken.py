@@ -1,14 +1,14 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.stats import truncnorm
+from mc_engine import TruncNormal
 from mpl_toolkits.mplot3d import Axes3D
 
 n_sim = 10000
 
 # Funktion für Truncated Normal
 def truncated_normal(mean, std, low, upp, size):
-    a, b = (low - mean) / std, (upp - mean) / std
-    return truncnorm.rvs(a, b, loc=mean, scale=std, size=size)
+    # inverse Verteilungsfunktion (ein Durchlauf) statt truncnorm.rvs
+    return TruncNormal(mean, std, low, upp).sample(np.random.default_rng(), size)
 
 # -------------------------------
 # Tiefe simulieren (in m)
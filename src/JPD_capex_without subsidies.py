@@ -1,7 +1,7 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.stats import truncnorm
+from mc_engine import TruncNormal
 
 # --------------------------------------------------
 # Einstellungen
@@ -11,8 +11,8 @@ SEED   = 42                     # Reproduzierbarkeit
 
 # Truncated-Normal-Hilfsfunktion
 def truncated_normal(mean, std, low, upp, size, rng):
-    a, b = (low - mean) / std, (upp - mean) / std
-    return truncnorm.rvs(a, b, loc=mean, scale=std, size=size, random_state=rng)
+    # inverse Verteilungsfunktion (ein Durchlauf) statt truncnorm.rvs
+    return TruncNormal(mean, std, low, upp).sample(rng, size)
 
 # Zufallszahlgenerator
 rng = np.random.default_rng(SEED)
@@ -1,6 +1,9 @@
 import pandas as pd
 import os
 
+from mc_trace import stage, trace_run
+from result_store import ResultStore
+
 # Szenarien-Werte (in €)
 bohrkosten_szenarien = {
     "P10": 9_143_985,
@@ -26,6 +29,7 @@ heat_per_year = 50_000  # MWh/Jahr
 lifetime_years = 30
 discount_rate = 0.06
 opex_escalation = 0.02
+EXPORT_EXCEL = False   # Excel nur noch optional, Standard ist der Ergebnisspeicher
 
 # Ergebnisliste
 results = []
@@ -44,59 +48,74 @@ def pv_factor_escalating(g, r, n):
         return ((1 + g) ** n - (1 + r) ** n) / ((g - r) * (1 + r) ** n)
 
 
-# Alle Szenario-Kombinationen durchrechnen
-for bohr_scenario, bohrkosten in bohrkosten_szenarien.items():
-    for pipeline_scenario, pipelinekosten in pipelinekosten_szenarien.items():
-        for pump_scenario, pumpkosten_year1 in pumpkosten_szenarien.items():
-            # Subventionen berechnen
-            subventionen = subventionen_rate * bohrkosten
-            capex_netto = (bohrkosten + pipelinekosten) - subventionen
+def alle_kombinationen():
+    # Alle Szenario-Kombinationen durchrechnen
+    for bohr_scenario, bohrkosten in bohrkosten_szenarien.items():
+        for pipeline_scenario, pipelinekosten in pipelinekosten_szenarien.items():
+            for pump_scenario, pumpkosten_year1 in pumpkosten_szenarien.items():
+                # Subventionen berechnen
+                subventionen = subventionen_rate * bohrkosten
+                capex_netto = (bohrkosten + pipelinekosten) - subventionen
+
+                # CRF berechnen
+                crf = calc_crf(discount_rate, lifetime_years)
+
+                # CAPEX-Annuität
+                capex_annuity = capex_netto * crf
+
+                # OPEX fix (Jahr 1)
+                opex_fix_year1 = 0.02 * capex_netto
+
+                # Barwertfaktor für wachsende OPEX
+                pv_factor = pv_factor_escalating(opex_escalation, discount_rate, lifetime_years)
 
-            # CRF berechnen
-            crf = calc_crf(discount_rate, lifetime_years)
+                # Barwert der OPEX
+                pv_opex_fix = opex_fix_year1 * pv_factor
+                pv_opex_var = pumpkosten_year1 * pv_factor
+                pv_opex_total = pv_opex_fix + pv_opex_var
 
-            # CAPEX-Annuität
-            capex_annuity = capex_netto * crf
+                # Annuität der OPEX
+                opex_annuity = pv_opex_total * crf
 
-            # OPEX fix (Jahr 1)
-            opex_fix_year1 = 0.02 * capex_netto
+                # LCOH
+                lcoh = (capex_annuity + opex_annuity) / heat_per_year
 
-            # Barwertfaktor für wachsende OPEX
-            pv_factor = pv_factor_escalating(opex_escalation, discount_rate, lifetime_years)
+                # Ergebnisse speichern
+                results.append({
+                    "Bohrkosten Szenario": bohr_scenario,
+                    "Pipelinekosten Szenario": pipeline_scenario,
+                    "Pumpkosten Szenario": pump_scenario,
+                    "Netto CAPEX (€)": round(capex_netto, 2),
+                    "CAPEX-Annuität (€)": round(capex_annuity, 2),
+                    "OPEX-Annuität (€)": round(opex_annuity, 2),
+                    "LCOH (€/MWh)": round(lcoh, 2)
+                })
 
-            # Barwert der OPEX
-            pv_opex_fix = opex_fix_year1 * pv_factor
-            pv_opex_var = pumpkosten_year1 * pv_factor
-            pv_opex_total = pv_opex_fix + pv_opex_var
 
-            # Annuität der OPEX
-            opex_annuity = pv_opex_total * crf
+def speichern(df):
+    # Speicherort festlegen
+    output_folder = r"C:\Users\Marvin\Desktop\Masterarbeit"
+    os.makedirs(output_folder, exist_ok=True)  # Ordner anlegen, falls noch nicht vorhanden
 
-            # LCOH
-            lcoh = (capex_annuity + opex_annuity) / heat_per_year
+    # Spaltenspeicher (meta.json + .npy je Spalte)
+    store_path = os.path.join(output_folder, "LCOH_Szenarien")
+    ResultStore.create(store_path, discount_rate=discount_rate, lifetime_years=lifetime_years).append(df)
+    print(f"Ergebnisse wurden erfolgreich gespeichert unter:\n{store_path}")
 
-            # Ergebnisse speichern
-            results.append({
-                "Bohrkosten Szenario": bohr_scenario,
-                "Pipelinekosten Szenario": pipeline_scenario,
-                "Pumpkosten Szenario": pump_scenario,
-                "Netto CAPEX (€)": round(capex_netto, 2),
-                "CAPEX-Annuität (€)": round(capex_annuity, 2),
-                "OPEX-Annuität (€)": round(opex_annuity, 2),
-                "LCOH (€/MWh)": round(lcoh, 2)
-            })
+    if EXPORT_EXCEL:
+        output_path = os.path.join(output_folder, "LCOH_Szenarien.xlsx")
+        df.to_excel(output_path, index=False)
+        print(f"Excel-Datei gespeichert unter:\n{output_path}")
 
-# Ergebnisse in ein DataFrame umwandeln
-df = pd.DataFrame(results)
 
-# Speicherort festlegen
-output_folder = r"C:\Users\Marvin\Desktop\Masterarbeit"
-os.makedirs(output_folder, exist_ok=True)  # Ordner anlegen, falls noch nicht vorhanden
+n_kombinationen = len(bohrkosten_szenarien) * len(pipelinekosten_szenarien) * len(pumpkosten_szenarien)
 
-output_filename = "LCOH_Szenarien.xlsx"
-output_path = os.path.join(output_folder, output_filename)
+with trace_run("lcoh", verbose=True):
+    with stage("evaluate", n_kombinationen):
+        alle_kombinationen()
 
-# Excel-Datei speichern
-df.to_excel(output_path, index=False)
+    # Ergebnisse in ein DataFrame umwandeln
+    df = pd.DataFrame(results)
 
-print(f"Ergebnisse wurden erfolgreich gespeichert unter:\n{output_path}")
+    with stage("export", len(df)):
+        speichern(df)
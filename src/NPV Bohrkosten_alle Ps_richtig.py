@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from npv_model import lognormal_scenario, simulate_npv
+
 CAPEX_P10 = 9_143_985
 CAPEX_P50 = 9_845_536
 CAPEX_P90 = 10_540_442
@@ -19,41 +21,17 @@ RNG_SEED = 42
 
 MAINT_PCT = 0.02          # 2%
 
-# Hilfsfunktion: Lognormal‑Parameter aus P10/P50/P90
-def lognormal_params(p10, p50, p90):
-    z10, z90 = -1.2815515655446004, 1.2815515655446004  # z‑Werte StdNormal
-    mu = np.log(p50)
-    sigma = (np.log(p90) - np.log(p10)) / (z90 - z10)
-    return mu, sigma
-
-# Verteilungsparameter
-MU_CAPEX, SIG_CAPEX = lognormal_params(CAPEX_P10, CAPEX_P50, CAPEX_P90)
-MU_Q, SIG_Q = lognormal_params(Q_P10, Q_P50, Q_P90)
-MU_OPEX1, SIG_OPEX1 = lognormal_params(OPEX_P10, OPEX_P50, OPEX_P90)
-
-# Monte‑Carlo‑Zufallsziehungen
-rng = np.random.default_rng(RNG_SEED)
-capex_draw = rng.lognormal(MU_CAPEX, SIG_CAPEX, N_SIM)  # EUR
-q_draw = rng.lognormal(MU_Q, SIG_Q, N_SIM)              # GWh
-opex1_draw = rng.lognormal(MU_OPEX1, SIG_OPEX1, N_SIM)  # EUR
-
-# Zeitachsen & Abzinsungsfaktoren
-t = np.arange(1, YEARS + 1)
-discount = 1.0 / (1.0 + DISCOUNT_RATE) ** t
-opex_fac = (1.0 + OPEX_GROWTH) ** (t - 1)
-
-# OPEX: Basis + Eskalation (inkl. 2% CAPEX‑Anteil)
-opex_base = opex1_draw + MAINT_PCT * capex_draw          # (N_SIM,)
-opex_year = opex_base[:, None] * opex_fac                # (N_SIM, YEARS)
-
-# Erlöse & Netto‑Cashflows
-revenue_y = q_draw[:, None] * 1_000 * PRICE_PER_MWH      # 1GWh = 1000MWh
-net_cf = revenue_y - opex_year
-
-disc_ops = (net_cf * discount).sum(axis=1)              # abgezinste operat. CF
-
-# Kapitalwert (NPV)
-npv = -capex_draw + disc_ops
+SCENARIO = lognormal_scenario(
+    capex=(CAPEX_P10, CAPEX_P50, CAPEX_P90),
+    q=(Q_P10, Q_P50, Q_P90),
+    opex=(OPEX_P10, OPEX_P50, OPEX_P90),
+    price_per_mwh=PRICE_PER_MWH, opex_growth=OPEX_GROWTH, discount_rate=DISCOUNT_RATE,
+    years=YEARS, n_sim=N_SIM, seed=RNG_SEED,
+    maint_pct=MAINT_PCT,      # OPEX: Basis + Eskalation (inkl. 2% CAPEX‑Anteil)
+)
+
+# Monte‑Carlo‑Ziehungen & Kapitalwert (NPV)
+draws, npv = simulate_npv(SCENARIO)
 
 # Perzentile
 p10, p50, p90 = np.percentile(npv, [10, 50, 90]) / 1e6  # Mio. EUR
@@ -0,0 +1,68 @@
+import matplotlib.pyplot as plt
+import numpy as np
+
+from mc_trace import stage, trace_run
+from npv_model import lognormal_scenario, simulate_scenarios
+
+# ---------------- Eingabedaten ----------------
+# CAPEX (P10, P50, P90) je Bohrkosten-Szenario, wie in den NPV_Verteilung_Bohrung_*-Skripten
+CAPEX_SZENARIEN = {
+    "Bohrung P10":                 (8_710_000, 9_120_000, 9_530_000),
+    "Bohrung P50":                 (9_430_000, 9_840_000, 10_260_000),
+    "Bohrung P90":                 (10_160_000, 10_570_000, 10_980_000),
+    "Bohrung P10 ohne Förderung":  (13_860_000, 14_270_000, 14_680_000),
+    "Bohrung P50 ohne Förderung":  (8_030_000, 8_440_000, 8_850_000),
+    "Bohrung P90 ohne Förderung":  (16_280_000, 16_690_000, 17_100_000),
+}
+Q_P10, Q_P50, Q_P90 = 77.66, 88.76, 100.70
+OPEX_P10, OPEX_P50, OPEX_P90 = 1_842_494.42, 2_493_592.47, 3_218_984.25
+PRICE_PER_MWH, OPEX_GROWTH, DISCOUNT_RATE = 80.0, 0.02, 0.06
+YEARS, N_SIM, RNG_SEED = 30, 10_000, 42
+
+SCENARIOS = [
+    lognormal_scenario(
+        capex=capex,
+        q=(Q_P10, Q_P50, Q_P90),
+        opex=(OPEX_P10, OPEX_P50, OPEX_P90),
+        price_per_mwh=PRICE_PER_MWH, opex_growth=OPEX_GROWTH, discount_rate=DISCOUNT_RATE,
+        years=YEARS, n_sim=N_SIM, seed=RNG_SEED, name=name,
+    )
+    for name, capex in CAPEX_SZENARIEN.items()
+]
+
+if __name__ == "__main__":
+    with trace_run("npv", verbose=True):
+        # -------- alle Szenarien in einem Durchlauf (gemeinsame Zufallszahlen) --------
+        draws, npv = simulate_scenarios(SCENARIOS)            # (Szenarien, Ziehungen) in €
+        _, lcoh = simulate_scenarios(SCENARIOS, metric="lcoh")  # €/MWh
+
+        # -------- Kennzahlen --------
+        with stage("reduce", npv.size):
+            pct = np.percentile(npv / 1e6, [10, 50, 90], axis=1)
+            ref = npv[0]   # Differenzen gegen "Bohrung P10" – dank CRN nur CAPEX-Rauschen
+            rows = []
+            for i, sc in enumerate(SCENARIOS):
+                diff = (npv[i] - ref) / 1e6
+                ci = 1.96 * diff.std(ddof=1) / np.sqrt(diff.size)
+                rows.append((sc.name, pct[:, i], np.mean(npv[i] < 0), np.median(lcoh[i]), diff.mean(), ci))
+
+        print(f"{'Szenario':<28}{'P10':>9}{'P50':>9}{'P90':>9}{'P(NPV<0)':>10}{'LCOH P50':>10}{'Δ Mittel':>10}{'± KI95':>8}")
+        for name, (p10, p50, p90), p_loss, lcoh_p50, d_mean, ci in rows:
+            print(f"{name:<28}{p10:9.2f}{p50:9.2f}{p90:9.2f}{p_loss:10.3f}{lcoh_p50:10.2f}{d_mean:10.2f}{ci:8.3f}")
+
+        # -------- Histogramme --------
+        with stage("render", npv.size):
+            weights = np.ones(npv.shape[1]) * 100.0 / npv.shape[1]
+
+            plt.figure(figsize=(9, 5))
+            for sc, values in zip(SCENARIOS, npv):
+                plt.hist(values / 1e6, bins=50, weights=weights, histtype="step", label=sc.name)
+            plt.axvline(0, linestyle="dashed", color="black")  # Break‑even
+
+            plt.xlabel("NPV (Million €)")
+            plt.ylabel("Frequency (%)")
+            plt.title("Distribution of the Net Present Value – all drilling scenarios")
+            plt.legend()
+            plt.tight_layout()
+
+    plt.show()
@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
+
+from mc_engine import sample_block
+from npv_model import lognormal_scenario, npv_matrix
 
 # Gegebene P10/P50/P90-Werte
 CAPEX_P10 = 9_143_985
@@ -18,35 +20,16 @@ N_SIM = 10_000
 RNG_SEED = 42
 MAINT_PCT = 0.02  # 2% Wartungskosten als Anteil an CAPEX
 
+SCENARIO = lognormal_scenario(
+    capex=(CAPEX_P10, CAPEX_P50, CAPEX_P90),
+    q=(Q_P10, Q_P50, Q_P90),
+    opex=(OPEX_P10, OPEX_P50, OPEX_P90),
+    price_per_mwh=PRICE_PER_MWH, opex_growth=OPEX_GROWTH,
+    years=YEARS, n_sim=N_SIM, seed=RNG_SEED, maint_pct=MAINT_PCT,
+)
 
-# Hilfsfunktion: Lognormal‑Parameter berechnen
-def lognormal_params(p10, p50, p90):
-    z10, z90 = -1.2815515655446004, 1.2815515655446004
-    mu = np.log(p50)
-    sigma = (np.log(p90) - np.log(p10)) / (z90 - z10)
-    return mu, sigma
-
-
-# Verteilungsparameter berechnen
-MU_CAPEX, SIG_CAPEX = lognormal_params(CAPEX_P10, CAPEX_P50, CAPEX_P90)
-MU_Q, SIG_Q = lognormal_params(Q_P10, Q_P50, Q_P90)
-MU_OPEX1, SIG_OPEX1 = lognormal_params(OPEX_P10, OPEX_P50, OPEX_P90)
-
-# Zufallsziehungen
-rng = np.random.default_rng(RNG_SEED)
-capex_draw = rng.lognormal(MU_CAPEX, SIG_CAPEX, N_SIM)
-q_draw = rng.lognormal(MU_Q, SIG_Q, N_SIM)
-opex1_draw = rng.lognormal(MU_OPEX1, SIG_OPEX1, N_SIM)
-
-# Zeitachse
-t = np.arange(1, YEARS + 1)
-opex_fac = (1.0 + OPEX_GROWTH) ** (t - 1)
-
-# OPEX mit Eskalation
-opex_base = opex1_draw + MAINT_PCT * capex_draw
-opex_year = opex_base[:, None] * opex_fac
-revenue_y = q_draw[:, None] * 1_000 * PRICE_PER_MWH
-net_cf = revenue_y - opex_year
+# Zufallsziehungen (gemeinsam für alle Diskontsätze)
+draws = sample_block(SCENARIO.inputs, N_SIM, RNG_SEED)
 
 # Discount-Rate Variation
 discount_rates = np.linspace(0.05, 0.10, 6)  # 5%, 6%, ..., 10%
@@ -61,9 +44,7 @@ colors = plt.cm.viridis(np.linspace(0, 1, len(discount_rates)))
 x_vals = np.linspace(-20, 100, 1000)  # X-Achse in Millionen EUR
 
 for idx, (rate, color) in enumerate(zip(discount_rates, colors)):
-    discount = 1.0 / (1.0 + rate) ** t
-    disc_ops = (net_cf * discount).sum(axis=1)
-    npv = -capex_draw + disc_ops
+    npv = npv_matrix(draws["capex"], draws["q"], draws["opex1"], SCENARIO, discount_rate=rate)
     npv_mio = npv / 1e6
 
     kde = gaussian_kde(npv_mio)
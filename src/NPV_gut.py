@@ -8,10 +8,13 @@ Autor: ChatGPT (17 Jul 2025)
 • Ergebnis: Histogramm & tabellarische Kennzahlen
 """
 
-import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from drawdown import simulate_npv_drawdown
+from mc_trace import trace_run
+from npv_model import lognormal_scenario, simulate_npv, npv_stats
+
 # ----------------------------- Eingabe -----------------------------
 # Capital expenditure (CapEx)       – € absolut
 CAPEX_P10 = 5_124_498.589876813
@@ -35,52 +38,26 @@ DISCOUNT_RATE = 0.06     # 6 % p. a.
 YEARS         = 30       # Projektlaufzeit
 N_SIM         = 10_000   # Anzahl Simulationen
 RNG_SEED      = 42       # Reproduzierbarkeit
+ABKUEHLUNG    = False    # True: Q nimmt nach dem thermischen Durchbruch ab (drawdown.py)
 # ------------------------------------------------------------------
 
-def lognormal_params(p10, p50, p90):
-    """gibt μ, σ der zugr. Log-Normal in natural-log-Space zurück"""
-    z10, z90 = -1.2815515655446004, 1.2815515655446004  # Φ⁻¹(0.10), Φ⁻¹(0.90)
-    mu    = np.log(p50)
-    sigma = (np.log(p90) - np.log(p10)) / (z90 - z10)
-    return mu, sigma
-
-# Verteilungsparameter kalibrieren
-MU_CAPEX,  SIG_CAPEX  = lognormal_params(CAPEX_P10,  CAPEX_P50,  CAPEX_P90)
-MU_Q,      SIG_Q      = lognormal_params(Q_P10,      Q_P50,      Q_P90)
-MU_OPEX1,  SIG_OPEX1  = lognormal_params(OPEX_P10,   OPEX_P50,   OPEX_P90)
-
-# Zufalls­generator
-rng = np.random.default_rng(RNG_SEED)
-
-# Zufalls­ziehungen
-capex_draw   = rng.lognormal(MU_CAPEX,  SIG_CAPEX,  N_SIM)  # €
-q_draw       = rng.lognormal(MU_Q,      SIG_Q,      N_SIM)  # GWh/a
-opex1_draw   = rng.lognormal(MU_OPEX1,  SIG_OPEX1,  N_SIM)  # €
-
-# Zeitreihen-Faktoren
-t = np.arange(1, YEARS + 1)
-discount = 1.0 / (1.0 + DISCOUNT_RATE) ** t
-opex_fac = (1.0 + OPEX_GROWTH) ** (t - 1)
-
-# Jahres-Cashflows
-revenue_y1 = q_draw[:, None] * 1_000 * PRICE_PER_MWH          # €/a
-opex_year  = opex1_draw[:, None] * opex_fac                   # €/a
-net_cf     = revenue_y1 - opex_year                           # €/a
+SCENARIO = lognormal_scenario(
+    capex=(CAPEX_P10, CAPEX_P50, CAPEX_P90),
+    q=(Q_P10, Q_P50, Q_P90),
+    opex=(OPEX_P10, OPEX_P50, OPEX_P90),
+    price_per_mwh=PRICE_PER_MWH, opex_growth=OPEX_GROWTH, discount_rate=DISCOUNT_RATE,
+    years=YEARS, n_sim=N_SIM, seed=RNG_SEED,
+)
 
-# Abgezinste Operationen & NPV
-disc_ops = (net_cf * discount).sum(axis=1)
-npv      = -capex_draw + disc_ops                             # €/sim
+# Zufalls­ziehungen + abgezinste Cashflows in einem Durchlauf
+with trace_run("npv_gut", verbose=True):
+    if ABKUEHLUNG:
+        draws, npv = simulate_npv_drawdown(SCENARIO)          # Q = Jahr 1, danach Jahresreihe
+    else:
+        draws, npv = simulate_npv(SCENARIO)                   # €/sim
 
 # ----------------- Kennzahlen -----------------
-stats = {
-    "Mean NPV (M€)"  : np.mean(npv)        / 1e6,
-    "Median NPV (M€)": np.median(npv)      / 1e6,
-    "P05 NPV (M€)"   : np.percentile(npv, 5)  / 1e6,
-    "P10 NPV (M€)"   : np.percentile(npv, 10) / 1e6,
-    "P90 NPV (M€)"   : np.percentile(npv, 90) / 1e6,
-    "P95 NPV (M€)"   : np.percentile(npv, 95) / 1e6,
-    "Prob NPV < 0"   : np.mean(npv < 0)
-}
+stats = npv_stats(npv)
 stats_df = pd.DataFrame(stats, index=["Value"]).T
 print("\nMonte-Carlo-Ergebnisse (n = {:,})".format(N_SIM))
 print(stats_df)
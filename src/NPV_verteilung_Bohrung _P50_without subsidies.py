@@ -1,6 +1,10 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from mc_trace import trace_run
+from npv_model import lognormal_scenario, simulate_npv
+from sample_cache import SampleCache
+
 # Neue CAPEX-Parameter
 CAPEX_P10 = 8_030_000.0   # 5,21 Mio €
 CAPEX_P50 = 8_440_000.0   # 5,62 Mio €
@@ -12,36 +16,18 @@ OPEX_P10, OPEX_P50, OPEX_P90 = 1_842_494.42, 2_493_592.47, 3_218_984.25
 PRICE_PER_MWH, OPEX_GROWTH, DISCOUNT_RATE = 80.0, 0.02, 0.06
 YEARS, N_SIM, RNG_SEED = 30, 10_000, 42
 
-def lognormal_params(p10, p50, p90):
-    z10, z90 = -1.2815515655446004, 1.2815515655446004
-    mu = np.log(p50)
-    sigma = (np.log(p90) - np.log(p10)) / (z90 - z10)
-    return mu, sigma
-
-# Lognormal‑Parameter
-MU_CAPEX, SIG_CAPEX = lognormal_params(CAPEX_P10, CAPEX_P50, CAPEX_P90)
-MU_Q, SIG_Q = lognormal_params(Q_P10, Q_P50, Q_P90)
-MU_OPEX1, SIG_OPEX1 = lognormal_params(OPEX_P10, OPEX_P50, OPEX_P90)
-
-# Zufallsziehungen
-rng = np.random.default_rng(RNG_SEED)
-capex_draw = rng.lognormal(MU_CAPEX, SIG_CAPEX, N_SIM)
-q_draw     = rng.lognormal(MU_Q, SIG_Q, N_SIM)
-opex1_draw = rng.lognormal(MU_OPEX1, SIG_OPEX1, N_SIM)
-
-# Zeitachsen und Diskontierung
-t = np.arange(1, YEARS + 1)
-discount  = 1.0 / (1.0 + DISCOUNT_RATE) ** t
-opex_fac  = (1.0 + OPEX_GROWTH) ** (t - 1)
-
-# Operativer Cashflow
-revenue_y1 = q_draw[:, None] * 1_000 * PRICE_PER_MWH
-opex_year  = opex1_draw[:, None] * opex_fac
-net_cf     = revenue_y1 - opex_year
-disc_ops   = (net_cf * discount).sum(axis=1)
-
-# Kapitalwert
-npv = -capex_draw + disc_ops   # € absolut
+SCENARIO = lognormal_scenario(
+    capex=(CAPEX_P10, CAPEX_P50, CAPEX_P90),
+    q=(Q_P10, Q_P50, Q_P90),
+    opex=(OPEX_P10, OPEX_P50, OPEX_P90),
+    price_per_mwh=PRICE_PER_MWH, opex_growth=OPEX_GROWTH, discount_rate=DISCOUNT_RATE,
+    years=YEARS, n_sim=N_SIM, seed=RNG_SEED,
+)
+
+# -------- Zufallsziehungen, Cash‑flows und Kapitalwerte --------
+# Q/OPEX-Ziehungen werden zwischen P10/P50/P90 über den Cache geteilt
+with trace_run("npv_bohrung_p50_ohne_foerderung", verbose=True):
+    draws, npv = simulate_npv(SCENARIO, cache=SampleCache())   # € absolut
 
 # Quantile des NPV (in Mio €)
 p10, p50, p90 = np.percentile(npv / 1e6, [10, 50, 90])
@@ -1,5 +1,4 @@
 from itertools import product
-import pandas as pd
 #  Eingabedaten
 BOHRKOSTEN     = {"P10": 6_437_353, "P50": 7_038_546, "P90": 7_644_953}
 PIPELINEKOSTEN = {"P10":   841_306, "P50": 1_403_443, "P90": 1_960_620}
@@ -48,6 +47,8 @@ def build_rows():
 
 #Main
 if __name__ == "__main__":
+    import pandas as pd
+
     df = pd.DataFrame(build_rows())
     # nach Wunsch sortieren oder filtern
     pd.set_option("display.max_rows", None)   # alles anzeigen
@@ -55,24 +56,30 @@ if __name__ == "__main__":
 
 import os
 
+EXPORT_EXCEL = True    # Excel wie bisher; False → nur Ergebnisspeicher
+
 if __name__ == "__main__":
+    import pandas as pd
+
+    from result_store import ResultStore
+
     df = pd.DataFrame(build_rows())
-    # nach Wunsch sortieren oder filtern
-    pd.set_option("display.max_rows", None)  # alles anzeigen
-    print(df.to_string(index=False))
 
-    # ───────────── Excel-Export ─────────────
-    # Ziel-Ordner und Dateiname
+    # ───────────── Export ─────────────
+    # Ziel-Ordner
     output_dir = r"C:\Users\Marvin\Desktop\Masterarbeit"
-    output_filename = "opex_auswertung.xlsx"
 
     # Ordner erstellen, falls er noch nicht existiert
     os.makedirs(output_dir, exist_ok=True)
 
-    # Vollständigen Pfad erzeugen
-    output_path = os.path.join(output_dir, output_filename)
-
-    # DataFrame als Excel speichern
-    df.to_excel(output_path, index=False)
+    # Spaltenspeicher (meta.json + .npy je Spalte) – zusätzlich zur Excel-Datei.
+    # not_Entscheidungsbaum.py liest keins von beiden, sondern die von Hand
+    # gepflegte Tabelle "Opex auswertung_P10 undso.xlsx" (OPEX_XLSX).
+    store_path = os.path.join(output_dir, "opex_auswertung")
+    ResultStore.create(store_path).append(df)
+    print(f"Ergebnisspeicher gespeichert unter:\n{store_path}")
 
-    print(f"Datei erfolgreich gespeichert unter:\n{output_path}")
+    if EXPORT_EXCEL:
+        output_path = os.path.join(output_dir, "opex_auswertung.xlsx")
+        df.to_excel(output_path, index=False)
+        print(f"Datei erfolgreich gespeichert unter:\n{output_path}")
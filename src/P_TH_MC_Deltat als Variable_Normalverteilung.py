@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from mc_engine import Normal, Truncated
+
 # Konstanten
 T_surface, T_measured = 10.0, 15.0          # °C
 b        = T_surface - T_measured           # −5 K
@@ -19,16 +21,11 @@ z_min, z_max = 1_700.0, 2_200.0             # m
 
 rng = np.random.default_rng(seed)
 
-# 1) z und g ziehen, Ausreißer nachziehen
+# 1) z und g ziehen
 depths    = rng.uniform(z_min, z_max, n_samples)
 
-# Gradienten: Normalverteilung, nur positive Werte zulassen
-gradients = rng.normal(μ_g, σ_g, n_samples)
-mask = gradients > 0
-while np.any(~mask):                        # unplausible Werte ersetzen
-    n_bad = (~mask).sum()
-    gradients[~mask] = rng.normal(μ_g, σ_g, n_bad)
-    mask = gradients > 0
+# Gradienten: Normalverteilung, nur positive Werte zulassen (bei 0 gestutzt)
+gradients = Truncated(Normal(μ_g, σ_g), low=0.0).sample(rng, n_samples)
 
 #2) ΔT und P_th berechnen
 delta_T = gradients * depths + b            # K
@@ -1,9 +1,17 @@
 import numpy as np
-import matplotlib.pyplot as plt
+
+from cost_analytic import PolyCurve, analytic_cost
+from mc_adaptive import adaptive_mc
+from mc_engine import Uniform
+
+EUR_PER_M = 700.0       # Pipelinekosten [€/m]
 
 def pipeline_cost(length_m):
     """length_m – Skalar oder ndarray in Metern"""
-    return 700.0 * length_m
+    return EUR_PER_M * length_m
+
+# als Kostenkurve für die exakte Verteilung (cost_analytic.py)
+PIPELINE_CURVE = PolyCurve((0.0, EUR_PER_M))
 
 
 def mc_pipeline_cost(
@@ -12,14 +20,24 @@ def mc_pipeline_cost(
     L_max=3_000,          # 3 km
     seed=42,
     plot=True,
+    rtol=None,            # z. B. 1e-3 → adaptive Stichprobengröße
 ):
-    rng = np.random.default_rng(seed)
+    if rtol is None:
+        rng = np.random.default_rng(seed)
 
-    # a) Zufällige Längen ~ U(L_min, L_max)
-    lengths = rng.uniform(L_min, L_max, n_samples)
+        # a) Zufällige Längen ~ U(L_min, L_max)
+        lengths = rng.uniform(L_min, L_max, n_samples)
 
-    # b) Kosten berechnen
-    costs = pipeline_cost(lengths)
+        # b) Kosten berechnen
+        costs = pipeline_cost(lengths)
+    else:
+        # a+b) in Batches ziehen, bis die 95 %-KIs von Ø und P10/P50/P90
+        #      unter rtol liegen (n_samples ist die Obergrenze)
+        res = adaptive_mc(
+            lambda rng, n: rng.uniform(L_min, L_max, n),
+            monitor=pipeline_cost, rtol=rtol, max_samples=n_samples, seed=seed,
+        )
+        lengths, costs, n_samples = res["samples"], res["values"], res["n"]
 
     # c) Kennzahlen
     mean = costs.mean()
@@ -33,8 +51,15 @@ def mc_pipeline_cost(
     print(f"10. Perzentil : {p10:,.0f} €")
     print(f"90. Perzentil : {p90:,.0f} €")
 
+    # Kontrolle: exakte Werte (Kosten linear in L ~ U)
+    exact = analytic_cost(PIPELINE_CURVE, Uniform(L_min, L_max))
+    e10, e50, e90 = exact.percentile([10, 50, 90])
+    print(f"Analytisch    : Ø {exact.mean:,.0f} €, P10 {e10:,.0f} €, P50 {e50:,.0f} €, P90 {e90:,.0f} €")
+
     # d) Histogramm
     if plot:
+        import matplotlib.pyplot as plt
+
         plt.figure()
         plt.hist(costs / 1e6, bins=40)
         plt.xlabel("Kosten (Mio. €)")
@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from massenstrom import m_dot
 
 # --------------------------------------------------
@@ -19,21 +18,32 @@ def Pth(x, g, m_dot=m_dot, c_p=c_p, b=b):
     return m_dot * c_p * delta_T(x, g, b)
 
 #Verlauf zwischen 1000 m und 2000 m
-x = np.arange(1700, 2200, 1)          # x-Achse (m)
-
-plt.figure()
-for g in gradients:
-    P = Pth(x, g) / 1_000     # kW
-    plt.plot(x, P, marker="o",
-             label=f"g = {g:.3f} °C/m")
-
-plt.xlabel("depth x (m)")
-plt.ylabel("thermal performance (kW)")
-plt.title("P(x) = g·x + b")
-plt.grid(True)
-plt.legend(title="g-functions")
-plt.tight_layout()
-plt.show()
+def plot_curves(x=None, gradients=gradients):
+    """Zeichnet P(x) für mehrere Gradienten (matplotlib wird erst hier importiert)."""
+    import matplotlib.pyplot as plt
+
+    if x is None:
+        x = np.arange(1700, 2200, 1)          # x-Achse (m)
+
+    # alle Gradienten in einem Broadcast: (Tiefe, Gradient)
+    P_all = Pth(x[:, None], np.asarray(gradients)[None, :]) / 1_000     # kW
+
+    plt.figure()
+    for g, P in zip(gradients, P_all.T):
+        plt.plot(x, P, marker="o",
+                 label=f"g = {g:.3f} °C/m")
+
+    plt.xlabel("depth x (m)")
+    plt.ylabel("thermal performance (kW)")
+    plt.title("P(x) = g·x + b")
+    plt.grid(True)
+    plt.legend(title="g-functions")
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    plot_curves()
 
 # Selbst-Archivierung
 if __name__ == "__main__":
@@ -1,10 +1,18 @@
+from functools import partial
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+from brine import brine_power
+from massenstrom import V_dot, m_dot, sample_flow   # m_dot = V̇ · ρ ≈ 55.18 kg/s
+from mc_adaptive import adaptive_mc
+from mc_engine import Normal, Truncated, Uniform
+from mc_parallel import run_chunks
+from mc_stats import BinnedHistogram
+
 # -------------------- feste Konstanten -----------------------
 T_surface, T_measured = 10.0, 15.0          # °C
 b        = T_surface - T_measured           # −5 K
-m_dot    = 55.1786268                       # kg/s
 c_p      = 3_700.59                         # J/(kg·K)
 
 n_samples = 100_000
@@ -16,93 +24,170 @@ seed       = 42
 # NEU: Tiefe als Gleichverteilung in [1 700, 2 200] m
 z_min, z_max = 1_700.0, 2_200.0             # m
 
-rng = np.random.default_rng(seed)
-
-#1) z und g ziehen, Ausreißer nachziehen
-depths    = rng.uniform(z_min, z_max, n_samples)
-
-# Gradienten: Normalverteilung, nur positive Werte zulassen
-gradients = rng.normal(μ_g, σ_g, n_samples)
-mask = gradients > 0
-while np.any(~mask):                        # unplausible Werte ersetzen
-    n_bad = (~mask).sum()
-    gradients[~mask] = rng.normal(μ_g, σ_g, n_bad)
-    mask = gradients > 0
-
-# 2) ΔT und P_th berechnen
-delta_T = gradients * depths + b            # K
-P_th_kW = m_dot * c_p * delta_T / 1_000     # kW
-
-#3) Statistik
-
-def stats(a):
-    mean = a.mean()
-    ci95 = 1.96 * a.std(ddof=1) / np.sqrt(len(a))
-    p10, p50, p90 = np.percentile(a, [10, 50, 90])
-    return mean, ci95, p10, p50, p90
-
-μ_dT, ci_dT, p10_dT, p50_dT, p90_dT = stats(delta_T)
-μ_P , ci_P , p10_P , p50_P , p90_P  = stats(P_th_kW)
-
-print(f"{n_samples:,} MC‑Samples  (z ~ U({z_min:.0f}–{z_max:.0f} m), g ~ N)")
-print(f"ΔT :  Ø {μ_dT:6.2f} K  ±{ci_dT:5.2f} K   "
-      f"(10.–90 %: {p10_dT:.2f}–{p90_dT:.2f} K)")
-print(f"P  :  Ø {μ_P :7.1f} kW ±{ci_P :6.1f} kW  "
-      f"(10.–90 %: {p10_P :.1f}–{p90_P :.1f} kW)\n")
-
-#4) Plots
-## Hexbin ΔT vs. Tiefe
-plt.figure(figsize=(8, 5))
-plt.hexbin(depths, delta_T, gridsize=60, bins="log", cmap="viridis")
-plt.colorbar(label="log₁₀(N)")
-plt.xlabel("Tiefe z (m)")
-plt.ylabel("ΔT (K)")
-plt.title("ΔT – MC mit z ∈ [1700, 2200] m")
-plt.tight_layout()
-plt.show()
-
-## Hexbin P_th vs. Tiefe
-plt.figure(figsize=(8, 5))
-plt.hexbin(depths, P_th_kW, gridsize=60, bins="log", cmap="plasma")
-plt.colorbar(label="log₁₀(N)")
-plt.xlabel("Tiefe z (m)")
-plt.ylabel("P_th (kW)")
-plt.title("P_th – abgeleitet aus denselben ΔT‑Samples")
-plt.tight_layout()
-plt.show()
-
-## Histogramme (in %)
-weights = np.ones_like(delta_T) / n_samples * 100
-fig, ax = plt.subplots(1, 2, figsize=(13, 4))
-
-ax[0].hist(delta_T, bins=60, weights=weights)
-ax[0].axvline(μ_dT, ls="--")
-ax[0].fill_betweenx([0, weights.max()], μ_dT - ci_dT, μ_dT + ci_dT, alpha=0.2)
-ax[0].set_xlabel("ΔT (K)")
-ax[0].set_ylabel("Häufigkeit (%)")
-ax[0].set_title("ΔT‑Verteilung")
-
-ax[1].hist(P_th_kW, bins=60, weights=weights, color="tab:orange")
-ax[1].axvline(μ_P, ls="--", color="k")
-ax[1].fill_betweenx([0, weights.max()], μ_P - ci_P, μ_P + ci_P, alpha=0.2, color="tab:orange")
-ax[1].set_xlabel("P_th (kW)")
-ax[1].set_ylabel("Häufigkeit (%)")
-ax[1].set_title("P_th‑Verteilung")
-
-fig.suptitle("Histogramme (z ∈ [1700, 2200] m, %-Skala)")
-fig.tight_layout()
-plt.show()
-
-#5) Jahresenergie berechnen
-
-hours_per_year = 8_000
-
-E_th_year_MWh = μ_P * hours_per_year / 1_000
-ci_E_th_MWh = ci_P * hours_per_year / 1_000
-p10_E_th_MWh = p10_P * hours_per_year / 1_000
-p50_E_th_MWh = p50_P * hours_per_year / 1_000
-p90_E_th_MWh = p90_P * hours_per_year / 1_000
-
-print(f"E_th (jährlich bei {hours_per_year} h/a): "
-      f"Ø {E_th_year_MWh:,.1f} MWh ± {ci_E_th_MWh:.1f} MWh "
-      f"(10.–90 %: {p10_E_th_MWh:.1f} – {p90_E_th_MWh:.1f} MWh)")
+# Adaptive Stichprobengröße: z. B. RTOL = 1e-3 → ziehen, bis die 95 %-KIs
+# von Ø und P10/P50/P90 der Leistung enger als 0,1 % sind (n_samples = Obergrenze)
+RTOL = None
+
+# Genauigkeit der Stichproben: np.float32 halbiert den Speicher bei großen Läufen
+# (Mittelwerte/Streuungen werden trotzdem in float64 akkumuliert)
+DTYPE = np.float64
+
+# Sole-Eigenschaften je Ziehung (brine.py): Salinität als Verteilung, z. B.
+# Uniform(0.08, 0.12) (Massenanteil NaCl) → ρ(T, S) und c_p(T, S) statt der
+# festen m_dot (massenstrom.py) / c_p oben. None = feste Werte wie bisher.
+SALINITY = None
+
+# Massenstrom je Ziehung (massenstrom.sample_flow): None = fester Wert aus
+# massenstrom.py, "sampled" = V̇ und ρ gezogen, "depth" = V̇ zusätzlich über die
+# Produktivitätsindex-Kurve an die Tiefe gekoppelt
+FLOW = None
+
+# Dichtebilder aus Bins statt aus Rohdaten: z. B. N_BINNED = 10**9 → (z, ΔT, P_th)
+# chunkweise in ein BinnedHistogram (Speicher nur für die Bins), Bild nach figures/
+N_BINNED = None
+
+#1) z und g ziehen
+def draw_samples(rng, n, dtype=DTYPE):
+    depths    = Uniform(z_min, z_max).sample(rng, n, dtype)
+
+    # Gradienten: Normalverteilung, nur positive Werte zulassen
+    # (bei 0 gestutzt, inverse Verteilungsfunktion statt Nachziehen)
+    gradients = Truncated(Normal(μ_g, σ_g), low=0.0).sample(rng, n, dtype)
+    return depths, gradients
+
+#    P_th je Ziehung; FLOW / SALINITY legen fest, was zusätzlich gezogen wird
+def power_kW(delta_T, depths, flow_rng=None, salinity_rng=None):
+    V, m = V_dot, m_dot
+    if FLOW is not None:
+        flow = sample_flow(delta_T.size, flow_rng, depths if FLOW == "depth" else None)
+        V, m = flow["V_dot"], flow["m_dot"]
+    if SALINITY is None:
+        return m * c_p * delta_T / 1_000                        # kW
+    # Fördertemperatur T_measured + ΔT → ρ, c_p aus den Sole-Tabellen
+    # (ρ aus der Tabelle ersetzt die ρ-Ziehung, V̇ bleibt je Ziehung)
+    salinity = SALINITY.sample(salinity_rng, delta_T.size)
+    return brine_power(delta_T, salinity, V) / 1_000
+
+#    Bins für (z, ΔT, P_th): ΔT über μ_g ± 6 σ_g, P_th mit Spielraum für gezogenes ṁ
+def binned_edges(bins=60):
+    dT_lo = max(μ_g - 6 * σ_g, 0.0) * z_min + b
+    dT_hi = (μ_g + 6 * σ_g) * z_max + b
+    p_lo, p_hi = m_dot * c_p * np.array([dT_lo, dT_hi]) / 1_000
+    if FLOW is not None or SALINITY is not None:
+        p_lo, p_hi = 0.25 * p_lo, 2.5 * p_hi
+    return BinnedHistogram.from_ranges([(z_min, z_max), (dT_lo, dT_hi), (p_lo, p_hi)], bins,
+                                       ["z", "delta_T", "P_th_kW"])
+
+def _bin_chunk(edges, rng, size):
+    depths, gradients = draw_samples(rng, size)
+    delta_T = gradients * depths + b
+    hist = BinnedHistogram(edges, ["z", "delta_T", "P_th_kW"])
+    return hist.update(depths, delta_T, power_kW(delta_T, depths, rng, rng))
+
+def binned_samples(n, seed=seed, *, bins=60, chunk_size=1_000_000, workers=1):
+    """(z, ΔT, P_th)-Häufigkeiten über n Ziehungen, chunkweise und über Prozesse zusammengeführt."""
+    edges = binned_edges(bins).edges
+    return run_chunks(partial(_bin_chunk, edges), n, seed, chunk_size=chunk_size, workers=workers)
+
+if __name__ == "__main__":
+    if RTOL is None:
+        rng = np.random.default_rng(seed)
+        depths, gradients = draw_samples(rng, n_samples)
+    else:
+        res = adaptive_mc(draw_samples,
+                          monitor=lambda s: power_kW(s[1] * s[0] + b, s[0], np.random.default_rng([seed, 2]),
+                                                     np.random.default_rng([seed, 1])),
+                          rtol=RTOL, max_samples=n_samples, seed=seed)
+        (depths, gradients), n_samples = res["samples"], res["n"]
+
+    # 2) ΔT und P_th berechnen
+    delta_T = gradients * depths + b            # K
+    # eigene Ströme für ṁ und Salinität → z, g unverändert (wie im monitor oben,
+    # die überwachte Größe ist also genau das ausgegebene P_th)
+    P_th_kW = power_kW(delta_T, depths, np.random.default_rng([seed, 2]), np.random.default_rng([seed, 1]))
+
+    #3) Statistik
+
+    def stats(a):
+        mean = a.mean(dtype=np.float64)
+        ci95 = 1.96 * a.std(ddof=1, dtype=np.float64) / np.sqrt(len(a))
+        p10, p50, p90 = np.percentile(a, [10, 50, 90])
+        return mean, ci95, p10, p50, p90
+
+    μ_dT, ci_dT, p10_dT, p50_dT, p90_dT = stats(delta_T)
+    μ_P , ci_P , p10_P , p50_P , p90_P  = stats(P_th_kW)
+
+    print(f"{n_samples:,} MC‑Samples  (z ~ U({z_min:.0f}–{z_max:.0f} m), g ~ N)")
+    print(f"ΔT :  Ø {μ_dT:6.2f} K  ±{ci_dT:5.2f} K   "
+          f"(10.–90 %: {p10_dT:.2f}–{p90_dT:.2f} K)")
+    print(f"P  :  Ø {μ_P :7.1f} kW ±{ci_P :6.1f} kW  "
+          f"(10.–90 %: {p10_P :.1f}–{p90_P :.1f} kW)\n")
+
+    #4) Plots
+    ## Hexbin ΔT vs. Tiefe
+    plt.figure(figsize=(8, 5))
+    plt.hexbin(depths, delta_T, gridsize=60, bins="log", cmap="viridis")
+    plt.colorbar(label="log₁₀(N)")
+    plt.xlabel("Tiefe z (m)")
+    plt.ylabel("ΔT (K)")
+    plt.title("ΔT – MC mit z ∈ [1700, 2200] m")
+    plt.tight_layout()
+    plt.show()
+
+    ## Hexbin P_th vs. Tiefe
+    plt.figure(figsize=(8, 5))
+    plt.hexbin(depths, P_th_kW, gridsize=60, bins="log", cmap="plasma")
+    plt.colorbar(label="log₁₀(N)")
+    plt.xlabel("Tiefe z (m)")
+    plt.ylabel("P_th (kW)")
+    plt.title("P_th – abgeleitet aus denselben ΔT‑Samples")
+    plt.tight_layout()
+    plt.show()
+
+    ## Histogramme (in %)
+    weights = np.ones_like(delta_T) / n_samples * 100
+    fig, ax = plt.subplots(1, 2, figsize=(13, 4))
+
+    ax[0].hist(delta_T, bins=60, weights=weights)
+    ax[0].axvline(μ_dT, ls="--")
+    ax[0].fill_betweenx([0, weights.max()], μ_dT - ci_dT, μ_dT + ci_dT, alpha=0.2)
+    ax[0].set_xlabel("ΔT (K)")
+    ax[0].set_ylabel("Häufigkeit (%)")
+    ax[0].set_title("ΔT‑Verteilung")
+
+    ax[1].hist(P_th_kW, bins=60, weights=weights, color="tab:orange")
+    ax[1].axvline(μ_P, ls="--", color="k")
+    ax[1].fill_betweenx([0, weights.max()], μ_P - ci_P, μ_P + ci_P, alpha=0.2, color="tab:orange")
+    ax[1].set_xlabel("P_th (kW)")
+    ax[1].set_ylabel("Häufigkeit (%)")
+    ax[1].set_title("P_th‑Verteilung")
+
+    fig.suptitle("Histogramme (z ∈ [1700, 2200] m, %-Skala)")
+    fig.tight_layout()
+    plt.show()
+
+    #5) Jahresenergie berechnen
+
+    hours_per_year = 8_000
+
+    E_th_year_MWh = μ_P * hours_per_year / 1_000
+    ci_E_th_MWh = ci_P * hours_per_year / 1_000
+    p10_E_th_MWh = p10_P * hours_per_year / 1_000
+    p50_E_th_MWh = p50_P * hours_per_year / 1_000
+    p90_E_th_MWh = p90_P * hours_per_year / 1_000
+
+    print(f"E_th (jährlich bei {hours_per_year} h/a): "
+          f"Ø {E_th_year_MWh:,.1f} MWh ± {ci_E_th_MWh:.1f} MWh "
+          f"(10.–90 %: {p10_E_th_MWh:.1f} – {p90_E_th_MWh:.1f} MWh)")
+
+    #6) Dichtebilder aus Bins (beliebig viele Ziehungen, Speicher O(Bins))
+    if N_BINNED is not None:
+        from render import FigureSpec, Panel, render
+
+        hist = binned_samples(int(N_BINNED))
+        print(f"{hist.n:,.0f} Ziehungen gebinnt, außerhalb der Bins: {hist.outside / hist.n:.2e}")
+        paths = render(FigureSpec("pth_binned", [
+            Panel([hist.hist2d(("z", "delta_T"))], "Tiefe z (m)", "ΔT (K)", "ΔT – aus Bins"),
+            Panel([hist.hist2d(("z", "P_th_kW"), cmap="plasma")], "Tiefe z (m)", "P_th (kW)", "P_th – aus Bins"),
+        ], title=f"n = {hist.n:,.0f}", figsize=(13, 5)), "figures")
+        print("gespeichert:", *paths)
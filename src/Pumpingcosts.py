@@ -4,16 +4,24 @@ from matplotlib.ticker import PercentFormatter
 
 # --- deine bestehenden Imports -------------------
 from Pth        import Pth, c_p, b          # b  = oberflächennahe Start-ΔT [°C]
-from massenstrom import m_dot               # m_dot = Massenstrom [kg/s]
+from massenstrom import m_dot, sample_flow  # m_dot = Massenstrom [kg/s]
 
 # --- Konstanten -----------------------------------
 VLS = 8_000                                 # Volllaststunden [h/a]
 N_SAMPLES = 100_000                         # Anzahl MC-Stichproben
 
+# Massenstrom je Ziehung (massenstrom.sample_flow): None = fester Wert aus
+# massenstrom.py, "sampled" = V̇ und ρ gezogen, "depth" = V̇ zusätzlich über die
+# Produktivitätsindex-Kurve an die Tiefe gekoppelt
+FLOW = None
+
 # Monte-Carlo-Sampler:  Tiefe x  & Gradient g
 x_samples = np.random.uniform(1700, 2200, N_SAMPLES)     # [m]
 g_samples = np.random.uniform(0.028, 0.033, N_SAMPLES)   # [°C/m]
 
+if FLOW is not None:
+    m_dot = sample_flow(N_SAMPLES, None, x_samples if FLOW == "depth" else None)["m_dot"]
+
 # Wärmeleistung (W) über dein Pth-Modul berechnen
 P_W = Pth(x_samples, g_samples, m_dot=m_dot, c_p=c_p, b=b)
 
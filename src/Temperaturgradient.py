@@ -3,6 +3,15 @@ def berechne_ergebnis(x: float, tiefe: float, gradient: float, y: float) -> floa
     return x + (tiefe * gradient) - y
 
 
+def berechne_ergebnis_schichten(x: float, tiefe: float, oberkanten, gradienten, y: float) -> float:
+    """Wie berechne_ergebnis, aber mit eigenem Gradienten je Schicht (Oberkanten in m, erste = 0)."""
+    from layered_gradient import Layer, LayeredGradient
+
+    model = LayeredGradient([Layer(f"Schicht {i + 1}", top, g)
+                             for i, (top, g) in enumerate(zip(oberkanten, gradienten))], b=x - y)
+    return float(model.delta_T(tiefe, gradienten))
+
+
 if __name__ == "__main__":
     x = 10.0          # °C
     tiefe = 1000    # m
@@ -12,3 +21,7 @@ if __name__ == "__main__":
     ergebnis = berechne_ergebnis(x, tiefe, gradient, y)
 
     print(f"Ergebnis : {ergebnis:.3f} °C")
+
+    # Beispiel geschichtet: 0–800 m 0,035 °C/m, darunter 0,028 °C/m
+    ergebnis = berechne_ergebnis_schichten(x, tiefe, [0, 800], [0.035, 0.028], y)
+    print(f"Ergebnis (2 Schichten) : {ergebnis:.3f} °C")
@@ -3,10 +3,11 @@ import matplotlib.pyplot as plt
 from matplotlib.ticker import PercentFormatter
 
 # Pth-Funktion importieren
-from Pth import Pth
 from massenstrom import m_dot
 from Pth import c_p
 from Pth import b
+from sample_cache import SampleCache
+from thermal_surface import thermal_surface
 
 # Parameter
 VLS = 8000                                   # Volllaststunden [h/a]
@@ -19,13 +20,14 @@ def annual_heat_MWh(power_W):
 
 k = m_dot * c_p * VLS / 1_000_000_000               # 1 GWh = 3,6·10^12 J
 
+# Leistung & Jahreswärme für alle (x, g) in einem Broadcast, Gitter wird gecacht
+surface = thermal_surface(x_range, g_vals, (m_dot,), c_p=c_p, b=b, full_load_hours=VLS, cache=SampleCache())
+Q_grid = annual_heat_MWh(surface.p_th[:, :, 0]) / 1000     # (Tiefe, Gradient) → GWh_th
+Q_all = list(Q_grid.T)
+
 #Plot
 plt.figure()
-for g in g_vals:
-    # Punktweise Leistung & Jahreswärme
-    P_W   = Pth(x_range, g, m_dot=m_dot, c_p=c_p, b=b)
-    Q_GWh = annual_heat_MWh(P_W) / 1000            # → GWh_th
-
+for g, Q_GWh in zip(g_vals, Q_all):
     # Geradengleichungs-Parameter
     m = k * g
     n = k * b
@@ -42,13 +44,7 @@ plt.legend(title="Temperaturgradient")
 plt.tight_layout()
 plt.show()
 
-Q_all = []
-for g in g_vals:
-    P_W   = Pth(x_range, g, m_dot=m_dot, c_p=c_p, b=b)
-    Q_GWh = annual_heat_MWh(P_W) / 1_000    # → GWh_th
-    Q_all.append(Q_GWh)
-
-Q_flat = np.concatenate(Q_all)
+Q_flat = Q_grid.T.ravel()
 
 plt.figure(figsize=(6, 4))
 
@@ -0,0 +1,357 @@
+"""
+Benchmark-Suite für die numerischen Kernels in src/.
+
+Läuft ohne Fenster (Agg-Backend), misst je Kernel und Stichprobengröße die
+beste Laufzeit aus `repeat` Wiederholungen, den Durchsatz (Samples/s) und den
+Spitzen-Speicher (tracemalloc, inkl. numpy-Puffer). Ergebnisse werden als JSON
+gespeichert und lassen sich mit --compare gegen einen älteren Lauf vergleichen.
+
+Aufruf:
+    python benchmarks.py                          # alle Kernels, Standardgrößen
+    python benchmarks.py --sizes 1e4 1e6 --only npv
+    python benchmarks.py --out neu.json --compare alt.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+
+__all__ = ["CASES", "register", "run_case", "run_all", "compare"]
+
+SIZES_DEFAULT = (10_000, 100_000, 1_000_000)
+SEED = 42
+
+# Name → (setup(n) -> (fn, items), max_n). items = Anzahl verarbeiteter Samples/Zeilen
+CASES: Dict[str, Tuple[Callable[[int], Tuple[Callable[[], object], int]], int | None]] = {}
+
+
+def register(name: str, max_n: int | None = None):
+    def deco(setup):
+        CASES[name] = (setup, max_n)
+        return setup
+    return deco
+
+
+# ----------------------------- Kernels -----------------------------
+@register("Pth.Pth")
+def _pth(n):
+    from Pth import Pth
+
+    rng = np.random.default_rng(SEED)
+    x = rng.uniform(1700, 2200, n)
+    g = rng.uniform(0.028, 0.033, n)
+    return (lambda: Pth(x, g)), n
+
+
+@register("Drilling_MC.drilling_cost")
+def _drilling(n):
+    from Drilling_MC import drilling_cost
+
+    depths = np.random.default_rng(SEED).uniform(3_900, 4_000, n)
+    return (lambda: drilling_cost(depths)), n
+
+
+@register("Pipeline_MC.pipeline_cost")
+def _pipeline(n):
+    from Pipeline_MC import pipeline_cost
+
+    lengths = np.random.default_rng(SEED).uniform(1_000, 3_000, n)
+    return (lambda: pipeline_cost(lengths)), n
+
+
+@register("thermal_surface.range_mean")
+def _surface_screening(n):
+    from thermal_surface import thermal_surface
+
+    # Standort-Screening: n Tiefenintervalle × Gradient auf einem 10-m-Gitter
+    surface = thermal_surface(np.arange(1_000, 4_001, 10), np.linspace(0.025, 0.035, 21))
+    rng = np.random.default_rng(SEED)
+    z_lo = rng.uniform(1_000, 3_000, n)
+    z_hi = z_lo + rng.uniform(50, 1_000, n)
+    g = rng.uniform(0.025, 0.035, n)
+    return (lambda: surface.range_mean(z_lo, z_hi, g)), n
+
+
+@register("layered_gradient.delta_T", max_n=10_000_000)
+def _layered(n):
+    from layered_gradient import Layer, LayeredGradient
+    from mc_engine import Normal, Uniform
+
+    model = LayeredGradient([Layer("Tertiär", 0, Uniform(0.030, 0.036)),
+                             Layer("Kreide", 800, Normal(0.027, 0.001)),
+                             Layer("Malm", 1_600, Normal(0.031, 0.002))])
+    rng = np.random.default_rng(SEED)
+    g = model.sample_gradients(n, rng)
+    z = rng.uniform(1_000, 2_200, n)
+    return (lambda: model.delta_T(z, g)), n
+
+
+@register("brine.brine_power", max_n=10_000_000)
+def _brine(n):
+    from brine import brine_power, brine_table
+
+    brine_table()                           # Tabelle einmal bauen (im Prozess gecacht)
+    rng = np.random.default_rng(SEED)
+    delta_T = rng.uniform(40, 70, n)
+    salinity = rng.uniform(0.08, 0.12, n)
+    return (lambda: brine_power(delta_T, salinity)), n
+
+
+# 3-D-Häufigkeiten (z, ΔT, P_th) wie Pth_MC.binned_samples: alt np.histogramdd, neu BinnedHistogram
+def _binning_data(n):
+    rng = np.random.default_rng(SEED)
+    z = rng.uniform(1_700, 2_200, n)
+    dT = rng.normal(0.0305, 0.00083, n) * z - 5.0
+    return z, dT, dT * 204.2
+
+
+@register("numpy.histogramdd", max_n=10_000_000)
+def _histogramdd(n):
+    z, dT, p = _binning_data(n)
+    edges = [np.linspace(a.min(), a.max(), 61) for a in (z, dT, p)]
+    return (lambda: np.histogramdd(np.column_stack([z, dT, p]), bins=edges)), n
+
+
+@register("mc_stats.BinnedHistogram.update", max_n=10_000_000)
+def _binned(n):
+    from mc_stats import BinnedHistogram
+
+    z, dT, p = _binning_data(n)
+    edges = [np.linspace(a.min(), a.max(), 61) for a in (z, dT, p)]
+    return (lambda: BinnedHistogram(edges).update(z, dT, p)), n
+
+
+# gestutzte Normalverteilung (Tiefe wie JPD_capex_n.py): alt truncnorm.rvs, neu inverse Verteilungsfunktion
+# Vergleich bei 10⁷:  python benchmarks.py --sizes 1e7 --only trunc
+TRUNC_DEPTH = (1950, 150, 1700, 2200)
+
+
+@register("scipy.truncnorm.rvs", max_n=10_000_000)
+def _truncnorm_rvs(n):
+    from scipy.stats import truncnorm
+
+    mean, std, low, upp = TRUNC_DEPTH
+    a, b = (low - mean) / std, (upp - mean) / std
+    rng = np.random.default_rng(SEED)
+    return (lambda: truncnorm.rvs(a, b, loc=mean, scale=std, size=n, random_state=rng)), n
+
+
+@register("mc_engine.TruncNormal.sample", max_n=10_000_000)
+def _trunc_inverse_cdf(n):
+    from mc_engine import TruncNormal
+
+    dist = TruncNormal(*TRUNC_DEPTH)
+    rng = np.random.default_rng(SEED)
+    return (lambda: dist.sample(rng, n)), n
+
+
+def _npv_setup(n):
+    from mc_engine import sample_block
+    from npv_model import lognormal_scenario
+
+    sc = lognormal_scenario(
+        capex=(9_143_985, 9_845_536, 10_540_442),
+        q=(77.66, 88.76, 100.70),
+        opex=(1_900_863, 2_567_868, 3_302_972),
+        maint_pct=0.02,
+    )
+    block = sample_block(sc.inputs, n, SEED)
+    return sc, block
+
+
+@register("npv_model.npv_matrix")
+def _npv_matrix(n):
+    from npv_model import npv_matrix
+
+    sc, b = _npv_setup(n)
+    return (lambda: npv_matrix(b["capex"], b["q"], b["opex1"], sc)), n
+
+
+@register("npv_model.npv_closed_form")
+def _npv_closed(n):
+    from npv_model import npv_closed_form
+
+    sc, b = _npv_setup(n)
+    return (lambda: npv_closed_form(b["capex"], b["q"], b["opex1"], sc)), n
+
+
+@register("npv_model.simulate_npv_stream", max_n=10_000_000)
+def _npv_stream(n):
+    from npv_model import lognormal_scenario, simulate_npv_stream
+
+    sc = lognormal_scenario(
+        capex=(9_143_985, 9_845_536, 10_540_442),
+        q=(77.66, 88.76, 100.70),
+        opex=(1_900_863, 2_567_868, 3_302_972),
+    )
+    return (lambda: simulate_npv_stream(sc, n)), n
+
+
+@register("npv_model.simulate_scenarios", max_n=1_000_000)
+def _npv_scenarios(n):
+    from npv_model import lognormal_scenario, simulate_scenarios
+
+    # 6 CAPEX-Szenarien × n Ziehungen in einem Durchlauf
+    capex = [(c * 0.95, c, c * 1.05) for c in np.linspace(8e6, 17e6, 6)]
+    scs = [lognormal_scenario(c, q=(77.66, 88.76, 100.70), opex=(1_900_863, 2_567_868, 3_302_972))
+           for c in capex]
+    return (lambda: simulate_scenarios(scs, n)), n * len(scs)
+
+
+@register("drawdown.simulate_npv_drawdown", max_n=1_000_000)
+def _npv_drawdown(n):
+    from drawdown import simulate_npv_drawdown
+    from npv_model import lognormal_scenario
+
+    sc = lognormal_scenario(
+        capex=(9_143_985, 9_845_536, 10_540_442),
+        q=(77.66, 88.76, 100.70),
+        opex=(1_900_863, 2_567_868, 3_302_972),
+    )
+    return (lambda: simulate_npv_drawdown(sc, n)), n
+
+
+@register("not_NPV.lcoh_grid", max_n=1_000_000)
+def _lcoh_grid(n):
+    from not_NPV import lcoh_grid, PUMP_SHARES_DEFAULT
+
+    # Länge 1000…3000 m in 20-m-Schritten (100 Werte) × 11 Pumpanteile; Tiefe skaliert mit n
+    cells_per_depth = 100 * len(PUMP_SHARES_DEFAULT)
+    n_depth = max(1, n // cells_per_depth)
+    depth_range = (1000, 1000 + 20 * n_depth, 20)
+    return (lambda: lcoh_grid(depth_range=depth_range)), n_depth * cells_per_depth
+
+
+@register("Opexcosts_all_table.build_rows", max_n=0)
+def _build_rows(n):
+    from Opexcosts_all_table import build_rows
+
+    rows = len(build_rows())
+    return build_rows, rows
+
+
+@register("JPD_Opex_n.simulate_opex", max_n=100_000)
+def _opex_loop(n):
+    from JPD_Opex_n import simulate_opex
+
+    return (lambda: simulate_opex(n, np.random.default_rng(SEED))), n
+
+
+@register("not_Entscheidungsbaum.build_tree", max_n=0)
+def _decision_tree(n):
+    import pandas as pd
+    import not_Entscheidungsbaum as tree
+    from Opexcosts_all_table import build_rows
+
+    # statt der Excel-Datei: dieselbe Tabelle direkt aus Opexcosts_all_table
+    tree.df = pd.DataFrame(build_rows())
+    leaves = int(np.prod([len(v) for _, v in tree.decisions]))
+    return tree.build_tree, leaves
+
+
+# ----------------------------- Messung -----------------------------
+def run_case(name: str, n: int, repeat: int = 3) -> Dict[str, float]:
+    setup, _ = CASES[name]
+    fn, items = setup(n)
+    fn()                                    # Aufwärmen (Imports, Caches)
+
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(times)
+    return {
+        "kernel": name,
+        "n": items,
+        "seconds": best,
+        "samples_per_s": items / best if best > 0 else float("inf"),
+        "peak_mb": peak / 1e6,
+    }
+
+
+def _git_rev() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=Path(__file__).parent, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_all(sizes=SIZES_DEFAULT, repeat: int = 3, only: List[str] | None = None) -> Dict[str, object]:
+    results = []
+    for name, (_, max_n) in CASES.items():
+        if only and not any(o.lower() in name.lower() for o in only):
+            continue
+        # max_n=0: feste Problemgröße → nur einmal messen
+        case_sizes = sizes[:1] if max_n == 0 else [n for n in sizes if max_n is None or n <= max_n]
+        for n in case_sizes:
+            res = run_case(name, int(n), repeat)
+            results.append(res)
+            print(f"{name:<36} n={res['n']:>11,}  {res['seconds'] * 1e3:10.2f} ms  "
+                  f"{res['samples_per_s']:>14,.0f} /s  {res['peak_mb']:9.1f} MB")
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git": _git_rev(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(new: Dict[str, object], old: Dict[str, object]) -> None:
+    """Druckt Speedup (alt/neu) je Kernel und Größe."""
+    ref = {(r["kernel"], r["n"]): r for r in old["results"]}
+    print(f"\nVergleich mit {old['meta'].get('git')} ({old['meta'].get('timestamp')})")
+    for r in new["results"]:
+        o = ref.get((r["kernel"], r["n"]))
+        if o:
+            print(f"{r['kernel']:<36} n={r['n']:>11,}  Speedup {o['seconds'] / r['seconds']:6.2f}×  "
+                  f"Speicher {r['peak_mb'] - o['peak_mb']:+8.1f} MB")
+
+
+def _cli():
+    ap = argparse.ArgumentParser(description="Benchmarks der Monte-Carlo-Kernels (headless).")
+    ap.add_argument("--sizes", nargs="+", type=float, default=SIZES_DEFAULT, help="Stichprobengrößen")
+    ap.add_argument("--repeat", type=int, default=3, help="Wiederholungen je Messung (Minimum zählt)")
+    ap.add_argument("--only", nargs="+", default=None, help="nur Kernels, deren Name das enthält")
+    ap.add_argument("--out", type=Path, default=None, help="JSON-Ausgabe (Standard: bench_<Zeitstempel>.json)")
+    ap.add_argument("--compare", type=Path, default=None, help="älteres JSON zum Vergleich")
+    args = ap.parse_args()
+
+    report = run_all([int(s) for s in args.sizes], args.repeat, args.only)
+    out = args.out or Path(f"bench_{datetime.now():%Y%m%d_%H%M%S}.json")
+    out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nErgebnisse gespeichert unter: {out.resolve()}")
+
+    if args.compare:
+        compare(report, json.loads(args.compare.read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    _cli()
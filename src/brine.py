@@ -0,0 +1,178 @@
+"""
+Sole-Eigenschaften ρ(T, S) und c_p(T, S) als vorberechnete 2-D-Tabellen.
+
+Statt der festen Werte aus massenstrom.py (ρ = 1063.172 kg/m³) und Pth.py
+(c_p = 3700.59 J/(kg·K)) je Ziehung aus Temperatur T (°C) und Salinität
+S (Massenanteil NaCl):
+
+• ρ: Batzle & Wang (1992), Sole bei Druck p (Standard 20 MPa ≈ 2 km)
+• c_p: reines Wasser (Stützstellen 0–200 °C) · (1 − S + 0,3·S²) – Näherung für
+  NaCl-Lösungen (≈ ±2 % bis S = 0,25)
+• c_p_mean: mittleres c_p zwischen Injektions- und Fördertemperatur
+  (Enthalpiedifferenz / ΔT) → P_th = ṁ · c_p_mean · ΔT ist energetisch exakt
+
+Die Tabellen liegen auf äquidistanten Gittern; der Zellindex ist daher eine
+Division statt searchsorted, und ρ und c_p_mean teilen sich Index und Gewichte
+(eine Interpolation für beide Größen).
+
+    table = brine_table()
+    rho, cp = table.lookup(T_prod, salinity)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import numpy as np
+
+from sample_cache import SampleCache, cache_key
+
+__all__ = [
+    "density_batzle_wang",
+    "cp_brine",
+    "BrineTable",
+    "brine_table",
+    "mass_flow",
+    "brine_power",
+]
+
+T_INJ = 15.0            # °C Injektionstemperatur (T_measured in Pth_MC.py)
+
+
+def density_batzle_wang(T, S, p_mpa: float = 20.0) -> np.ndarray:
+    """Soledichte (kg/m³) nach Batzle & Wang (1992); T in °C, S Massenanteil NaCl, p in MPa."""
+    T, S, P = np.asarray(T, dtype=float), np.asarray(S, dtype=float), p_mpa
+    rho_w = 1 + 1e-6 * (-80 * T - 3.3 * T**2 + 0.00175 * T**3 + 489 * P - 2 * T * P
+                        + 0.016 * T**2 * P - 1.3e-5 * T**3 * P - 0.333 * P**2 - 0.002 * T * P**2)
+    rho_b = rho_w + S * (0.668 + 0.44 * S + 1e-6 * (300 * P - 2400 * P * S
+                                                   + T * (80 + 3 * T - 3300 * S - 13 * P + 47 * P * S)))
+    return rho_b * 1_000.0
+
+
+# c_p von reinem Wasser bei Sättigungsdruck (J/(kg·K)), Stützstellen 0–200 °C
+_CP_WATER_T = np.array([0.01, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100, 110, 120, 140, 160, 180, 200])
+_CP_WATER = np.array([4219.9, 4195.5, 4184.4, 4180.1, 4179.6, 4181.5, 4185.1, 4190.2, 4196.9,
+                      4205.3, 4215.7, 4228.3, 4243.5, 4282.6, 4335.4, 4405.0, 4495.8])
+
+
+def cp_brine(T, S) -> np.ndarray:
+    """Spezifische Wärmekapazität (J/(kg·K)): Wasser (Stützstellen) · NaCl-Korrektur (Näherung)."""
+    T, S = np.asarray(T, dtype=float), np.asarray(S, dtype=float)
+    return np.interp(T, _CP_WATER_T, _CP_WATER) * (1.0 - S + 0.3 * S**2)
+
+
+@dataclass
+class BrineTable:
+    t_grid: np.ndarray          # (nT,) °C, äquidistant
+    s_grid: np.ndarray          # (nS,) Massenanteil, äquidistant
+    rho: np.ndarray             # (nT, nS) kg/m³
+    c_p: np.ndarray             # (nT, nS) J/(kg·K)
+    c_p_mean: np.ndarray        # (nT, nS) mittleres c_p zwischen t_inj und T
+    t_inj: float = T_INJ
+
+    def _weights(self, T, S):
+        # äquidistant → Zellindex per Division; k = flacher Index der linken unteren Ecke
+        T, S = np.asarray(T, dtype=float), np.asarray(S, dtype=float)
+        for x, grid, name in ((T, self.t_grid, "Temperatur"), (S, self.s_grid, "Salinität")):
+            if x.size and (x.min() < grid[0] or x.max() > grid[-1]):
+                raise ValueError(f"{name} außerhalb der Tabelle [{grid[0]}, {grid[-1]}]")
+        ft = (T - self.t_grid[0]) * (1.0 / (self.t_grid[1] - self.t_grid[0]))
+        fs = (S - self.s_grid[0]) * (1.0 / (self.s_grid[1] - self.s_grid[0]))
+        i = np.minimum(ft.astype(np.intp), self.t_grid.size - 2)
+        j = np.minimum(fs.astype(np.intp), self.s_grid.size - 2)
+        return i * self.s_grid.size + j, ft - i, fs - j
+
+    def _bilinear(self, table: np.ndarray, k, wt, ws) -> np.ndarray:
+        # in place, um bei 10⁷ Punkten Zwischen-Arrays zu sparen
+        flat, n_s = table.ravel(), table.shape[1]
+        lo = flat.take(k)
+        lo += ws * (flat.take(k + 1) - lo)
+        k_hi = k + n_s
+        hi = flat.take(k_hi)
+        k_hi += 1
+        hi += ws * (flat.take(k_hi) - hi)
+        hi -= lo
+        hi *= wt
+        lo += hi
+        return lo
+
+    def lookup(self, T, S, mean_cp: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """(ρ, c_p) je Punkt; mean_cp=True → c_p gemittelt über [t_inj, T] (für P_th)."""
+        w = self._weights(T, S)
+        cp = self.c_p_mean if mean_cp else self.c_p
+        return self._bilinear(self.rho, *w), self._bilinear(cp, *w)
+
+    def density(self, T, S) -> np.ndarray:
+        return self._bilinear(self.rho, *self._weights(T, S))
+
+    def heat_capacity(self, T, S) -> np.ndarray:
+        return self._bilinear(self.c_p, *self._weights(T, S))
+
+
+def _build(t_grid: np.ndarray, s_grid: np.ndarray, p_mpa: float, t_inj: float) -> Dict[str, np.ndarray]:
+    T, S = np.meshgrid(t_grid, s_grid, indexing="ij")
+    rho = density_batzle_wang(T, S, p_mpa)
+    c_p = cp_brine(T, S)
+    # Enthalpie H(T) = ∫ c_p dT auf einem feinen Gitter (Trapez), dann (H(T) − H(t_inj)) / (T − t_inj)
+    fine = np.linspace(t_grid[0], t_grid[-1], 8 * (t_grid.size - 1) + 1)
+    cp_fine = cp_brine(fine[:, None], s_grid[None, :])
+    H = np.concatenate([np.zeros((1, s_grid.size)),
+                        np.cumsum(np.diff(fine)[:, None] * (cp_fine[1:] + cp_fine[:-1]) / 2, axis=0)])
+    H_T = np.stack([np.interp(t_grid, fine, H[:, k]) for k in range(s_grid.size)], axis=1)
+    H_inj = np.array([np.interp(t_inj, fine, H[:, k]) for k in range(s_grid.size)])
+    dT = T - t_inj
+    near = np.abs(dT) < 1e-9
+    c_p_mean = np.where(near, cp_brine(t_inj, S), (H_T - H_inj) / np.where(near, 1.0, dT))
+    return {"rho": rho, "c_p": c_p, "c_p_mean": c_p_mean}
+
+
+def brine_table(
+    t_range: Tuple[float, float] = (0.0, 200.0),
+    s_range: Tuple[float, float] = (0.0, 0.30),
+    n_t: int = 401,
+    n_s: int = 121,
+    *,
+    p_mpa: float = 20.0,
+    t_inj: float = T_INJ,
+    cache: SampleCache | None = None,
+) -> BrineTable:
+    """Tabellen auf äquidistantem (T, S)-Gitter; im Prozess und optional im SampleCache gecacht."""
+    t_grid, s_grid = np.linspace(*t_range, n_t), np.linspace(*s_range, n_s)
+    if cache is None:
+        arrays = _cached_build(tuple(t_range), tuple(s_range), n_t, n_s, p_mpa, t_inj)
+    else:
+        key = cache_key("brine_table", t_range, s_range, n_t, n_s, p_mpa, t_inj)
+        arrays = cache.get_stats(key)
+        if arrays is None:
+            arrays = _build(t_grid, s_grid, p_mpa, t_inj)
+            cache.put_stats(key, arrays)
+    return BrineTable(t_grid, s_grid, arrays["rho"], arrays["c_p"], arrays["c_p_mean"], t_inj)
+
+
+@lru_cache(maxsize=8)
+def _cached_build(t_range, s_range, n_t, n_s, p_mpa, t_inj) -> Dict[str, np.ndarray]:
+    return _build(np.linspace(*t_range, n_t), np.linspace(*s_range, n_s), p_mpa, t_inj)
+
+
+def mass_flow(T, salinity, V_dot: float | None = None, table: BrineTable | None = None) -> np.ndarray:
+    """ṁ = V̇ · ρ(T, S) je Ziehung (kg/s), wie massenstrom.py mit tabelliertem ρ."""
+    if V_dot is None:
+        from massenstrom import V_dot
+    table = brine_table() if table is None else table
+    return V_dot * table.density(T, salinity)
+
+
+def brine_power(delta_T, salinity, V_dot: float | None = None, table: BrineTable | None = None) -> np.ndarray:
+    """
+    P_th (W) je Ziehung mit ρ und c_p aus der Tabelle: ṁ = V̇ · ρ(T_P, S),
+    P = ṁ · c_p_mean(T_P, S) · ΔT mit Fördertemperatur T_P = t_inj + ΔT
+    (entspricht Pth.Pth mit m_dot und c_p als Arrays).
+    """
+    if V_dot is None:
+        from massenstrom import V_dot
+    table = brine_table() if table is None else table
+    delta_T = np.asarray(delta_T, dtype=float)
+    rho, cp = table.lookup(table.t_inj + delta_T, salinity)
+    return V_dot * rho * cp * delta_T
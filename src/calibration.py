@@ -0,0 +1,299 @@
+"""
+Kalibrierung von Bohrkosten-Tiefen-Kurven aus Tabellendaten.
+
+Statt der festen Koeffizienten in Drilling_MC.drilling_cost wird eine Kurve
+K(z) (Kosten je Bohrung) an eine Kostentabelle angepasst:
+
+• "poly"       K = Σ β_j · t^j                       (Grad 1 … 3)
+• "piecewise"  K stetig stückweise linear, Knicke bei `knots` (m)
+• "loglinear"  ln K = β₀ + β₁ · t                     (exponentiell mit der Tiefe)
+
+mit der skalierten Tiefe t = (z − z₀) / s (gut konditioniert). Alle drei sind
+lineare kleinste Quadrate in einer Basis-Matrix; die Parameterunsicherheit
+wird als Stichprobe von Koeffizienten gespeichert:
+
+• method="bootstrap": Zeilen-Bootstrap über Multinomial-Gewichte, alle
+  Wiederholungen in einem gestapelten Solve der Normalgleichungen
+• method="posterior": flache Priori, normale Residuen → β | Daten ist
+  multivariat t mit n − p Freiheitsgraden (geschlossen, ohne MCMC)
+
+CalibratedCurve.sample(z, rng) zieht je Tiefe eine Koeffizienten-Zeile
+(Tiefe und Kurve gemeinsam unsicher) und wertet alles in einem einsum aus.
+Angepasste Modelle liegen im SampleCache (Schlüssel = Tabelleninhalt +
+Modell + Seed) → wiederholte Läufe laden statt neu anzupassen.
+Außerhalb der Tiefen der Daten (depth_range) wird nicht stillschweigend
+extrapoliert: ValueError, außer curve.extrapolate = True.
+
+    curve = calibrate("bohrungen.csv", depth_col="Tiefe (m)", degree=2, cache=SampleCache())
+    cost = 2 * curve.sample(depths, rng)                     # zwei Bohrungen
+
+Die mitgelieferte capex_opex_tabelle.xlsx hat keine Tiefenspalte: dort werden
+die Bohrkosten-Perzentile P10/P50/P90 den Perzentilen der Tiefenverteilung
+(z ~ U(1 700, 2 200) m) zugeordnet (percentile_points) – drei Punkte, für eine
+Gerade ausreichend (Standard: Grad 1), für mehr Parameter braucht es echte Bohrungsdaten.
+
+Aufruf:  python calibration.py capex_opex_tabelle.xlsx --model poly --degree 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+from numpy.polynomial import Polynomial
+
+from mc_engine import Uniform
+from sample_cache import SampleCache, cache_key
+
+__all__ = [
+    "MODELS",
+    "CalibratedCurve",
+    "fit_cost_curve",
+    "percentile_points",
+    "load_cost_table",
+    "calibrate",
+]
+
+MODELS = ("poly", "piecewise", "loglinear")
+# geht in den Cache-Schlüssel ein; 2 = Anpassungen ohne Freiheitsgrad werden abgelehnt
+FIT_VERSION = 2
+
+# Tiefenverteilung, aus der die Tabellen-Perzentile stammen (wie heatproduktion_MC.py)
+DEPTH_DIST = Uniform(1_700.0, 2_200.0)
+
+
+def _design(model: str, t: np.ndarray, degree: int, knots_t: np.ndarray) -> np.ndarray:
+    if model == "poly":
+        return np.vander(t, degree + 1, increasing=True)
+    if model == "piecewise":
+        return np.column_stack([np.ones_like(t), t, np.maximum(t[:, None] - knots_t, 0.0)])
+    if model == "loglinear":
+        return np.column_stack([np.ones_like(t), t])
+    raise KeyError(f"Unbekanntes Modell '{model}', verfügbar: {', '.join(MODELS)}")
+
+
+@dataclass
+class CalibratedCurve:
+    model: str
+    coef: np.ndarray            # (p,) Punktschätzer in der skalierten Basis
+    draws: np.ndarray           # (B, p) Koeffizienten-Stichprobe (Bootstrap bzw. Posterior)
+    z0: float                   # t = (z − z0) / scale
+    scale: float
+    sigma: float                # Residuen-Streuung (bei loglinear auf der ln-Skala)
+    depth_range: Tuple[float, float]
+    degree: int = 2
+    knots: Tuple[float, ...] = ()
+    method: str = "bootstrap"
+    extrapolate: bool = False   # Tiefen außerhalb depth_range zulassen (sonst ValueError)
+
+    def _basis(self, z) -> np.ndarray:
+        z = np.atleast_1d(np.asarray(z, dtype=float))
+        lo, hi = self.depth_range
+        if not self.extrapolate and z.size and (z.min() < lo or z.max() > hi):
+            raise ValueError(f"Tiefen {z.min():,.0f}–{z.max():,.0f} m außerhalb der Kalibrierdaten "
+                             f"[{lo:,.0f}, {hi:,.0f}] m – extrapolate=True, wenn gewollt")
+        t = (z - self.z0) / self.scale
+        return _design(self.model, t, self.degree, (np.asarray(self.knots) - self.z0) / self.scale)
+
+    def _out(self, y: np.ndarray) -> np.ndarray:
+        return np.exp(y) if self.model == "loglinear" else y
+
+    def __call__(self, z) -> np.ndarray:
+        """Kosten je Bohrung (€) mit dem Punktschätzer."""
+        return self._out(self._basis(z) @ self.coef)
+
+    def sample(self, z, rng: np.random.Generator | int | None = None, noise: bool = False) -> np.ndarray:
+        """
+        Kosten je Tiefe mit je einer gezogenen Koeffizienten-Zeile; noise=True
+        addiert zusätzlich die Residuen-Streuung (Vorhersage- statt Kurvenunsicherheit).
+        """
+        rng = rng if isinstance(rng, np.random.Generator) else np.random.default_rng(rng)
+        X = self._basis(z)
+        rows = self.draws[rng.integers(self.draws.shape[0], size=X.shape[0])]
+        y = np.einsum("np,np->n", X, rows)
+        if noise:
+            y += rng.normal(0.0, self.sigma, y.size)
+        return self._out(y)
+
+    def interval(self, z, q: Sequence[float] = (5, 95)) -> np.ndarray:
+        """Perzentile der Kurve je Tiefe über alle Koeffizienten-Ziehungen, (len(q), len(z))."""
+        return np.percentile(self._out(self._basis(z) @ self.draws.T), q, axis=1)
+
+    def poly_coeffs(self) -> np.ndarray:
+        """Koeffizienten in z (aufsteigend, €/m^j) – vergleichbar mit drilling_cost; nur model="poly"."""
+        if self.model != "poly":
+            raise ValueError("Koeffizienten in z gibt es nur für model='poly'")
+        return Polynomial(self.coef)(Polynomial([-self.z0 / self.scale, 1.0 / self.scale])).coef
+
+    def poly_curve(self, factor: float = 1.0):
+        """cost_analytic.PolyCurve (factor = Anzahl Bohrungen) für die exakte Verteilung."""
+        from cost_analytic import PolyCurve
+
+        return PolyCurve(tuple(float(c) for c in factor * self.poly_coeffs()))
+
+    # ---------- Cache ----------
+    def state(self) -> Dict[str, np.ndarray]:
+        return {
+            "model": np.array(self.model), "method": np.array(self.method),
+            "coef": self.coef, "draws": self.draws,
+            "z": np.array([self.z0, self.scale, self.sigma, *self.depth_range, self.degree]),
+            "knots": np.array(self.knots, dtype=float),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, np.ndarray]) -> "CalibratedCurve":
+        z0, scale, sigma, lo, hi, degree = (float(v) for v in state["z"])
+        return cls(str(state["model"]), np.array(state["coef"]), np.array(state["draws"]), z0, scale, sigma,
+                   (lo, hi), int(degree), tuple(np.asarray(state["knots"]).tolist()), str(state["method"]))
+
+
+def fit_cost_curve(
+    depth: Sequence[float],
+    cost: Sequence[float],
+    model: str = "poly",
+    *,
+    degree: int = 1,
+    knots: Sequence[float] = (),
+    method: str = "bootstrap",
+    n_draws: int = 2_000,
+    seed: int = 42,
+) -> CalibratedCurve:
+    """Kleinste-Quadrate-Anpassung plus Koeffizienten-Stichprobe (bootstrap | posterior)."""
+    z = np.asarray(depth, dtype=float)
+    y = np.asarray(cost, dtype=float)
+    if model == "poly" and not 1 <= degree <= 3:
+        raise ValueError("Polynomgrad 1 … 3")
+    if model == "loglinear":
+        y = np.log(y)
+    z0 = float(z.mean())
+    scale = float(max(np.ptp(z) / 2, 1.0))
+    knots_t = (np.asarray(knots, dtype=float) - z0) / scale
+    X = _design(model, (z - z0) / scale, degree, knots_t)
+    n, p = X.shape
+    if np.unique(z).size < p:
+        raise ValueError(f"{np.unique(z).size} verschiedene Tiefen für {p} Parameter – zu wenige Punkte")
+
+    coef = np.linalg.lstsq(X, y, rcond=None)[0]
+    resid = y - X @ coef
+    dof = n - p
+    if dof <= 0:
+        # exakte Interpolation: σ = 0, jede Wiederholung trifft coef → keine Unsicherheit messbar
+        raise ValueError(f"{n} Punkte für {p} Parameter – die Koeffizienten-Unsicherheit braucht n − p > 0")
+    sigma = float(np.sqrt(resid @ resid / dof))
+    rng = np.random.default_rng(seed)
+
+    if method == "bootstrap":
+        # Multinomial-Gewichte je Wiederholung → gewichtete Normalgleichungen, ein gestapelter Solve
+        w = rng.multinomial(n, np.full(n, 1.0 / n), size=n_draws).astype(float)
+        XtX = np.einsum("bn,ni,nj->bij", w, X, X)
+        Xty = np.einsum("bn,ni,n->bi", w, X, y)
+        # Wiederholungen mit zu wenigen verschiedenen Punkten sind singulär → verwerfen
+        ok = np.linalg.cond(XtX) < 1e12
+        if not ok.any():
+            raise ValueError("Alle Bootstrap-Stichproben singulär – zu wenige Punkte für das Modell")
+        draws = np.linalg.solve(XtX[ok], Xty[ok][..., None])[..., 0]
+    elif method == "posterior":
+        # β | y ~ t_dof(β̂, s² (XᵀX)⁻¹): Normal-Ziehung skaliert mit √(dof / χ²_dof)
+        L = np.linalg.cholesky(sigma**2 * np.linalg.inv(X.T @ X))
+        g = rng.standard_normal((n_draws, p)) @ L.T
+        draws = coef + g * np.sqrt(dof / rng.chisquare(dof, n_draws))[:, None]
+    else:
+        raise ValueError(f"Unbekannte Methode '{method}' (bootstrap | posterior)")
+
+    return CalibratedCurve(model, coef, draws, z0, scale, sigma, (float(z.min()), float(z.max())),
+                           degree, tuple(float(k) for k in knots), method)
+
+
+def percentile_points(table, pct_col: str = "Bohr-Pct", cost_col: str = "Bohrkosten €",
+                      depth_dist=DEPTH_DIST) -> Tuple[np.ndarray, np.ndarray]:
+    """(Tiefe, Kosten) aus einer Tabelle mit Perzentil-Spalte ("P10" …) statt Tiefen."""
+    rows = table[[pct_col, cost_col]].drop_duplicates()
+    p = rows[pct_col].str.lstrip("Pp").astype(float).to_numpy() / 100.0
+    return depth_dist.ppf(p), rows[cost_col].to_numpy(dtype=float)
+
+
+def _read_table(path: Path, sheet_name=0):
+    import pandas as pd
+
+    if path.suffix.lower() in (".csv", ".txt"):
+        return pd.read_csv(path)
+    return pd.read_excel(path, sheet_name=sheet_name)
+
+
+def load_cost_table(
+    path: str | Path,
+    depth_col: str | None = None,
+    cost_col: str = "Bohrkosten €",
+    *,
+    pct_col: str = "Bohr-Pct",
+    sheet_name=0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(Tiefe, Kosten) aus CSV/Excel; ohne depth_col über percentile_points."""
+    table = _read_table(Path(path), sheet_name)
+    if depth_col is None:
+        if pct_col not in table.columns:
+            raise KeyError(f"Weder Tiefenspalte noch Perzentil-Spalte '{pct_col}' in {path}")
+        return percentile_points(table, pct_col, cost_col)
+    return table[depth_col].to_numpy(dtype=float), table[cost_col].to_numpy(dtype=float)
+
+
+def calibrate(
+    path: str | Path,
+    depth_col: str | None = None,
+    cost_col: str = "Bohrkosten €",
+    *,
+    model: str = "poly",
+    degree: int = 1,
+    knots: Sequence[float] = (),
+    method: str = "bootstrap",
+    n_draws: int = 2_000,
+    seed: int = 42,
+    cache: SampleCache | None = None,
+) -> CalibratedCurve:
+    """Tabelle laden und anpassen; mit cache nur beim ersten Lauf (bzw. nach Änderung der Tabelle)."""
+    path = Path(path)
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+    key = cache_key("calibration", FIT_VERSION, digest, depth_col, cost_col, model, degree, list(knots), method, n_draws, seed)
+    hit = cache.get_stats(key) if cache is not None else None
+    if hit is not None:
+        return CalibratedCurve.from_state(hit)
+    z, y = load_cost_table(path, depth_col, cost_col)
+    curve = fit_cost_curve(z, y, model, degree=degree, knots=knots, method=method, n_draws=n_draws, seed=seed)
+    if cache is not None:
+        cache.put_stats(key, curve.state())
+    return curve
+
+
+def _cli():
+    ap = argparse.ArgumentParser(description="Bohrkosten-Tiefen-Kurve aus einer Tabelle anpassen.")
+    ap.add_argument("table", help="CSV oder Excel mit Tiefe und Kosten je Bohrung")
+    ap.add_argument("--depth-col", default=None, help="Tiefenspalte (fehlt → Perzentil-Zuordnung)")
+    ap.add_argument("--cost-col", default="Bohrkosten €")
+    ap.add_argument("--model", default="poly", choices=MODELS)
+    ap.add_argument("--degree", type=int, default=1)
+    ap.add_argument("--knots", type=float, nargs="*", default=[])
+    ap.add_argument("--method", default="bootstrap", choices=["bootstrap", "posterior"])
+    ap.add_argument("--draws", type=int, default=2_000)
+    args = ap.parse_args()
+
+    from Drilling_MC import drilling_cost
+
+    curve = calibrate(args.table, args.depth_col, args.cost_col, model=args.model, degree=args.degree,
+                      knots=args.knots, method=args.method, n_draws=args.draws, cache=SampleCache())
+    print(f"Modell {curve.model} ({curve.method}, {curve.draws.shape[0]:,} Koeffizienten-Ziehungen), "
+          f"Daten {curve.depth_range[0]:,.0f}–{curve.depth_range[1]:,.0f} m, σ = {curve.sigma:,.4g}")
+    if curve.model == "poly":
+        print("Koeffizienten in z (aufsteigend):", np.array2string(curve.poly_coeffs(), precision=6))
+    z = np.linspace(*curve.depth_range, 5)
+    lo, hi = curve.interval(z)
+    print(f"{'Tiefe (m)':>10} {'Kurve (€)':>14} {'5 %':>14} {'95 %':>14} {'drilling_cost/2':>16}")
+    for row in zip(z, curve(z), lo, hi, drilling_cost(z) / 2):
+        print(f"{row[0]:10,.0f} " + " ".join(f"{v:14,.0f}" for v in row[1:4]) + f" {row[4]:16,.0f}")
+
+
+if __name__ == "__main__":
+    _cli()
@@ -0,0 +1,181 @@
+"""
+Thermischer Durchbruch einer Dublette: Förder-Temperatur und Jahreswärme über die Laufzeit.
+
+Modell (Gringarten & Sauty 1975, homogener Aquifer, Kolbenfront der Kälte,
+ohne Wärmenachlieferung aus Deck-/Sohlschicht → eher konservativ):
+
+    t₀ = π · (ρc)_A · h · D² / ((ρc)_W · Q)          charakteristische Zeit
+    t_b = t₀ / 3                                     erster Durchbruch
+
+Die Stromlinie, die den Injektor unter dem Winkel θ zur Verbindungslinie
+verlässt, braucht τ(θ) · t₀ mit τ(θ) = (1 − θ·cot θ) / sin²θ (τ(0) = 1/3).
+Der Volumenstrom verteilt sich gleichmäßig auf θ ∈ (−π, π), daher ist der
+kalte Anteil am Förderstrom θ*(t)/π mit τ(θ*) = t/t₀ und
+
+    (T_P − T_inj) / (T_R − T_inj) = r(t/t₀) = 1 − θ*(t/t₀) / π
+
+r und seine Stammfunktion werden einmal als Tabelle über x = t/t₀
+vorberechnet; Jahresmittel je Ziehung und Jahr sind dann zwei np.interp auf
+einem (Ziehungen, Jahre)-Gitter, ohne Schleife über Ziehungen oder Jahre.
+
+    q_years = heat_series(q0, t0_years, years=30)    # (n, 30) GWh_th/a → npv_matrix
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Mapping
+
+import numpy as np
+
+from massenstrom import V_dot, rho
+from mc_engine import Uniform, sample_block
+from mc_parallel import chunk_sizes
+from npv_model import NPVScenario, npv_matrix
+from Pth import c_p
+from sample_cache import SampleCache, cached_sample_block
+
+__all__ = [
+    "SECONDS_PER_YEAR",
+    "DOUBLET_INPUTS",
+    "characteristic_time_years",
+    "temperature_ratio",
+    "annual_ratio",
+    "heat_series",
+    "sample_doublet",
+    "simulate_npv_drawdown",
+]
+
+SECONDS_PER_YEAR = 365.25 * 24 * 3_600
+RHO_C_WATER = rho * c_p                     # J/(m³·K) Förderfluid wie massenstrom.py / Pth.py
+
+# Dubletten-Parameter (Annahmen für das Malm-Reservoir, bei Bedarf anpassen)
+DOUBLET_INPUTS = {
+    "spacing_m": Uniform(1_000.0, 2_000.0),          # Abstand der Bohrungen im Reservoir D
+    "thickness_m": Uniform(30.0, 80.0),              # produktive Mächtigkeit h
+    "rho_c_aquifer": Uniform(2.3e6, 2.7e6),          # (ρc)_A gesättigtes Gestein J/(m³·K)
+}
+
+
+# ----------------------------- Tabelle r(x) -----------------------------
+def _ratio_table(n: int = 4_096) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # θ dicht bei π (dort wächst τ gegen ∞, der Abfall wird langsam)
+    s = np.linspace(0.0, 1.0, n)[1:-1]
+    theta = np.pi * (1.0 - (1.0 - s) ** 3)
+    theta = theta[theta > 1e-3]
+    tau = (np.sin(theta) - theta * np.cos(theta)) / np.sin(theta) ** 3
+    x = np.concatenate([[0.0, 1.0 / 3.0], tau])
+    r = np.concatenate([[1.0, 1.0], 1.0 - theta / np.pi])
+    # Stammfunktion R(x) = ∫₀ˣ r dx (Trapez auf dem dichten Gitter)
+    cum = np.concatenate([[0.0], np.cumsum(np.diff(x) * (r[1:] + r[:-1]) / 2)])
+    return x, r, cum
+
+
+_X, _R, _CUM = _ratio_table()
+
+
+def characteristic_time_years(
+    spacing_m, thickness_m, rho_c_aquifer, flow_m3s: float = V_dot, rho_c_water: float = RHO_C_WATER
+) -> np.ndarray:
+    """t₀ in Jahren; der erste Durchbruch liegt bei t₀ / 3."""
+    t0 = np.pi * rho_c_aquifer * thickness_m * np.square(spacing_m) / (rho_c_water * flow_m3s)
+    return t0 / SECONDS_PER_YEAR
+
+
+def temperature_ratio(x) -> np.ndarray:
+    """r(x) = (T_P − T_inj) / (T_R − T_inj) bei x = t / t₀ (1 bis zum Durchbruch bei x = 1/3)."""
+    return np.interp(x, _X, _R, right=_R[-1])
+
+
+def _cumulative(x) -> np.ndarray:
+    # jenseits der Tabelle ist r ≈ 0 → Stammfunktion konstant
+    return np.interp(x, _X, _CUM, right=_CUM[-1])
+
+
+def annual_ratio(t0_years, years: int = 30) -> np.ndarray:
+    """
+    Jahresmittel von r für die Jahre 1 … years, (n, years) für t0_years der Länge n:
+    (R(y / t₀) − R((y−1) / t₀)) · t₀ / 1 a.
+    """
+    t0 = np.asarray(t0_years, dtype=float)[..., None]
+    edges = np.arange(years + 1, dtype=float) / t0           # (n, years + 1) Jahresgrenzen in x
+    return np.diff(_cumulative(edges), axis=-1) * t0
+
+
+def heat_series(q0, t0_years, years: int = 30) -> np.ndarray:
+    """
+    Jahreswärme je Ziehung und Jahr (n, years): q0 = Wärme bei Anfangstemperatur
+    (z. B. GWh_th/a aus Pth · VLS), skaliert mit dem Jahresmittel von r.
+    Direkt als q in npv_matrix verwendbar.
+    """
+    return np.asarray(q0, dtype=float)[:, None] * annual_ratio(t0_years, years)
+
+
+def sample_doublet(
+    n: int,
+    rng: np.random.Generator | int | None = None,
+    inputs: Mapping[str, object] = DOUBLET_INPUTS,
+    sampler: str = "pseudo",
+) -> Dict[str, np.ndarray]:
+    """Zieht die Dubletten-Parameter und ergänzt t0_years."""
+    block = sample_block(inputs, n, rng, sampler)
+    block["t0_years"] = characteristic_time_years(block["spacing_m"], block["thickness_m"], block["rho_c_aquifer"])
+    return block
+
+
+def simulate_npv_drawdown(
+    scenario: NPVScenario,
+    n_sim: int | None = None,
+    seed: int | None = None,
+    *,
+    doublet: Mapping[str, object] = DOUBLET_INPUTS,
+    chunk_size: int = 100_000,
+    cache: SampleCache | None = None,
+) -> tuple[Dict[str, np.ndarray], np.ndarray]:
+    """
+    Wie npv_model.simulate_npv, aber mit abnehmender Jahreswärme: q aus dem
+    Szenario ist die Wärme im ersten Jahr ohne Abkühlung, die Jahresreihe folgt
+    dem Durchbruchsmodell. Die (Ziehungen, Jahre)-Matrizen werden nur chunkweise
+    gebildet (Speicher ∝ chunk_size · years).
+
+    Die Szenario-Ziehungen sind identisch mit simulate_npv (gleicher Seed); die
+    Dubletten-Parameter kommen aus einem eigenen Kindstrom → direkter Vergleich
+    mit/ohne Abkühlung bei gemeinsamen Zufallszahlen.
+    """
+    n = scenario.n_sim if n_sim is None else n_sim
+    seed = scenario.seed if seed is None else seed
+    block = dict(cached_sample_block(scenario.inputs, n, seed, scenario.sampler, cache, scenario.dtype))
+    child = np.random.SeedSequence(seed).spawn(1)[0]
+    block.update(sample_doublet(n, np.random.default_rng(child), doublet, scenario.sampler))
+
+    npv = np.empty(n)
+    start = 0
+    for size in chunk_sizes(n, chunk_size):
+        s = slice(start, start + size)
+        q_years = heat_series(block["q"][s], block["t0_years"][s], scenario.years)
+        npv[s] = npv_matrix(block["capex"][s], q_years, block["opex1"][s], scenario)
+        start += size
+    return block, npv
+
+
+if __name__ == "__main__":
+    from npv_model import lognormal_scenario, simulate_npv
+
+    # Standardfall aus NPV Bohrkosten_alle Ps_richtig.py
+    scenario = lognormal_scenario(
+        capex=(9_143_985, 9_845_536, 10_540_442),
+        q=(77.66, 88.76, 100.70),
+        opex=(1_900_863, 2_567_868, 3_302_972),
+        maint_pct=0.02,
+        n_sim=100_000,
+    )
+    block, npv_dd = simulate_npv_drawdown(scenario)
+    _, npv_const = simulate_npv(scenario)
+
+    t_b = block["t0_years"] / 3
+    ratio = annual_ratio(block["t0_years"], scenario.years)
+    print(f"Durchbruch t_b   P10/P50/P90: {np.percentile(t_b, [10, 50, 90]).round(1)} a "
+          f"(vor Jahr {scenario.years}: {np.mean(t_b < scenario.years):.1%})")
+    print(f"Wärme Jahr {scenario.years} / Jahr 1 (Mittel): {ratio[:, -1].mean():.3f}")
+    for name, v in (("konstant", npv_const), ("mit Abkühlung", npv_dd)):
+        p10, p50, p90 = np.percentile(v / 1e6, [10, 50, 90])
+        print(f"NPV {name:<14} P10 {p10:7.2f}  P50 {p50:7.2f}  P90 {p90:7.2f} Mio €  P(NPV<0) = {np.mean(v < 0):.3f}")
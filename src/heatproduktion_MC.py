@@ -3,15 +3,28 @@ import matplotlib.pyplot as plt
 from matplotlib.ticker import PercentFormatter
 
 from Pth        import Pth, c_p, b
-from massenstrom import m_dot
+from massenstrom import m_dot, sample_flow
 
 #Konstanten
 VLS = 8_000 # Volllaststunden [h/a]
 N_SAMPLES = 100_000
+RNG_SEED = 42
+
+# Massenstrom je Ziehung (massenstrom.sample_flow): None = fester Wert aus
+# massenstrom.py, "sampled" = V̇ und ρ gezogen, "depth" = V̇ zusätzlich über die
+# Produktivitätsindex-Kurve an die Tiefe gekoppelt
+FLOW = None
+
+rng = np.random.default_rng(RNG_SEED)
 
 # Monte-Carlo-Sampler:  Tiefe x  & Gradient g
-x_samples = np.random.uniform(1700, 2200, N_SAMPLES)     # [m]
-g_samples = np.random.uniform(0.028, 0.033, N_SAMPLES)   # [°C/m]
+x_samples = rng.uniform(1700, 2200, N_SAMPLES)     # [m]
+g_samples = rng.uniform(0.028, 0.033, N_SAMPLES)   # [°C/m]
+
+# ṁ als Array aus eigenem Strom → x, g bleiben dieselben Ziehungen wie mit festem ṁ
+if FLOW is not None:
+    m_dot = sample_flow(N_SAMPLES, np.random.default_rng([RNG_SEED, 2]),
+                        x_samples if FLOW == "depth" else None)["m_dot"]
 
 # Wärmeleistung (W) über dein Pth-Modul berechnen
 P_W = Pth(x_samples, g_samples, m_dot=m_dot, c_p=c_p, b=b)
@@ -50,7 +63,7 @@ BINS = 60
 
 #  PUMPENANTEIL SAMPLEN  &  OPEX (= variable Betriebskosten)
 
-f_samples   = np.random.uniform(F_LOWER, F_UPPER, Q_GWh.size)
+f_samples   = rng.uniform(F_LOWER, F_UPPER, Q_GWh.size)
 E_pump_GWh  = Q_GWh * f_samples
 opex_eur    = E_pump_GWh * 1_000 * HEAT_PRICE
 
@@ -0,0 +1,145 @@
+"""
+Geschichtetes Temperaturprofil statt eines einzigen Gradienten g·x + b.
+
+Jede Schicht l (Oberkante top_l, nach unten bis zur nächsten Oberkante) hat
+einen eigenen Gradienten g_l – fest oder als Verteilung aus mc_engine. Die
+Temperaturdifferenz in Tiefe z ist
+
+    ΔT(z) = b + Σ_{k<l} g_k · d_k + g_l · (z − top_l),   l = Schicht von z
+
+Die Summen Σ g_k · d_k werden je Ziehung einmal als kumulative Tabelle an den
+Schicht-Oberkanten vorberechnet (n × L); die Auswertung für Stichproben-
+Tiefen ist dann searchsorted (Schicht) + lineare Interpolation innerhalb der
+Schicht, ohne Schleife über die Ziehungen.
+
+Mit einer einzigen Schicht ab 0 m ist das Modell identisch mit Pth.delta_T.
+
+    model = LayeredGradient([
+        Layer("Quartär/Tertiär", 0,     Uniform(0.030, 0.036)),
+        Layer("Kreide",          800,   Normal(0.027, 0.001)),
+        Layer("Malm",            1_600, Truncated(Normal(0.031, 0.002), low=0.0)),
+    ])
+    g = model.sample_gradients(n, seed)            # (n, 3)
+    dT = model.delta_T(depths, g)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from Pth import b as B_DEFAULT, c_p as C_P_DEFAULT
+from massenstrom import m_dot as M_DOT_DEFAULT
+from mc_engine import Fixed, as_distribution, sample_block
+
+__all__ = ["Layer", "LayeredGradient", "layers_from_config"]
+
+
+@dataclass
+class Layer:
+    name: str
+    top: float                  # Oberkante (m unter Gelände)
+    gradient: object            # °C/m – Zahl oder Verteilung (mc_engine / ("normal", {...}))
+
+
+class LayeredGradient:
+    def __init__(self, layers: Sequence[Layer], b: float = B_DEFAULT):
+        if not layers:
+            raise ValueError("Mindestens eine Schicht nötig")
+        tops = np.array([l.top for l in layers], dtype=float)
+        if tops[0] != 0.0 or np.any(np.diff(tops) <= 0):
+            raise ValueError("Schicht-Oberkanten müssen bei 0 m beginnen und streng aufsteigen")
+        _check_unique_names([l.name for l in layers])
+        self.layers = list(layers)
+        self.tops = tops
+        self.thickness = np.diff(tops)          # (L−1,) die unterste Schicht ist offen
+        self.b = b
+        self.dists = {
+            l.name: Fixed(float(l.gradient)) if np.isscalar(l.gradient) else as_distribution(l.gradient)
+            for l in layers
+        }
+
+    def __len__(self) -> int:
+        return len(self.layers)
+
+    # ---------- Ziehen ----------
+    def sample_gradients(
+        self, n: int, rng: np.random.Generator | int | None = None, sampler: str = "pseudo"
+    ) -> np.ndarray:
+        """(n, L) Gradienten je Ziehung und Schicht (Reihenfolge der Schichten = Ziehungsreihenfolge)."""
+        block = sample_block(self.dists, n, rng, sampler)
+        return np.column_stack([block[l.name] for l in self.layers])
+
+    # ---------- Tabellen ----------
+    def temperature_table(self, gradients: np.ndarray) -> np.ndarray:
+        """
+        Kumulative ΔT an den Schicht-Oberkanten: (L,) für ein Profil bzw. (n, L)
+        für Ziehungen. Spalte l = ΔT(top_l) = b + Σ_{k<l} g_k · d_k.
+        """
+        g = np.asarray(gradients, dtype=float)
+        steps = g[..., :-1] * self.thickness
+        table = np.empty(g.shape)
+        table[..., 0] = self.b
+        np.cumsum(steps, axis=-1, out=table[..., 1:])
+        table[..., 1:] += self.b
+        return table
+
+    def layer_index(self, depth) -> np.ndarray:
+        """Schicht je Tiefe (searchsorted auf den Oberkanten)."""
+        depth = np.asarray(depth)
+        if np.any(depth < 0):
+            raise ValueError("Tiefen müssen ≥ 0 m sein")
+        return np.searchsorted(self.tops, depth, side="right") - 1
+
+    # ---------- Auswertung ----------
+    def delta_T(self, depth, gradients, table: np.ndarray | None = None) -> np.ndarray:
+        """
+        ΔT (K) in Tiefe `depth`.
+        gradients (L,) → ein Profil für alle Tiefen (z. B. Kurven über ein Tiefenraster),
+        gradients (n, L) → je Ziehung ein Profil, depth hat dann Länge n.
+        `table` = temperature_table(gradients), falls schon vorhanden.
+        """
+        depth = np.asarray(depth, dtype=float)
+        g = np.asarray(gradients, dtype=float)
+        table = self.temperature_table(g) if table is None else table
+        idx = self.layer_index(depth)
+        dz = depth - self.tops[idx]
+        if g.ndim == 1:
+            return table[idx] + g[idx] * dz
+        # flacher Index Zeile·L + Schicht → ein take statt fancy-indexing über zwei Achsen
+        flat = np.arange(g.shape[0]) * g.shape[1] + idx
+        return table.ravel().take(flat) + g.ravel().take(flat) * dz
+
+    def effective_gradient(self, depth, gradients) -> np.ndarray:
+        """Mittlerer Gradient bis z: (ΔT − b) / z – Vergleichswert zum Einschichtmodell."""
+        depth = np.asarray(depth, dtype=float)
+        return (self.delta_T(depth, gradients) - self.b) / depth
+
+    def power(self, depth, gradients, m_dot=M_DOT_DEFAULT, c_p=C_P_DEFAULT) -> np.ndarray:
+        """P_th = ṁ · c_p · ΔT(z) in Watt, wie Pth.Pth."""
+        return m_dot * c_p * self.delta_T(depth, gradients)
+
+
+def _check_unique_names(names: Sequence[str]) -> None:
+    # die Stichprobe ist nach Schichtnamen geschlüsselt → Duplikate würden sich überschreiben
+    dupes = sorted({n for n in names if names.count(n) > 1})
+    if dupes:
+        raise ValueError(f"Schichtnamen müssen eindeutig sein, doppelt: {', '.join(dupes)}")
+
+
+def layers_from_config(cfg: Sequence[Mapping[str, object]]) -> list:
+    """
+    Schichten aus einer Szenario-Datei, z. B.
+        [[heat.layers]]  name = "Kreide"  top = 800  gradient = ["normal", {mean = 0.027, std = 0.001}]
+    gradient: Zahl, [kind, {params}] oder {kind = ..., ...}
+    """
+    out = []
+    for c in cfg:
+        g = c["gradient"]
+        if isinstance(g, (list, tuple)):
+            g = (g[0], dict(g[1]))
+        out.append(Layer(str(c["name"]), float(c["top"]), g))
+    _check_unique_names([l.name for l in out])
+    return out
@@ -1,6 +1,59 @@
+import numpy as np
+
+from mc_engine import Lognormal, Normal, sample_block
+
 # Mass flow rate  ṁ = V̇ · ρ
 V_dot = 0.0519   # Volumenstrom [m³/s]
 rho   = 1063.172   # Dichte       [kg/m³]
 
 m_dot = V_dot * rho
-print(m_dot)
\ No newline at end of file
+
+# ---------------------------------------------------------------------------
+# Stochastischer Massenstrom: V̇ und ρ als Verteilungen statt fester Werte.
+# Optional hängt V̇ über eine Produktivitätsindex-Kurve von der Tiefe ab:
+#
+#     V̇(z) = PI(z) · Δp · ε          ε = V̇-Ziehung / V_dot  (relative Streuung, Median 1)
+#
+# PI(z) wird linear zwischen den Stützstellen interpoliert (außerhalb konstant).
+# Ergebnis ist ṁ als Array, direkt als m_dot in Pth.Pth einsetzbar.
+# ---------------------------------------------------------------------------
+__all__ = [
+    "V_dot", "rho", "m_dot",
+    "FLOW_INPUTS", "PI_DEPTHS", "PI_CURVE", "DRAWDOWN_BAR",
+    "productivity_flow", "sample_flow",
+]
+
+# V̇ log-normal ±20 % (P10/P90), ρ normal mit σ = 5 kg/m³ (Salinität/Temperatur)
+FLOW_INPUTS = {
+    "V_dot": Lognormal(0.8 * V_dot, V_dot, 1.2 * V_dot),
+    "rho": Normal(rho, 5.0),
+}
+
+# Produktivitätsindex (l/(s·bar)) über der Tiefe (m), Annahme: Durchlässigkeit
+# nimmt nach unten ab; bei 1 950 m (Mitte 1 700–2 200 m) und Δp = 20 bar ist V̇ = V_dot
+PI_DEPTHS = np.array([1_500.0, 1_950.0, 2_500.0])
+PI_CURVE = np.array([3.20, V_dot * 1_000 / 20.0, 2.00])
+DRAWDOWN_BAR = 20.0             # Absenkung im Förderbrunnen [bar]
+
+
+def productivity_flow(depth, pi_depths=PI_DEPTHS, pi_curve=PI_CURVE, drawdown_bar=DRAWDOWN_BAR):
+    """V̇(z) = PI(z) · Δp in m³/s (ohne Streuung)."""
+    return np.interp(depth, pi_depths, pi_curve) * (drawdown_bar / 1_000.0)
+
+
+def sample_flow(n, rng=None, depth=None, *, inputs=FLOW_INPUTS, sampler="pseudo", dtype=np.float64,
+                pi_depths=PI_DEPTHS, pi_curve=PI_CURVE, drawdown_bar=DRAWDOWN_BAR):
+    """
+    Zieht V̇ und ρ je Ziehung → {"V_dot", "rho", "m_dot"} (Arrays der Länge n).
+    depth (Länge n) gesetzt → V̇ zusätzlich über die PI-Kurve an die Tiefe gekoppelt.
+    """
+    block = sample_block(inputs, n, rng, sampler, dtype)
+    if depth is not None:
+        # Ziehung als relative Streuung um die Kurve
+        block["V_dot"] *= productivity_flow(depth, pi_depths, pi_curve, drawdown_bar) / V_dot
+    block["m_dot"] = block["V_dot"] * block["rho"]
+    return block
+
+
+if __name__ == "__main__":
+    print(m_dot)
@@ -0,0 +1,92 @@
+"""
+Adaptive Stichprobengröße: es wird in Batches gezogen, bis die 95-%-
+Konfidenzintervalle von Mittelwert und P10/P50/P90 enger als die Toleranz sind.
+
+• KI des Mittelwerts:  1.96 · s / √n   (wie in Drilling_MC / Pipeline_MC / Pth_MC)
+• KI der Quantile:     verteilungsfrei über Ordnungsstatistiken,
+                       Ränge n·p ± 1.96 · √(n·p·(1−p))
+
+Die Stichprobe verdoppelt sich je Runde (ab batch_size), sodass die
+Sortierkosten insgesamt O(N log N) bleiben. Einfache Fälle sind nach dem
+ersten Batch fertig, nur schwierige Fälle laufen bis max_samples.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Sequence
+
+import numpy as np
+
+__all__ = ["quantile_ci", "adaptive_mc"]
+
+Z95 = 1.96
+
+
+def quantile_ci(sorted_x: np.ndarray, p: float) -> tuple[float, float]:
+    """Verteilungsfreies 95-%-KI des p-Quantils aus einer sortierten Stichprobe."""
+    n = sorted_x.size
+    half = Z95 * np.sqrt(n * p * (1.0 - p))
+    lo = int(np.clip(np.floor(n * p - half), 0, n - 1))
+    hi = int(np.clip(np.ceil(n * p + half), 0, n - 1))
+    return float(sorted_x[lo]), float(sorted_x[hi])
+
+
+def _concat(parts):
+    if isinstance(parts[0], tuple):
+        return tuple(np.concatenate(col) for col in zip(*parts))
+    return np.concatenate(parts)
+
+
+def adaptive_mc(
+    draw: Callable[[np.random.Generator, int], object],
+    *,
+    monitor: Callable[[object], np.ndarray] | None = None,
+    rtol: float = 1e-3,
+    atol: float = 0.0,
+    percentiles: Sequence[float] = (10, 50, 90),
+    batch_size: int = 10_000,
+    max_samples: int = 10_000_000,
+    seed: int | np.random.SeedSequence | None = 42,
+) -> Dict[str, object]:
+    """
+    draw(rng, n) liefert n Stichproben (Array oder Tupel von Arrays);
+    monitor(samples) wählt die überwachte Größe (Standard: draw-Ergebnis selbst).
+
+    Abbruch, sobald für Mittelwert und jedes Perzentil gilt:
+        KI-Halbbreite ≤ max(atol, rtol · |Schätzwert|)
+    """
+    rng = np.random.default_rng(seed)
+    parts = []
+    n = 0
+    next_batch = batch_size
+    while True:
+        size = min(next_batch, max_samples - n)
+        parts.append(draw(rng, size))
+        n += size
+        samples = _concat(parts) if len(parts) > 1 else parts[0]
+        parts = [samples]
+        values = np.asarray(monitor(samples) if monitor else samples)
+
+        mean = values.mean()
+        ci_mean = Z95 * values.std(ddof=1) / np.sqrt(n)
+        xs = np.sort(values)
+        pct = np.percentile(xs, percentiles)
+        ci_pct = np.array([np.subtract(*quantile_ci(xs, p / 100)[::-1]) / 2 for p in percentiles])
+
+        est = np.concatenate(([mean], pct))
+        half = np.concatenate(([ci_mean], ci_pct))
+        converged = bool(np.all(half <= np.maximum(atol, rtol * np.abs(est))))
+        if converged or n >= max_samples:
+            break
+        next_batch = n      # Stichprobe verdoppeln
+
+    return {
+        "n": n,
+        "converged": converged,
+        "mean": float(mean),
+        "ci95": float(ci_mean),
+        "percentiles": dict(zip(percentiles, pct.tolist())),
+        "percentile_ci95": dict(zip(percentiles, ci_pct.tolist())),
+        "samples": samples,
+        "values": values,
+    }
@@ -0,0 +1,101 @@
+"""
+Konvergenzvergleich der Sampling-Modi (pseudo / sobol / lhs) für NPV-Quantile.
+
+Für jede Stichprobengröße werden `reps` unabhängige Wiederholungen gerechnet
+(verschiedene Seeds bzw. Scramblings) und der RMSE von P10/P50/P90 gegen eine
+große Referenzrechnung bestimmt. Aus der Steigung log(RMSE) ~ log(N) folgt,
+wie viele Stichproben ein Modus für die Genauigkeit von "pseudo" bei N_max braucht.
+
+Aufruf:  python mc_convergence.py
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from mc_engine import SAMPLERS
+from npv_model import NPVScenario, lognormal_scenario, simulate_npv
+
+__all__ = ["quantile_rmse", "convergence_report", "print_report"]
+
+PERCENTILES = (10, 50, 90)
+
+
+def quantile_rmse(
+    scenario: NPVScenario,
+    sampler: str,
+    n: int,
+    reference: np.ndarray,
+    reps: int = 20,
+    seed: int = 0,
+) -> np.ndarray:
+    """RMSE der P10/P50/P90-Schätzer über `reps` Wiederholungen (in €)."""
+    sc = scenario.replace(sampler=sampler)
+    seeds = np.random.SeedSequence(seed).spawn(reps)
+    est = np.array([np.percentile(simulate_npv(sc, n, ss)[1], PERCENTILES) for ss in seeds])
+    return np.sqrt(np.mean((est - reference) ** 2, axis=0))
+
+
+def convergence_report(
+    scenario: NPVScenario,
+    sizes: Sequence[int] = (1_000, 4_000, 16_000, 64_000),
+    samplers: Sequence[str] = SAMPLERS,
+    reps: int = 20,
+    ref_n: int = 4_000_000,
+    seed: int = 0,
+) -> List[Dict[str, float]]:
+    """
+    Liefert je Sampler: RMSE je Größe, geschätzte Konvergenzrate und den Faktor,
+    um den weniger Stichproben als bei "pseudo" nötig sind (gleicher RMSE wie
+    "pseudo" bei max(sizes), gemittelt über P10/P50/P90). Der Referenzwert
+    stammt aus einem großen Sobol-Lauf.
+    """
+    reference = np.percentile(simulate_npv(scenario.replace(sampler="sobol"), ref_n, seed + 1)[1], PERCENTILES)
+    sizes = np.asarray(sizes)
+
+    rmse = {s: np.array([quantile_rmse(scenario, s, int(n), reference, reps, seed) for n in sizes])
+            for s in samplers}
+
+    # Potenzgesetz RMSE ≈ c · N^(-α) je Quantil anpassen
+    fits = {}
+    for s, r in rmse.items():
+        slope, icpt = np.polyfit(np.log(sizes), np.log(r), 1)   # r: (sizes, 3) → je Spalte
+        fits[s] = (-slope, icpt)
+
+    # Ziel: (geglätteter) RMSE von "pseudo" bei N_max
+    target = None
+    if "pseudo" in fits:
+        alpha_p, icpt_p = fits["pseudo"]
+        target = icpt_p - alpha_p * np.log(sizes[-1])
+    report = []
+    for s in samplers:
+        alpha, icpt = fits[s]
+        row = {"sampler": s, "rate α (Mittel)": float(np.mean(alpha))}
+        for n, r in zip(sizes, rmse[s]):
+            row[f"RMSE N={n:,} (k€)"] = float(np.mean(r) / 1e3)
+        if target is not None:
+            n_needed = np.exp((icpt - target) / alpha)           # je Quantil
+            row["N für Pseudo-Genauigkeit"] = float(np.mean(n_needed))
+            row["Einsparfaktor"] = float(sizes[-1] / np.mean(n_needed))
+        report.append(row)
+    return report
+
+
+def print_report(report: List[Dict[str, float]]) -> None:
+    for row in report:
+        print(f"\n{row['sampler']}")
+        for k, v in row.items():
+            if k != "sampler":
+                print(f"  {k:<28}: {v:,.3f}")
+
+
+if __name__ == "__main__":
+    # Standardfall aus NPV_Verteilung_Bohrung_P10.py
+    scenario = lognormal_scenario(
+        capex=(8_710_000, 9_120_000, 9_530_000),
+        q=(77.66, 88.76, 100.70),
+        opex=(1_842_494.42, 2_493_592.47, 3_218_984.25),
+    )
+    print_report(convergence_report(scenario))
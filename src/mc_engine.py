@@ -0,0 +1,372 @@
+"""
+Gemeinsame Monte-Carlo-Engine für die NPV-/CAPEX-/OPEX-Skripte.
+
+• Verteilungs-Registry (Log-Normal aus P10/P50/P90, gestutzte Normalverteilung,
+  Gleichverteilung, Normalverteilung, feste Werte)
+• sample_block() liefert spaltenweise Stichproben-Blöcke {name: ndarray}
+• Die Ziehungsreihenfolge entspricht exakt der der alten Skripte
+  (rng.lognormal(...) pro Eingangsgröße nacheinander) → identische Ergebnisse
+• Alternativ sampler="sobol" / "lhs": gestreute Sobol- bzw. Latin-Hypercube-
+  Punkte in [0, 1)^d, über die inverse Verteilungsfunktion (ppf) transformiert
+• Truncated(...): beliebige Verteilung (Normal, Lognormal, eingefrorene
+  scipy-Verteilung) auf [low, upp] gestutzt – exakt per inverser
+  Verteilungsfunktion auf gestauchter Gleichverteilung, ohne Verwerfen
+• dtype=np.float32 (opt-in): Ziehungen direkt in einfacher Genauigkeit
+  (halber Speicher; anderer Zufallsstrom als float64, siehe mc_precision)
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import Callable, Dict, Mapping
+
+import numpy as np
+
+__all__ = [
+    "Z10",
+    "Z90",
+    "lognormal_params",
+    "Lognormal",
+    "TruncNormal",
+    "Uniform",
+    "Normal",
+    "Fixed",
+    "Truncated",
+    "truncated_ppf",
+    "truncated_cdf",
+    "DISTRIBUTIONS",
+    "register_distribution",
+    "make_distribution",
+    "as_distribution",
+    "SAMPLERS",
+    "DTYPES",
+    "uniform_points",
+    "sample_block",
+]
+
+
+Z10, Z90 = -1.2815515655446004, 1.2815515655446004  # Φ⁻¹(0.10), Φ⁻¹(0.90)
+
+
+def _ndtri(u):
+    from scipy.special import ndtri
+
+    return ndtri(u)
+
+
+def _ndtr(x):
+    from scipy.special import ndtr
+
+    return ndtr(x)
+
+
+def _std_normal(rng: np.random.Generator, size: int, dtype) -> np.ndarray:
+    return rng.standard_normal(size, dtype=dtype)
+
+
+def _affine(z: np.ndarray, scale: float, shift: float) -> np.ndarray:
+    # in place, Konstanten im dtype von z → kein Hochstufen auf float64
+    z *= z.dtype.type(scale)
+    z += z.dtype.type(shift)
+    return z
+
+
+def lognormal_params(p10: float, p50: float, p90: float) -> tuple[float, float]:
+    """gibt μ, σ der zugr. Log-Normal in natural-log-Space zurück"""
+    mu = np.log(p50)
+    sigma = (np.log(p90) - np.log(p10)) / (Z90 - Z10)
+    return mu, sigma
+
+
+# Registry: Name → Klasse, damit Szenarien Verteilungen per String angeben können
+DISTRIBUTIONS: Dict[str, type] = {}
+
+
+def register_distribution(name: str) -> Callable[[type], type]:
+    def deco(cls: type) -> type:
+        cls.kind = name
+        DISTRIBUTIONS[name] = cls
+        return cls
+    return deco
+
+
+def make_distribution(kind: str, **params):
+    """Baut eine Verteilung aus der Registry, z. B. make_distribution("uniform", low=0, high=1)."""
+    try:
+        cls = DISTRIBUTIONS[kind]
+    except KeyError:
+        raise ValueError(f"Unbekannte Verteilung '{kind}' (bekannt: {sorted(DISTRIBUTIONS)})") from None
+    return cls(**params)
+
+
+@register_distribution("lognormal")
+class Lognormal:
+    """Log-Normal, kalibriert über P10/P50/P90 (wie lognormal_params in den NPV-Skripten)."""
+
+    # Zufallszahlen-Verbrauch hängt nicht von den Parametern ab (siehe sample_cache)
+    stream_invariant = True
+
+    def __init__(self, p10: float, p50: float, p90: float):
+        self.p10, self.p50, self.p90 = p10, p50, p90
+        self.mu, self.sigma = lognormal_params(p10, p50, p90)
+
+    def params(self) -> dict:
+        return {"p10": self.p10, "p50": self.p50, "p90": self.p90}
+
+    def sample(self, rng: np.random.Generator, size: int, dtype=np.float64) -> np.ndarray:
+        if dtype == np.float64:
+            return rng.lognormal(self.mu, self.sigma, size)
+        return np.exp(_affine(_std_normal(rng, size, dtype), self.sigma, self.mu))
+
+    def ppf(self, u: np.ndarray) -> np.ndarray:
+        return np.exp(self.mu + self.sigma * _ndtri(u))
+
+    def _log(self, x):
+        # x ≤ 0 → log = −∞ (F = 0), z. B. für die Standardgrenze low = −∞
+        with np.errstate(divide="ignore"):
+            return np.log(np.maximum(x, 0.0))
+
+    def cdf(self, x):
+        return _ndtr((self._log(x) - self.mu) / self.sigma)
+
+    def sf(self, x):
+        return _ndtr((self.mu - self._log(x)) / self.sigma)
+
+    def isf(self, q: np.ndarray) -> np.ndarray:
+        return np.exp(self.mu - self.sigma * _ndtri(q))
+
+
+@register_distribution("truncnormal")
+class TruncNormal:
+    """Normalverteilung gestutzt auf [low, upp] (wie truncated_normal in JPD_capex_n.py)."""
+
+    # eine Gleichverteilte je Ziehung (inverse Verteilungsfunktion, kein Verwerfen)
+    stream_invariant = True
+    # 2 = inverse Verteilungsfunktion (1 = truncnorm.rvs); geht in den Cache-Schlüssel ein
+    sampler_version = 2
+
+    def __init__(self, mean: float, std: float, low: float, upp: float):
+        self.mean, self.std, self.low, self.upp = mean, std, low, upp
+
+    def params(self) -> dict:
+        return {"mean": self.mean, "std": self.std, "low": self.low, "upp": self.upp}
+
+    def sample(self, rng: np.random.Generator, size: int, dtype=np.float64) -> np.ndarray:
+        x = self.ppf(rng.random(size))
+        return x if dtype == np.float64 else x.astype(dtype)
+
+    def ppf(self, u: np.ndarray) -> np.ndarray:
+        return truncated_ppf(Normal(self.mean, self.std), u, self.low, self.upp)
+
+    def cdf(self, x):
+        return truncated_cdf(Normal(self.mean, self.std), x, self.low, self.upp)
+
+
+@register_distribution("uniform")
+class Uniform:
+    stream_invariant = True
+
+    def __init__(self, low: float, high: float):
+        self.low, self.high = low, high
+
+    def params(self) -> dict:
+        return {"low": self.low, "high": self.high}
+
+    def sample(self, rng: np.random.Generator, size: int, dtype=np.float64) -> np.ndarray:
+        if dtype == np.float64:
+            return rng.uniform(self.low, self.high, size)
+        return _affine(rng.random(size, dtype=dtype), self.high - self.low, self.low)
+
+    def ppf(self, u: np.ndarray) -> np.ndarray:
+        return self.low + u * (self.high - self.low)
+
+    def cdf(self, x):
+        return np.clip((np.asarray(x, dtype=float) - self.low) / (self.high - self.low), 0.0, 1.0)
+
+
+@register_distribution("normal")
+class Normal:
+    stream_invariant = True
+
+    def __init__(self, mean: float, std: float):
+        self.mean, self.std = mean, std
+
+    def params(self) -> dict:
+        return {"mean": self.mean, "std": self.std}
+
+    def sample(self, rng: np.random.Generator, size: int, dtype=np.float64) -> np.ndarray:
+        if dtype == np.float64:
+            return rng.normal(self.mean, self.std, size)
+        return _affine(_std_normal(rng, size, dtype), self.std, self.mean)
+
+    def ppf(self, u: np.ndarray) -> np.ndarray:
+        return self.mean + self.std * _ndtri(u)
+
+    def cdf(self, x):
+        return _ndtr((np.asarray(x, dtype=float) - self.mean) / self.std)
+
+    def sf(self, x):
+        return _ndtr((self.mean - np.asarray(x, dtype=float)) / self.std)
+
+    def isf(self, q: np.ndarray) -> np.ndarray:
+        return self.mean - self.std * _ndtri(q)
+
+
+@register_distribution("fixed")
+class Fixed:
+    """Deterministischer Wert – verbraucht keine Zufallszahlen."""
+
+    stream_invariant = True
+
+    def __init__(self, value: float):
+        self.value = value
+
+    def params(self) -> dict:
+        return {"value": self.value}
+
+    def sample(self, rng: np.random.Generator, size: int, dtype=np.float64) -> np.ndarray:
+        return np.full(size, self.value, dtype=dtype)
+
+    def ppf(self, u: np.ndarray) -> np.ndarray:
+        return np.full(np.shape(u), float(self.value))
+
+    def cdf(self, x):
+        return (np.asarray(x, dtype=float) >= self.value).astype(float)
+
+
+def truncated_ppf(dist, u: np.ndarray, low: float = -np.inf, upp: float = np.inf) -> np.ndarray:
+    """
+    Inverse Verteilungsfunktion von `dist` gestutzt auf [low, upp]:
+    u ∈ [0, 1) wird auf [F(low), F(upp)] gestaucht und mit dist.ppf zurückgerechnet.
+    `dist` braucht cdf/ppf (mc_engine-Verteilung oder eingefrorene scipy-Verteilung).
+    """
+    fa, fb = dist.cdf(low), dist.cdf(upp)
+    if fa > 0.5 and hasattr(dist, "isf"):
+        # Intervall im oberen Ausläufer: über die Überlebensfunktion, sonst
+        # geht die Auflösung in 1 − F verloren (F(low) ≈ 1)
+        sa, sb = dist.sf(low), dist.sf(upp)
+        x = dist.isf(sa - u * (sa - sb))
+    else:
+        x = dist.ppf(fa + u * (fb - fa))
+    return np.clip(x, low, upp)
+
+
+def truncated_cdf(dist, x, low: float = -np.inf, upp: float = np.inf) -> np.ndarray:
+    """Verteilungsfunktion von `dist` gestutzt auf [low, upp] (Gegenstück zu truncated_ppf)."""
+    x = np.clip(np.asarray(x, dtype=float), low, upp)
+    fa, fb = dist.cdf(low), dist.cdf(upp)
+    if fa > 0.5 and hasattr(dist, "sf"):
+        sa, sb = dist.sf(low), dist.sf(upp)
+        return np.clip((sa - dist.sf(x)) / (sa - sb), 0.0, 1.0)
+    return np.clip((dist.cdf(x) - fa) / (fb - fa), 0.0, 1.0)
+
+
+def _base_spec(dist) -> dict:
+    if hasattr(dist, "kind"):
+        return {"kind": dist.kind, **dist.params()}
+    # eingefrorene scipy-Verteilung, z. B. scipy.stats.gamma(2.0, scale=3.0)
+    return {"scipy": dist.dist.name, "args": list(dist.args), "kwds": dict(dist.kwds)}
+
+
+def _base_from_spec(spec):
+    if isinstance(spec, Mapping) and "scipy" in spec:
+        import scipy.stats
+
+        return getattr(scipy.stats, spec["scipy"])(*spec.get("args", ()), **spec.get("kwds", {}))
+    return as_distribution(spec)
+
+
+@register_distribution("truncated")
+class Truncated:
+    """
+    Beliebige Verteilung gestutzt auf [low, upp], z. B.
+    Truncated(Normal(0.0305, 0.00083), low=0) oder Truncated(scipy.stats.gamma(2), upp=10).
+    Ziehen = inverse Verteilungsfunktion auf einer Gleichverteilten (ein Durchlauf,
+    kein Nachziehen) → funktioniert unverändert auch mit Sobol/LHS-Punkten.
+    """
+
+    stream_invariant = True
+
+    def __init__(self, base, low: float = -np.inf, upp: float = np.inf):
+        self.base = _base_from_spec(base)
+        self.low, self.upp = float(low), float(upp)
+        if not self.low < self.upp:
+            raise ValueError(f"Leeres Intervall [{self.low}, {self.upp}]")
+
+    def params(self) -> dict:
+        return {"base": _base_spec(self.base), "low": self.low, "upp": self.upp}
+
+    def sample(self, rng: np.random.Generator, size: int, dtype=np.float64) -> np.ndarray:
+        # Gleichverteilte immer in float64: die Stauchung auf [F(low), F(upp)] braucht die Auflösung
+        x = self.ppf(rng.random(size))
+        return x if dtype == np.float64 else x.astype(dtype)
+
+    def ppf(self, u: np.ndarray) -> np.ndarray:
+        return truncated_ppf(self.base, u, self.low, self.upp)
+
+    def cdf(self, x):
+        return truncated_cdf(self.base, x, self.low, self.upp)
+
+
+def as_distribution(spec):
+    # erlaubt ("lognormal", {...}) bzw. {"kind": ..., ...} neben fertigen Objekten
+    if isinstance(spec, tuple):
+        kind, params = spec
+        return make_distribution(kind, **params)
+    if isinstance(spec, Mapping):
+        params = dict(spec)
+        return make_distribution(params.pop("kind"), **params)
+    return spec
+
+
+SAMPLERS = ("pseudo", "sobol", "lhs")
+DTYPES = {"float64": np.float64, "float32": np.float32}
+
+
+def _qmc_engine(cls, d: int, rng: np.random.Generator):
+    try:
+        return cls(d, scramble=True, rng=rng)
+    except TypeError:       # ältere scipy-Versionen kennen nur seed=
+        return cls(d, scramble=True, seed=rng)
+
+
+def uniform_points(sampler: str, n: int, d: int, rng: np.random.Generator) -> np.ndarray:
+    """(n, d)-Punktmenge in [0, 1)^d für die QMC-/LHS-Modi."""
+    from scipy.stats import qmc
+
+    if sampler == "sobol":
+        engine = _qmc_engine(qmc.Sobol, d, rng)
+        with warnings.catch_warnings():
+            # n muss keine Zweierpotenz sein; die Warnung zur Balance ist hier bekannt
+            warnings.simplefilter("ignore", UserWarning)
+            return engine.random(n)
+    if sampler == "lhs":
+        return _qmc_engine(qmc.LatinHypercube, d, rng).random(n)
+    raise ValueError(f"Unbekannter Sampler '{sampler}' (bekannt: {SAMPLERS})")
+
+
+def sample_block(
+    inputs: Mapping[str, object],
+    n: int,
+    rng: np.random.Generator | int | None = None,
+    sampler: str = "pseudo",
+    dtype=np.float64,
+) -> Dict[str, np.ndarray]:
+    """
+    Zieht n Stichproben je Eingangsgröße, in Reihenfolge von `inputs`.
+
+    Ergebnis ist spaltenweise: {name: ndarray der Länge n}. Mit sampler="sobol"
+    oder "lhs" bekommt jede Eingangsgröße eine Dimension der Punktmenge.
+    dtype="float32" bzw. np.float32 zieht in einfacher Genauigkeit.
+    """
+    dtype = np.dtype(DTYPES.get(dtype, dtype)).type
+    if not isinstance(rng, np.random.Generator):
+        rng = np.random.default_rng(rng)
+    dists = {name: as_distribution(spec) for name, spec in inputs.items()}
+    if sampler == "pseudo":
+        if dtype == np.float64:
+            return {name: dist.sample(rng, n) for name, dist in dists.items()}
+        return {name: dist.sample(rng, n, dtype) for name, dist in dists.items()}
+
+    u = uniform_points(sampler, n, len(dists), rng)
+    return {name: dist.ppf(u[:, j]).astype(dtype, copy=False) for j, (name, dist) in enumerate(dists.items())}
@@ -0,0 +1,76 @@
+"""
+Reproduzierbare Monte-Carlo-Läufe über mehrere Prozesse.
+
+Die Simulation wird in feste Chunks zerlegt; Chunk i bekommt den i-ten
+Kind-Stream aus SeedSequence(seed).spawn(n_chunks). Teilstatistiken werden
+immer in Chunk-Reihenfolge zusammengeführt. Da weder die Chunk-Grenzen noch
+die Streams oder die Merge-Reihenfolge von der Worker-Zahl abhängen, ist das
+Ergebnis für einen Seed bitgleich – egal ob mit 1 oder 64 Prozessen gerechnet.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, List
+
+import numpy as np
+
+__all__ = ["chunk_sizes", "spawn_streams", "run_chunks"]
+
+
+def chunk_sizes(n_sim: int, chunk_size: int) -> List[int]:
+    """Zerlegt n_sim in Chunks der Größe chunk_size (letzter ggf. kleiner)."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size muss positiv sein")
+    full, rest = divmod(n_sim, chunk_size)
+    return [chunk_size] * full + ([rest] if rest else [])
+
+
+def spawn_streams(seed: int | np.random.SeedSequence, n: int) -> List[np.random.SeedSequence]:
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return root.spawn(n)
+
+
+def _run_one(task: Callable, job: tuple) -> object:
+    ss, size = job
+    return task(np.random.default_rng(ss), size)
+
+
+def run_chunks(
+    task: Callable[[np.random.Generator, int], object],
+    n_sim: int,
+    seed: int | np.random.SeedSequence,
+    *,
+    chunk_size: int = 250_000,
+    workers: int | None = 1,
+):
+    """
+    Führt task(rng, size) für alle Chunks aus und merged die Teilergebnisse
+    (Objekte mit .merge(other), z. B. mc_stats.StreamStats) in fester Reihenfolge.
+
+    task muss picklebar sein (Modul-Funktion oder functools.partial davon).
+    workers=None → os.cpu_count(). n_sim < 1 → ValueError (es gäbe kein Teilergebnis).
+    """
+    if n_sim < 1:
+        raise ValueError(f"n_sim muss ≥ 1 sein, nicht {n_sim}")
+    sizes = chunk_sizes(n_sim, chunk_size)
+    jobs = list(zip(spawn_streams(seed, len(sizes)), sizes))
+    run = partial(_run_one, task)
+
+    workers = os.cpu_count() if workers is None else workers
+    if workers <= 1 or len(jobs) <= 1:
+        results = map(run, jobs)
+        return _merge_in_order(results)
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        # map() liefert in Chunk-Reihenfolge → deterministisches Merging
+        return _merge_in_order(pool.map(run, jobs))
+
+
+def _merge_in_order(results):
+    total = None
+    for part in results:
+        total = part if total is None else total.merge(part)
+    return total
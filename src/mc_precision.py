@@ -0,0 +1,138 @@
+"""
+Genauigkeitsbericht float32 gegen float64.
+
+Zwei Fehlerquellen werden getrennt ausgewiesen:
+• Rundung: dieselben float64-Ziehungen, auf float32 gerundet und in float32
+  ausgewertet (NPV geschlossen + Matrix mit Kahan-Summe, Pth) → relativer
+  Fehler je Ziehung und Abweichung von Mittelwert/P10/P50/P90
+• Gesamtlauf: float32- gegen float64-Lauf (anderer Zufallsstrom) → Differenz
+  der Quantile im Verhältnis zur Monte-Carlo-Unsicherheit (95-%-KI)
+
+Dazu Laufzeit und Speicher von Ziehen + Auswerten für beide Genauigkeiten.
+
+Aufruf:  python mc_precision.py
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from mc_adaptive import quantile_ci
+from npv_model import NPVScenario, lognormal_scenario, npv_closed_form, npv_matrix, simulate_npv
+
+__all__ = ["rounding_error", "end_to_end", "throughput", "precision_report", "print_report"]
+
+PERCENTILES = (10, 50, 90)
+
+
+def _stat_errors(ref: np.ndarray, approx: np.ndarray) -> Dict[str, float]:
+    scale = np.abs(ref).max()
+    rel = np.abs(approx.astype(np.float64) - ref) / scale
+    out = {"max. rel. Fehler je Ziehung": float(rel.max()),
+           "RMS rel. Fehler je Ziehung": float(np.sqrt(np.mean(rel ** 2))),
+           "rel. Fehler Mittelwert": float(abs(approx.mean(dtype=np.float64) - ref.mean()) / scale)}
+    for p, a, b in zip(PERCENTILES, np.percentile(ref, PERCENTILES), np.percentile(approx, PERCENTILES)):
+        out[f"rel. Fehler P{p}"] = float(abs(float(b) - a) / scale)
+    return out
+
+
+def rounding_error(scenario: NPVScenario, n: int = 1_000_000, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """Reiner Rundungsfehler von float32 bei identischen Ziehungen (relativ zur Spannweite)."""
+    from Pth import Pth
+
+    block, ref = simulate_npv(scenario.replace(dtype="float64"), n, seed, method="closed")
+    b32 = {k: v.astype(np.float32) for k, v in block.items()}
+    args = (b32["capex"], b32["q"], b32["opex1"], scenario)
+
+    rng = np.random.default_rng(seed)
+    x, g = rng.uniform(1_700, 2_200, n), rng.uniform(0.028, 0.033, n)
+    p_ref = Pth(x, g)
+    return {
+        "NPV geschlossen": _stat_errors(ref, npv_closed_form(*args)),
+        "NPV Matrix (Kahan)": _stat_errors(ref, npv_matrix(*args)),
+        "Pth": _stat_errors(p_ref, Pth(x.astype(np.float32), g.astype(np.float32))),
+    }
+
+
+def end_to_end(scenario: NPVScenario, n: int = 1_000_000, seed: int = 0) -> Dict[str, float]:
+    """float32- gegen float64-Lauf: |ΔQuantil| / halbe KI-Breite (< 1 → im MC-Rauschen)."""
+    _, a = simulate_npv(scenario.replace(dtype="float64"), n, seed)
+    _, b = simulate_npv(scenario.replace(dtype="float32"), n, seed)
+    xs = np.sort(a)
+    out = {}
+    for p, qa, qb in zip(PERCENTILES, np.percentile(a, PERCENTILES), np.percentile(b, PERCENTILES)):
+        lo, hi = quantile_ci(xs, p / 100)
+        out[f"P{p}: |Δ| / KI-Halbbreite"] = float(abs(float(qb) - qa) / ((hi - lo) / 2))
+    return out
+
+
+def _run_npv(scenario: NPVScenario, n: int, seed: int, dtype: str):
+    block, npv = simulate_npv(scenario.replace(dtype=dtype), n, seed)
+    return list(block.values()), npv
+
+
+def _run_pth(scenario: NPVScenario, n: int, seed: int, dtype: str):
+    # wie Pth_MC.py: z ~ U, g ~ N (nur positive), P_th = Pth(z, g)
+    from Pth import Pth
+    from Pth_MC import draw_samples
+
+    depths, gradients = draw_samples(np.random.default_rng(seed), n, np.dtype(dtype).type)
+    return [depths, gradients], Pth(depths, gradients)
+
+
+def throughput(scenario: NPVScenario, n: int = 10_000_000, seed: int = 0, repeat: int = 3) -> List[Dict[str, float]]:
+    """Beste Laufzeit und Array-Speicher von Ziehen + NPV bzw. Ziehen + Pth je dtype."""
+    rows = []
+    for dtype in ("float64", "float32"):
+        for name, run in (("NPV", _run_npv), ("Pth", _run_pth)):
+            best = np.inf
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                arrays, values = run(scenario, n, seed, dtype)
+                best = min(best, time.perf_counter() - t0)
+            nbytes = sum(a.nbytes for a in arrays) + values.nbytes
+            rows.append({"Kernel": name, "dtype": dtype, "Zeit (s)": best,
+                         "Samples/s": n / best, "Array-Speicher (MB)": nbytes / 1e6})
+    return rows
+
+
+def precision_report(scenario: NPVScenario, n: int = 1_000_000, n_speed: int = 10_000_000) -> Dict[str, object]:
+    return {
+        "Rundung": rounding_error(scenario, n),
+        "Gesamtlauf": end_to_end(scenario, n),
+        "Durchsatz": throughput(scenario, n_speed),
+    }
+
+
+def print_report(report: Dict[str, object]) -> None:
+    print("Rundungsfehler float32 (relativ zur max. |Wert|)")
+    for kernel, errs in report["Rundung"].items():
+        print(f"  {kernel}")
+        for k, v in errs.items():
+            print(f"    {k:<30}: {v:.2e}")
+    print("\nGesamtlauf float32 vs. float64 (anderer Zufallsstrom)")
+    for k, v in report["Gesamtlauf"].items():
+        print(f"  {k:<30}: {v:.2f}")
+    print("\nDurchsatz")
+    rows = report["Durchsatz"]
+    for r in rows:
+        print(f"  {r['Kernel']:<4} {r['dtype']:<8} {r['Zeit (s)']:8.3f} s  {r['Samples/s']:>14,.0f} /s  "
+              f"{r['Array-Speicher (MB)']:9.1f} MB")
+    for kernel in {r["Kernel"] for r in rows}:
+        r64, r32 = (next(r for r in rows if r["Kernel"] == kernel and r["dtype"] == d) for d in ("float64", "float32"))
+        print(f"  {kernel}: Speedup {r64['Zeit (s)'] / r32['Zeit (s)']:.2f}×, "
+              f"Speicher {r32['Array-Speicher (MB)'] / r64['Array-Speicher (MB)']:.0%}")
+
+
+if __name__ == "__main__":
+    # Standardfall aus NPV Bohrkosten_alle Ps_richtig.py
+    scenario = lognormal_scenario(
+        capex=(9_143_985, 9_845_536, 10_540_442),
+        q=(77.66, 88.76, 100.70),
+        opex=(1_900_863, 2_567_868, 3_302_972),
+        maint_pct=0.02,
+    )
+    print_report(precision_report(scenario))
@@ -0,0 +1,354 @@
+"""
+Online-Statistik für Monte-Carlo-Läufe mit konstantem Speicherbedarf.
+
+• RunningMoments – Mittelwert/Varianz blockweise (Chan et al.), zusammenführbar
+• TDigest        – Quantil-Skizze (merging t-digest, vektorisiert mit numpy)
+• StreamStats    – beides + Min/Max + exakte Zähler für "Wert < Schwelle"
+• BinnedHistogram – 2-D/3-D-Häufigkeiten auf festen Bins (Ersatz für hexbin /
+  3-D-Scatter), Speicher O(Bins) statt O(N)
+
+Alle Klassen haben update(chunk) und merge(other), damit Teilergebnisse
+(Chunks, später Worker-Prozesse) zu einer Gesamtstatistik kombiniert werden.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+__all__ = ["RunningMoments", "TDigest", "StreamStats", "BinnedHistogram"]
+
+
+class RunningMoments:
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0       # Summe der quadrierten Abweichungen
+
+    def _combine(self, n_b: int, mean_b: float, m2_b: float) -> None:
+        if n_b == 0:
+            return
+        n_a = self.n
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * n_a * n_b / n
+        self.n = n
+
+    def update(self, x: np.ndarray) -> "RunningMoments":
+        x = np.asarray(x, dtype=np.float64).ravel()
+        if x.size:
+            mean_b = x.mean()
+            self._combine(x.size, mean_b, float(np.sum((x - mean_b) ** 2)))
+        return self
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        self._combine(other.n, other.mean, other.m2)
+        return self
+
+    @property
+    def var(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else float("nan")
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.var))
+
+    @property
+    def ci95(self) -> float:
+        """95-%-KI-Halbbreite des Mittelwerts (wie in Drilling_MC / Pth_MC)."""
+        return 1.96 * self.std / np.sqrt(self.n)
+
+
+class TDigest:
+    """
+    Merging t-digest (Dunning) mit Skalenfunktion k₁(q) = δ/π · asin(2q − 1).
+
+    Neue Werte landen in einem Puffer; beim Verdichten werden Puffer und
+    Zentroide gemeinsam sortiert und pro ganzzahligem k-Intervall zu einem
+    Zentroid zusammengefasst (np.bincount statt Python-Schleife). An den
+    Rändern bleiben die Zentroide klein → P10/P90 sind sehr genau.
+    """
+
+    def __init__(self, compression: float = 1_000, buffer_size: int = 1_000_000):
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self._buffer: list[np.ndarray] = []
+        self._buffered = 0
+        self.min = np.inf
+        self.max = -np.inf
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum()) + self._buffered
+
+    def update(self, x: np.ndarray) -> "TDigest":
+        x = np.asarray(x, dtype=np.float64).ravel()
+        if not x.size:
+            return self
+        self.min = min(self.min, float(x.min()))
+        self.max = max(self.max, float(x.max()))
+        self._buffer.append(x)
+        self._buffered += x.size
+        if self._buffered >= self.buffer_size:
+            self._compress()
+        return self
+
+    def compact(self) -> "TDigest":
+        """Puffer sofort verdichten (z. B. bevor die Skizze an einen anderen Prozess geht)."""
+        self._compress()
+        return self
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        other._compress()
+        if other.weights.size:
+            self._compress(other.means, other.weights)
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        return self
+
+    def _compress(self, extra_means: np.ndarray | None = None, extra_weights: np.ndarray | None = None) -> None:
+        parts_m = [self.means, *self._buffer]
+        parts_w = [self.weights, *(np.ones(b.size) for b in self._buffer)]
+        if extra_means is not None:
+            parts_m.append(extra_means)
+            parts_w.append(extra_weights)
+        self._buffer, self._buffered = [], 0
+        m = np.concatenate(parts_m)
+        if not m.size:
+            return
+        w = np.concatenate(parts_w)
+
+        order = np.argsort(m, kind="stable")
+        m, w = m[order], w[order]
+        total = w.sum()
+        q_mid = (np.cumsum(w) - 0.5 * w) / total
+        k = self.compression * (np.arcsin(np.clip(2.0 * q_mid - 1.0, -1.0, 1.0)) / np.pi + 0.5)
+        idx = np.minimum(k.astype(np.intp), int(self.compression))
+
+        new_w = np.bincount(idx, weights=w)
+        new_m = np.bincount(idx, weights=w * m)
+        keep = new_w > 0
+        self.weights = new_w[keep]
+        self.means = new_m[keep] / self.weights
+
+    def quantile(self, q: float | Sequence[float]) -> np.ndarray:
+        """Quantil(e) für q ∈ [0, 1] (lineare Interpolation zwischen Zentroiden)."""
+        self._compress()
+        q = np.asarray(q, dtype=np.float64)
+        if not self.weights.size:
+            return np.full(q.shape, np.nan)
+        total = self.weights.sum()
+        pos = np.cumsum(self.weights) - 0.5 * self.weights
+        xp = np.concatenate(([0.0], pos, [total]))
+        fp = np.concatenate(([self.min], self.means, [self.max]))
+        return np.interp(q * total, xp, fp)
+
+    def percentile(self, p: float | Sequence[float]) -> np.ndarray:
+        return self.quantile(np.asarray(p, dtype=np.float64) / 100.0)
+
+
+class StreamStats:
+    """Kennzahlen eines Stroms von Stichproben-Blöcken (Speicher unabhängig von N)."""
+
+    def __init__(self, thresholds: Sequence[float] = (0.0,), compression: float = 1_000):
+        self.moments = RunningMoments()
+        self.digest = TDigest(compression)
+        self.thresholds = tuple(thresholds)
+        self.below = np.zeros(len(self.thresholds), dtype=np.int64)
+
+    @property
+    def n(self) -> int:
+        return self.moments.n
+
+    def update(self, x: np.ndarray) -> "StreamStats":
+        x = np.asarray(x).ravel()
+        self.moments.update(x)
+        self.digest.update(x)
+        for i, thr in enumerate(self.thresholds):
+            self.below[i] += np.count_nonzero(x < thr)
+        return self
+
+    def compact(self) -> "StreamStats":
+        self.digest.compact()
+        return self
+
+    def merge(self, other: "StreamStats") -> "StreamStats":
+        if other.thresholds != self.thresholds:
+            raise ValueError("StreamStats mit unterschiedlichen Schwellen können nicht kombiniert werden.")
+        self.moments.merge(other.moments)
+        self.digest.merge(other.digest)
+        self.below += other.below
+        return self
+
+    def state(self) -> Dict[str, np.ndarray]:
+        """Zustand als Arrays (z. B. zum Ablegen im sample_cache)."""
+        self.digest.compact()
+        return {
+            "moments": np.array([self.moments.n, self.moments.mean, self.moments.m2]),
+            "means": self.digest.means,
+            "weights": self.digest.weights,
+            "minmax": np.array([self.digest.min, self.digest.max]),
+            "thresholds": np.array(self.thresholds, dtype=np.float64),
+            "below": self.below,
+            "compression": np.array(self.digest.compression),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, np.ndarray]) -> "StreamStats":
+        stats = cls(thresholds=tuple(state["thresholds"].tolist()), compression=float(state["compression"]))
+        n, mean, m2 = state["moments"]
+        stats.moments.n, stats.moments.mean, stats.moments.m2 = int(n), float(mean), float(m2)
+        stats.digest.means = np.array(state["means"])
+        stats.digest.weights = np.array(state["weights"])
+        stats.digest.min, stats.digest.max = (float(v) for v in state["minmax"])
+        stats.below = np.array(state["below"], dtype=np.int64)
+        return stats
+
+    def prob_below(self, threshold: float = 0.0) -> float:
+        return self.below[self.thresholds.index(threshold)] / self.n
+
+    def percentile(self, p: float | Sequence[float]) -> np.ndarray:
+        return self.digest.percentile(p)
+
+    def summary(self, scale: float = 1e6, label: str = "NPV (M€)") -> Dict[str, float]:
+        """Kennzahlen im Format von npv_model.npv_stats."""
+        p05, p10, p50, p90, p95 = self.percentile([5, 10, 50, 90, 95]) / scale
+        stats = {
+            f"Mean {label}": self.moments.mean / scale,
+            f"Median {label}": p50,
+            f"P05 {label}": p05,
+            f"P10 {label}": p10,
+            f"P90 {label}": p90,
+            f"P95 {label}": p95,
+        }
+        name = label.split(" ")[0]
+        for thr, cnt in zip(self.thresholds, self.below):
+            stats[f"Prob {name} < {thr:g}"] = cnt / self.n
+        return stats
+
+
+class BinnedHistogram:
+    """
+    Gemeinsame Verteilung von D Größen (meist 2 oder 3) als Zähler auf festen
+    Bins. Die Bin-Grenzen müssen vor dem ersten Chunk feststehen; Werte außerhalb
+    werden nur in `outside` gezählt.
+
+    Gleichabständige Bins (der Normalfall) → Bin-Index per Division statt
+    searchsorted, danach ein np.bincount über den flachen Index aller Achsen.
+    Die Zuordnung an den Bin-Grenzen entspricht np.histogramdd (letzter Bin
+    rechts geschlossen).
+    """
+
+    def __init__(self, edges: Sequence[Sequence[float]], names: Sequence[str] | None = None):
+        self.edges = [np.asarray(e, dtype=np.float64) for e in edges]
+        for e in self.edges:
+            if e.ndim != 1 or e.size < 2 or np.any(np.diff(e) <= 0):
+                raise ValueError("Bin-Grenzen müssen eindimensional und streng aufsteigend sein")
+        self.names = list(names) if names is not None else [f"x{i}" for i in range(len(self.edges))]
+        if len(self.names) != len(self.edges):
+            raise ValueError("Je Achse genau ein Name")
+        self.shape = tuple(e.size - 1 for e in self.edges)
+        self.counts = np.zeros(self.shape)
+        self.outside = 0.0
+        self._uniform = [bool(np.allclose(np.diff(e), e[1] - e[0], rtol=1e-9, atol=0.0)) for e in self.edges]
+
+    @classmethod
+    def from_ranges(
+        cls, ranges: Sequence[Tuple[float, float]], bins: int | Sequence[int] = 60,
+        names: Sequence[str] | None = None,
+    ) -> "BinnedHistogram":
+        bins = [bins] * len(ranges) if np.isscalar(bins) else list(bins)
+        return cls([np.linspace(lo, hi, nb + 1) for (lo, hi), nb in zip(ranges, bins)], names)
+
+    @property
+    def n(self) -> float:
+        """Anzahl (bzw. Gewicht) aller gezählten Werte inklusive außerhalb."""
+        return float(self.counts.sum()) + self.outside
+
+    def _index(self, axis: int, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        e = self.edges[axis]
+        nb = e.size - 1
+        inside = (x >= e[0]) & (x <= e[-1])
+        if self._uniform[axis]:
+            i = ((x - e[0]) * (nb / (e[-1] - e[0]))).astype(np.intp)
+            np.clip(i, 0, nb - 1, out=i)
+            # Rundung an den Grenzen wie np.histogram korrigieren
+            i -= x < e[i]
+            i += (x >= e[i + 1]) & (i != nb - 1)
+        else:
+            i = np.clip(np.searchsorted(e, x, side="right") - 1, 0, nb - 1)
+        return i, inside
+
+    def update(self, *coords: np.ndarray, weights: np.ndarray | None = None) -> "BinnedHistogram":
+        """Einen Chunk einsortieren: update(x, y[, z]) mit gleich langen Arrays."""
+        if len(coords) != len(self.edges):
+            raise ValueError(f"{len(self.edges)} Koordinaten-Arrays erwartet, {len(coords)} erhalten")
+        flat, inside = None, None
+        for axis, x in enumerate(coords):
+            i, ok = self._index(axis, np.asarray(x, dtype=np.float64).ravel())
+            flat = i if flat is None else flat * self.shape[axis] + i
+            inside = ok if inside is None else inside & ok
+        w = None if weights is None else np.asarray(weights, dtype=np.float64).ravel()
+        if inside.all():
+            hit = np.bincount(flat, weights=w, minlength=self.counts.size)
+        else:
+            hit = np.bincount(flat[inside], weights=None if w is None else w[inside], minlength=self.counts.size)
+            self.outside += float(inside.size - inside.sum() if w is None else w[~inside].sum())
+        self.counts += hit.reshape(self.shape)
+        return self
+
+    def compact(self) -> "BinnedHistogram":
+        return self
+
+    def merge(self, other: "BinnedHistogram") -> "BinnedHistogram":
+        if other.shape != self.shape or not all(np.array_equal(a, b) for a, b in zip(self.edges, other.edges)):
+            raise ValueError("BinnedHistogram mit unterschiedlichen Bins können nicht kombiniert werden.")
+        self.counts += other.counts
+        self.outside += other.outside
+        return self
+
+    def state(self) -> Dict[str, np.ndarray]:
+        """Zustand als Arrays (z. B. zum Ablegen im sample_cache)."""
+        out = {f"edges{i}": e for i, e in enumerate(self.edges)}
+        out.update(counts=self.counts, outside=np.array(self.outside), names=np.array(self.names))
+        return out
+
+    @classmethod
+    def from_state(cls, state: Dict[str, np.ndarray]) -> "BinnedHistogram":
+        d = np.asarray(state["counts"]).ndim
+        hist = cls([state[f"edges{i}"] for i in range(d)], [str(s) for s in state["names"]])
+        hist.counts = np.array(state["counts"], dtype=np.float64)
+        hist.outside = float(state["outside"])
+        return hist
+
+    # ---------- Auswertung ----------
+    def _axis(self, axis: int | str) -> int:
+        return self.names.index(axis) if isinstance(axis, str) else axis
+
+    def project(self, axes: Sequence[int | str]) -> np.ndarray:
+        """Randverteilung über die übrigen Achsen summiert, Achsen in der angegebenen Reihenfolge."""
+        axes = [self._axis(a) for a in axes]
+        rest = tuple(a for a in range(len(self.shape)) if a not in axes)
+        counts = self.counts.sum(axis=rest) if rest else self.counts
+        order = sorted(axes)
+        return np.transpose(counts, [order.index(a) for a in axes])
+
+    def hist1d(self, axis: int | str = 0, *, percent: bool = True, scale: float = 1.0, **kwargs):
+        """render.Hist1D der Randverteilung einer Achse."""
+        from render import Hist1D
+
+        a = self._axis(axis)
+        counts = self.project([a])
+        counts = counts * (100.0 / max(counts.sum(), 1)) if percent else counts
+        return Hist1D(counts, self.edges[a] / scale, **kwargs)
+
+    def hist2d(self, axes: Sequence[int | str] = (0, 1), **kwargs):
+        """render.Hist2D der Randverteilung zweier Achsen (Dichtebild statt hexbin/Scatter)."""
+        from render import Hist2D
+
+        a, b = (self._axis(x) for x in axes)
+        return Hist2D(self.project([a, b]), self.edges[a], self.edges[b], **kwargs)
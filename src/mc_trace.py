@@ -0,0 +1,149 @@
+"""
+Instrumentierung der Simulationsläufe: Zeit und Speicher je Stufe.
+
+Ein Lauf (trace_run) besteht aus Stufen wie sample → evaluate → reduce → render.
+Je Stufe werden Wandzeit, CPU-Zeit, Spitzen-RSS und – falls angegeben –
+Samples/s erfasst. Beim Verlassen des Laufs werden zwei Dateien geschrieben:
+
+    <name>_<Zeitstempel>_<pid>.json          maschinenlesbarer Trace (Liste der Stufen)
+    <name>_<Zeitstempel>_<pid>.trace.json    Chrome-Trace (chrome://tracing, Perfetto)
+
+Zeitstempel auf Mikrosekunden plus Prozess-ID: gleichnamige Läufe kurz
+hintereinander oder parallel überschreiben sich nicht.
+
+Bibliotheksfunktionen (npv_model, …) rufen nur stage(...) auf; ohne aktiven
+Lauf ist das ein No-op, die Kernels bleiben also ohne Trace genauso schnell.
+
+Zielordner: Umgebungsvariable MC_TRACE_DIR, sonst ./traces
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+__all__ = ["Tracer", "trace_run", "stage", "current", "peak_rss_mb"]
+
+_ACTIVE: List["Tracer"] = []
+
+
+def peak_rss_mb() -> float | None:
+    """Bisheriger Spitzen-RSS des Prozesses in MB (None, wenn nicht ermittelbar)."""
+    try:
+        import resource
+    except ImportError:                 # Windows: psutil, falls installiert
+        try:
+            import psutil
+        except ImportError:
+            return None
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) / 1e6
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KiB, macOS: Bytes
+    return peak / 1e6 if sys.platform == "darwin" else peak * 1024 / 1e6
+
+
+class Tracer:
+    def __init__(self, name: str):
+        self.name = name
+        self.t0 = time.perf_counter()
+        self.started = datetime.now()
+        self.records: List[Dict[str, object]] = []
+        self._depth = 0
+
+    @contextmanager
+    def stage(self, name: str, samples: int | None = None, **meta) -> Iterator[Dict[str, object]]:
+        """Misst den Block; das gelieferte dict kann im Block ergänzt werden (z. B. samples)."""
+        rec: Dict[str, object] = {"stage": name, "depth": self._depth, "samples": samples, **meta}
+        rss_before = peak_rss_mb()
+        self._depth += 1
+        start, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield rec
+        finally:
+            wall = time.perf_counter() - start
+            self._depth -= 1
+            rss_after = peak_rss_mb()
+            rec.update(
+                start_s=start - self.t0,
+                wall_s=wall,
+                cpu_s=time.process_time() - cpu,
+                peak_rss_mb=rss_after,
+                # Anstieg des Spitzenwerts während der Stufe (0 = kein neuer Höchststand)
+                peak_rss_growth_mb=None if rss_after is None else rss_after - rss_before,
+            )
+            n = rec.get("samples")
+            rec["samples_per_s"] = n / wall if n and wall > 0 else None
+            self.records.append(rec)
+
+    # ---------- Ausgabe ----------
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "run": self.name,
+            "started": self.started.isoformat(timespec="seconds"),
+            "total_s": time.perf_counter() - self.t0,
+            "stages": sorted(self.records, key=lambda r: r["start_s"]),
+        }
+
+    def chrome_events(self) -> List[Dict[str, object]]:
+        pid = os.getpid()
+        return [
+            {
+                "name": r["stage"], "cat": self.name, "ph": "X", "pid": pid, "tid": 0,
+                "ts": r["start_s"] * 1e6, "dur": r["wall_s"] * 1e6,
+                "args": {k: v for k, v in r.items() if k not in ("stage", "start_s", "wall_s")},
+            }
+            for r in self.records
+        ]
+
+    def write(self, out_dir: str | Path | None = None) -> tuple[Path, Path]:
+        out_dir = Path(out_dir or os.environ.get("MC_TRACE_DIR") or "traces")
+        out_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{self.name}_{self.started:%Y%m%d_%H%M%S_%f}_{os.getpid()}"
+        trace = out_dir / f"{stem}.json"
+        chrome = out_dir / f"{stem}.trace.json"
+        trace.write_text(json.dumps(self.to_dict(), indent=2, default=str), encoding="utf-8")
+        chrome.write_text(json.dumps({"traceEvents": self.chrome_events()}, default=str), encoding="utf-8")
+        return trace, chrome
+
+    def print_summary(self) -> None:
+        for r in sorted(self.records, key=lambda r: r["start_s"]):
+            rate = f"{r['samples_per_s']:>14,.0f} /s" if r["samples_per_s"] else " " * 16
+            rss = f"{r['peak_rss_mb']:8.1f} MB" if r["peak_rss_mb"] is not None else ""
+            print(f"{'  ' * r['depth']}{r['stage']:<{24 - 2 * r['depth']}} {r['wall_s'] * 1e3:10.2f} ms "
+                  f"(CPU {r['cpu_s'] * 1e3:9.2f} ms) {rate} {rss}")
+
+
+@contextmanager
+def trace_run(name: str, out_dir: str | Path | None = None, verbose: bool = False) -> Iterator[Tracer]:
+    """Startet einen Lauf; alle stage()-Aufrufe darin landen in seinem Trace."""
+    tracer = Tracer(name)
+    _ACTIVE.append(tracer)
+    try:
+        yield tracer
+    finally:
+        _ACTIVE.remove(tracer)
+        tracer.write(out_dir)
+        if verbose:
+            tracer.print_summary()
+
+
+def current() -> Tracer | None:
+    return _ACTIVE[-1] if _ACTIVE else None
+
+
+@contextmanager
+def stage(name: str, samples: int | None = None, **meta) -> Iterator[Dict[str, object]]:
+    """Stufe im aktiven Lauf messen; ohne aktiven Lauf nur ein leeres dict."""
+    tracer = current()
+    if tracer is None:
+        yield {}
+        return
+    with tracer.stage(name, samples, **meta) as rec:
+        yield rec
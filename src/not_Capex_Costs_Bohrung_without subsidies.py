@@ -1,6 +1,6 @@
 import numpy as np
 import pandas as pd
-from scipy.stats import truncnorm
+from mc_engine import TruncNormal
 
 #Parameters
 n_sim = 10_000
@@ -8,8 +8,8 @@ rng = np.random.default_rng(42)
 
 # Truncated normal helper
 def truncated_normal(mean, std, low, upp, size, rng):
-    a, b = (low - mean) / std, (upp - mean) / std
-    return truncnorm.rvs(a, b, loc=mean, scale=std, size=size, random_state=rng)
+    # inverse Verteilungsfunktion (ein Durchlauf) statt truncnorm.rvs
+    return TruncNormal(mean, std, low, upp).sample(rng, size)
 
 
 # Pipeline length distribution
@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 
@@ -20,8 +19,17 @@ g          = 0.02     # Wachstumsrate 2%
 r          = 0.06     # Diskontsatz 6%
 N          = 30       # Lebensdauer in Jahren
 
-# --- Excel-Daten einlesen ---
-df = pd.read_excel(r"C:\Users\Marvin\Desktop\Masterarbeit\Opex auswertung_P10 undso.xlsx")
+# --- Excel-Daten einlesen (erst beim ersten Bedarf, damit das Modul importierbar bleibt) ---
+# Quelle bleibt die Excel-Tabelle: compute_npv nimmt die erste passende Zeile,
+# eine andere Tabelle (Zeilen/Reihenfolge) würde die NPVs im Baum ändern
+OPEX_XLSX = r"C:\Users\Marvin\Desktop\Masterarbeit\Opex auswertung_P10 undso.xlsx"
+df = None
+
+def opex_table() -> pd.DataFrame:
+    global df
+    if df is None:
+        df = pd.read_excel(OPEX_XLSX)
+    return df
 
 # Kosten-Mappings
 drilling_map = {"P10": 6_437_353, "P50": 7_038_546, "P90": 7_644_953}
@@ -52,6 +60,7 @@ def compute_npv(path: list[str]) -> float:
     if sb == "approved":
         C_inv -= 0.4 * drilling_map[dr]
     # OPEX-Parameter aus Excel
+    df = opex_table()
     row = df[(df["Bohrkosten €"] == drilling_map[dr]) &
              (df["Pipelinekosten €"] == pipeline_map[pl])].iloc[0]
     O1     = row["Gesamt-OPEX €"]
@@ -77,43 +86,46 @@ def build_tree(level: int = 0, path: list[str] = None, subsidy_applied: bool = F
         inter.children[""] = build_tree(level + 1, path + [v], new_subsidy)
     return node
 
-# Layout
-root = build_tree()
-positions = {}
-edges = []
-def assign_pos(node: Node, depth: int, x_counter: list[int], spacing: int = 6) -> float:
-    y = -depth if node.node_type != "intermediate" else -(depth + 0.5)
-    if not node.children:
-        x = x_counter[0] * spacing
-        x_counter[0] += 1
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    # Layout
+    root = build_tree()
+    positions = {}
+    edges = []
+    def assign_pos(node: Node, depth: int, x_counter: list[int], spacing: int = 6) -> float:
+        y = -depth if node.node_type != "intermediate" else -(depth + 0.5)
+        if not node.children:
+            x = x_counter[0] * spacing
+            x_counter[0] += 1
+            positions[node] = (x, y)
+            return x
+        child_infos = []
+        for lbl, child in node.children.items():
+            cx = assign_pos(child, depth + 1, x_counter, spacing)
+            child_infos.append((cx, lbl, child))
+        x = sum(cx for cx, _, _ in child_infos) / len(child_infos)
         positions[node] = (x, y)
+        for cx, lbl, child in child_infos:
+            edges.append(((positions[node][0], positions[node][1]), (cx, positions[child][1]), lbl))
         return x
-    child_infos = []
-    for lbl, child in node.children.items():
-        cx = assign_pos(child, depth + 1, x_counter, spacing)
-        child_infos.append((cx, lbl, child))
-    x = sum(cx for cx, _, _ in child_infos) / len(child_infos)
-    positions[node] = (x, y)
-    for cx, lbl, child in child_infos:
-        edges.append(((positions[node][0], positions[node][1]), (cx, positions[child][1]), lbl))
-    return x
-assign_pos(root, 0, [0])
+    assign_pos(root, 0, [0])
 
-# Zeichnen
-fig, ax = plt.subplots(figsize=(38, 20))
-ax.set_axis_off()
-for (x0, y0), (x1, y1), label in edges:
-    ax.plot([x0, x1], [y0, y1], linewidth=0.9, color=EDGE_COLOR)
-    if label:
-        xm, ym = (x0 + x1) / 2, (y0 + y1) / 2
-        ax.text(xm, ym, label, ha="center", va="center", fontsize=7)
-for node, (x, y) in positions.items():
-    # Coloring: highlight if subsidy_flag=True
-    if node.subsidy_flag:
-        facecolor = "#FFEBCC"  # light orange
-    else:
-        facecolor = "#EFEFEF" if node.node_type == "intermediate" else ("#CCEFFF" if node.node_type == "leaf" else "#FFFFFF")
-    ax.text(x, y, node.name, ha="center", va="center",
-            bbox=dict(boxstyle="round", pad=0.35, facecolor=facecolor, linewidth=0.8), fontsize=8)
-plt.tight_layout()
-plt.show()
+    # Zeichnen
+    fig, ax = plt.subplots(figsize=(38, 20))
+    ax.set_axis_off()
+    for (x0, y0), (x1, y1), label in edges:
+        ax.plot([x0, x1], [y0, y1], linewidth=0.9, color=EDGE_COLOR)
+        if label:
+            xm, ym = (x0 + x1) / 2, (y0 + y1) / 2
+            ax.text(xm, ym, label, ha="center", va="center", fontsize=7)
+    for node, (x, y) in positions.items():
+        # Coloring: highlight if subsidy_flag=True
+        if node.subsidy_flag:
+            facecolor = "#FFEBCC"  # light orange
+        else:
+            facecolor = "#EFEFEF" if node.node_type == "intermediate" else ("#CCEFFF" if node.node_type == "leaf" else "#FFFFFF")
+        ax.text(x, y, node.name, ha="center", va="center",
+                bbox=dict(boxstyle="round", pad=0.35, facecolor=facecolor, linewidth=0.8), fontsize=8)
+    plt.tight_layout()
+    plt.show()
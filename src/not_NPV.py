@@ -3,11 +3,14 @@ from __future__ import annotations
 import argparse
 import os
 from pathlib import Path
-from typing import Tuple, Sequence
+from typing import TYPE_CHECKING, Tuple, Sequence
 
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
+
+# pandas/matplotlib werden erst in den Funktionen importiert (schneller Import)
+if TYPE_CHECKING:
+    import pandas as pd
+    import matplotlib.pyplot as plt
 
 __all__ = [
     "capex",
@@ -71,6 +74,8 @@ def lcoh_grid(
     lifetime: int = LIFETIME_DEFAULT,
 ) -> pd.DataFrame:
 
+    import pandas as pd
+
     depths = np.arange(*depth_range)
     lengths = np.arange(*length_range)
 
@@ -113,6 +118,8 @@ def plot_contour(
     title_prefix: str | None = None,
 ):
 
+    import matplotlib.pyplot as plt
+
     df_sel = df[df["Pump_share_%"] == pump_share_percent]
     if df_sel.empty:
         raise ValueError(f"Pump_share_% {pump_share_percent} ist im DataFrame nicht vorhanden.")
@@ -140,6 +147,8 @@ def plot_contour(
 
 
 def _cli():
+    import matplotlib.pyplot as plt
+
     parser = argparse.ArgumentParser(description="Generate LCOH grid and export to CSV (and optionally PNG contour plot).")
     parser.add_argument("--csv", type=Path, default=Path("lcoh_grid.csv"), help="Pfad zur CSV‑Ausgabedatei")
     parser.add_argument("--png", type=Path, default=None, help="Wenn gesetzt, speichere einen Beispiel‑Plot (s=10 %).")
@@ -3,13 +3,16 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
+from result_store import ResultStore
+
 #feste Parameter
 SUBVENTION_RATE   = 0.40      # 40 % der Bohrkosten
 FIX_OPEX_RATE     = 0.02      # 2 % des CAPEX
 FULL_LOAD_HRS     = 8_000     # Volllaststunden pro Jahr
 HEAT_PRICE_EUR_MWH = 170.0    # Wärmepreis
 N_RUNS            = 100_000   # Anzahl Zufallsläufe
-OUT_XLSX          = "monte_opex.xlsx"
+OUT_STORE         = "monte_opex"        # Ergebnisspeicher (Ordner mit .npy-Spalten)
+OUT_XLSX          = "monte_opex.xlsx"   # nur Kennzahlen, mit --excel
 
 #Eingabe holen
 def get_inputs():
@@ -17,13 +20,14 @@ def get_inputs():
     ap.add_argument("--bohr",  type=float, help="Bohrkosten in €")
     ap.add_argument("--pipe",  type=float, help="Pipelinekosten in €")
     ap.add_argument("--power", type=float, help="Thermische Leistung in kW")
+    ap.add_argument("--excel", action="store_true", help="zusätzlich Kennzahlen als Excel speichern")
     args = ap.parse_args()
 
     bohr  = args.bohr  or float(input("Bohrkosten (€): ").replace(" ", ""))
     pipe  = args.pipe  or float(input("Pipelinekosten (€): ").replace(" ", ""))
     power = args.power or float(input("Thermische Leistung (kW): ").replace(" ", ""))
 
-    return bohr, pipe, power
+    return bohr, pipe, power, args.excel
 
 #Simulation
 def simulate(bohr, pipe, power_kw):
@@ -46,12 +50,15 @@ def simulate(bohr, pipe, power_kw):
 
 #Hauptprogramm
 if __name__ == "__main__":
-    bohr, pipe, power = get_inputs()
+    bohr, pipe, power, excel = get_inputs()
     df, fix_opex = simulate(bohr, pipe, power)
 
-    # Excel speichern
-    out_file = Path(OUT_XLSX).resolve()
-    df.to_excel(out_file, index=False)
+    # alle Läufe spaltenweise speichern (statt df.to_excel)
+    store = ResultStore.create(OUT_STORE, bohr=bohr, pipe=pipe, power_kw=power, fix_opex=fix_opex)
+    store.append(df)
+    out_file = store.path.resolve()
+    if excel:
+        store.export_excel(OUT_XLSX)
 
     # Kennzahlen
     stats = df["Total_OPEX_€"].quantile([0.10, 0.50, 0.90]).to_dict()
@@ -64,3 +71,5 @@ if __name__ == "__main__":
     print(f"P50 (Median)       : {stats[0.50]:,.0f} €")
     print(f"P90 (90-Perzentil) : {stats[0.90]:,.0f} €")
     print(f"\nAlle {N_RUNS:,} Läufe wurden in '{out_file.name}' gespeichert.")
+    if excel:
+        print(f"Kennzahlen als Excel: '{OUT_XLSX}'")
@@ -0,0 +1,429 @@
+"""
+NPV-Modell auf Basis der gemeinsamen Monte-Carlo-Engine (mc_engine.py).
+
+Ein Szenario beschreibt Eingangsverteilungen (CAPEX, Q, OPEX₁) und die festen
+Modellparameter; simulate_npv() zieht einen Stichproben-Block und wertet die
+Cashflows in einem vektorisierten Durchlauf aus. Die NPV-Skripte sind damit nur
+noch Konfiguration + Plot.
+
+simulate_scenarios() wertet mehrere Szenarien (z. B. Bohrkosten P10/P50/P90,
+mit/ohne Förderung) gemeinsam aus: alle Szenarien teilen dieselben
+Zufallszahlen (Common Random Numbers), die Parameter werden als (S, 1)-Spalten
+gegen die (S, N)-Stichproben gebroadcastet → Ergebnis (Szenarien, Ziehungen).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields, replace
+from functools import partial
+from typing import Dict, Mapping, Sequence
+
+import numpy as np
+
+from mc_engine import DTYPES, Lognormal, as_distribution, sample_block
+from mc_parallel import run_chunks
+from mc_stats import StreamStats
+from mc_trace import stage
+from sample_cache import MemoryCache, SampleCache, cache_key, cached_sample_block
+
+__all__ = [
+    "NPVScenario",
+    "lognormal_scenario",
+    "annuity_factor",
+    "capital_recovery_factor",
+    "pv_factor_escalating",
+    "kahan_rowsum",
+    "npv_matrix",
+    "npv_closed_form",
+    "npv_kernel",
+    "check_npv_kernels",
+    "simulate_npv",
+    "simulate_npv_stream",
+    "npv_stats",
+    "scenario_axis",
+    "scenario_block",
+    "npv_scenarios",
+    "lcoh_scenarios",
+    "simulate_scenarios",
+]
+
+
+@dataclass
+class NPVScenario:
+    # Eingangsverteilungen: "capex" (€), "q" (GWh_th/a), "opex1" (€ im 1. Jahr)
+    inputs: Mapping[str, object]
+    price_per_mwh: float = 80.0     # €/MWh
+    opex_growth: float = 0.02       # +2 % p. a.
+    discount_rate: float = 0.06     # 6 % p. a.
+    years: int = 30                 # Projektlaufzeit
+    maint_pct: float = 0.0          # Wartung als Anteil am CAPEX (in OPEX₁ enthalten)
+    subsidy: float = 0.0            # Förderquote auf den CAPEX (z. B. 0.40)
+    n_sim: int = 10_000
+    seed: int = 42
+    sampler: str = "pseudo"         # "pseudo", "sobol" oder "lhs" (siehe mc_engine)
+    dtype: str = "float64"          # "float32": halber Speicher, Genauigkeit siehe mc_precision
+    name: str = ""
+
+    def replace(self, **changes) -> "NPVScenario":
+        return replace(self, **changes)
+
+    def key_parts(self) -> dict:
+        """Alle Felder (inkl. Verteilungsparameter) für Cache-Schlüssel."""
+        parts = {f.name: getattr(self, f.name) for f in fields(self) if f.name != "name"}
+        parts["inputs"] = dict(self.inputs)
+        return parts
+
+
+def lognormal_scenario(
+    capex: Sequence[float],
+    q: Sequence[float],
+    opex: Sequence[float],
+    **kwargs,
+) -> NPVScenario:
+    """Kurzform: alle drei Eingänge als Log-Normal über (P10, P50, P90)."""
+    return NPVScenario(
+        inputs={"capex": Lognormal(*capex), "q": Lognormal(*q), "opex1": Lognormal(*opex)},
+        **kwargs,
+    )
+
+
+def annuity_factor(rate: float, years: int) -> float:
+    """Barwertfaktor Σ_{t=1..n} (1+r)^-t einer konstanten Rente."""
+    if rate == 0:
+        return float(years)
+    return (1.0 - (1.0 + rate) ** -years) / rate
+
+
+def capital_recovery_factor(rate: float, years: int) -> float:
+    """Kapitalwiedergewinnungsfaktor (CRF) = 1 / Rentenbarwertfaktor (wie calc_crf im LCOH-Skript)."""
+    return 1.0 / annuity_factor(rate, years)
+
+
+def pv_factor_escalating(g: float, r: float, n: int) -> float:
+    """Barwertfaktor Σ_{t=1..n} (1+g)^(t-1) / (1+r)^t einer wachsenden Rente (wie im LCOH-Skript)."""
+    if g == r:
+        return n / (1 + r)
+    return ((1 + g) ** n - (1 + r) ** n) / ((g - r) * (1 + r) ** n)
+
+
+def kahan_rowsum(m: np.ndarray) -> np.ndarray:
+    """
+    Zeilensummen einer (N, T)-Matrix mit Kahan-Kompensation über die T Spalten.
+    Für float32, wo der Rundungsfehler sonst mit T wächst.
+    """
+    total = np.zeros(m.shape[0], dtype=m.dtype)
+    comp = np.zeros_like(total)
+    for j in range(m.shape[1]):
+        y = m[:, j] - comp
+        t = total + y
+        comp = (t - total) - y
+        total = t
+    return total
+
+
+def _net_capex(capex: np.ndarray, scenario: NPVScenario) -> np.ndarray:
+    return capex * (1.0 - scenario.subsidy) if scenario.subsidy else capex
+
+
+def _opex_base(capex: np.ndarray, opex1: np.ndarray, scenario: NPVScenario) -> np.ndarray:
+    if not scenario.maint_pct:
+        return opex1
+    maint = scenario.maint_pct * capex
+    return opex1 + (maint[:, None] if np.ndim(opex1) == 2 else maint)
+
+
+def npv_matrix(
+    capex: np.ndarray,
+    q: np.ndarray,
+    opex1: np.ndarray,
+    scenario: NPVScenario,
+    *,
+    discount_rate: float | None = None,
+) -> np.ndarray:
+    """
+    Jahres-Cashflows als (N, YEARS)-Matrix, abgezinst und aufsummiert → NPV je Ziehung.
+
+    q bzw. opex1 dürfen auch schon Jahresreihen der Form (N, YEARS) sein
+    (z. B. abnehmende Wärmeproduktion); dann wird keine Eskalation angewandt.
+    """
+    rate = scenario.discount_rate if discount_rate is None else discount_rate
+    capex = _net_capex(capex, scenario)
+
+    # Zeitreihen-Faktoren (im dtype der Stichproben, float32 bleibt float32)
+    dtype = np.result_type(capex, q, opex1)
+    t = np.arange(1, scenario.years + 1)
+    discount = (1.0 / (1.0 + rate) ** t).astype(dtype, copy=False)
+    opex_fac = ((1.0 + scenario.opex_growth) ** (t - 1)).astype(dtype, copy=False)
+
+    # Jahres-Cashflows
+    opex_base = _opex_base(capex, opex1, scenario)
+    q_year = q[:, None] if np.ndim(q) == 1 else q
+    revenue = q_year * 1_000 * scenario.price_per_mwh                                 # €/a
+    opex_year = opex_base[:, None] * opex_fac if np.ndim(opex_base) == 1 else opex_base  # €/a
+    net_cf = revenue - opex_year
+
+    # Abgezinste Operationen & NPV
+    disc_cf = net_cf * discount
+    disc_ops = kahan_rowsum(disc_cf) if disc_cf.dtype == np.float32 else disc_cf.sum(axis=1)
+    return -capex + disc_ops
+
+
+def npv_closed_form(
+    capex: np.ndarray,
+    q: np.ndarray,
+    opex1: np.ndarray,
+    scenario: NPVScenario,
+    *,
+    discount_rate: float | None = None,
+) -> np.ndarray:
+    """
+    NPV in O(1) je Ziehung: konstante Erlöse und geometrisch wachsende OPEX
+    reduzieren die abgezinste Summe auf zwei skalare Rentenfaktoren.
+    """
+    rate = scenario.discount_rate if discount_rate is None else discount_rate
+    a_rev = annuity_factor(rate, scenario.years)
+    a_opex = pv_factor_escalating(scenario.opex_growth, rate, scenario.years)
+    capex = _net_capex(capex, scenario)
+    opex_base = _opex_base(capex, opex1, scenario)
+    return -capex + q * (1_000 * scenario.price_per_mwh * a_rev) - opex_base * a_opex
+
+
+def npv_kernel(
+    capex: np.ndarray,
+    q: np.ndarray,
+    opex1: np.ndarray,
+    scenario: NPVScenario,
+    *,
+    discount_rate: float | None = None,
+    method: str = "auto",
+) -> np.ndarray:
+    """
+    Wählt den NPV-Pfad: "closed" (Rentenfaktoren), "matrix" (Jahresmatrix) oder
+    "auto" – geschlossen, solange Q und OPEX₁ je Ziehung skalar sind; bei
+    Jahresreihen (unregelmäßige Cashflows) automatisch die Matrix.
+    """
+    if method == "auto":
+        method = "closed" if np.ndim(q) <= 1 and np.ndim(opex1) <= 1 else "matrix"
+    if method == "closed":
+        return npv_closed_form(capex, q, opex1, scenario, discount_rate=discount_rate)
+    if method == "matrix":
+        return npv_matrix(capex, q, opex1, scenario, discount_rate=discount_rate)
+    raise ValueError(f"Unbekannte Methode '{method}' (auto, closed, matrix)")
+
+
+def check_npv_kernels(
+    scenario: NPVScenario,
+    n_sim: int = 10_000,
+    seed: int | None = None,
+    *,
+    rtol: float = 1e-9,
+) -> float:
+    """
+    Äquivalenzprüfung: wertet dieselben Ziehungen über beide Pfade aus und
+    liefert die max. Abweichung relativ zur NPV-Spannweite. Wirft ValueError,
+    wenn sie rtol überschreitet.
+    """
+    block = sample_block(scenario.inputs, n_sim, scenario.seed if seed is None else seed)
+    args = (block["capex"], block["q"], block["opex1"], scenario)
+    ref = npv_matrix(*args)
+    fast = npv_closed_form(*args)
+    scale = max(np.abs(ref).max(), 1.0)
+    err = float(np.abs(fast - ref).max() / scale)
+    if err > rtol:
+        raise ValueError(f"Geschlossene NPV-Formel weicht um {err:.2e} (relativ) vom Matrix-Pfad ab")
+    return err
+
+
+def simulate_npv(
+    scenario: NPVScenario,
+    n_sim: int | None = None,
+    seed: int | None = None,
+    *,
+    method: str = "auto",
+    cache: SampleCache | None = None,
+) -> tuple[Dict[str, np.ndarray], np.ndarray]:
+    """
+    Zieht einen Block und liefert (Stichproben, NPV-Array).
+
+    Mit cache=SampleCache() werden die Ziehungen spaltenweise wiederverwendet
+    (gleicher Seed, N und Sampler → identische Werte, siehe sample_cache).
+    """
+    n = scenario.n_sim if n_sim is None else n_sim
+    with stage("sample", n):
+        block = cached_sample_block(scenario.inputs, n, scenario.seed if seed is None else seed,
+                                    scenario.sampler, cache, scenario.dtype)
+    with stage("evaluate", n, method=method):
+        npv = npv_kernel(block["capex"], block["q"], block["opex1"], scenario, method=method)
+    return block, npv
+
+
+def _npv_chunk(scenario: NPVScenario, method: str, rng: np.random.Generator, size: int) -> StreamStats:
+    block = sample_block(scenario.inputs, size, rng, scenario.sampler, scenario.dtype)
+    npv = npv_kernel(block["capex"], block["q"], block["opex1"], scenario, method=method)
+    return StreamStats(thresholds=(0.0,)).update(npv).compact()
+
+
+def simulate_npv_stream(
+    scenario: NPVScenario,
+    n_sim: int | None = None,
+    seed: int | np.random.SeedSequence | None = None,
+    *,
+    chunk_size: int = 250_000,
+    method: str = "auto",
+    workers: int | None = 1,
+    cache: SampleCache | None = None,
+) -> StreamStats:
+    """
+    Wie simulate_npv, aber blockweise: Stichproben werden in Chunks gezogen und
+    sofort in laufende Momente + t-digest reduziert. Der Speicherbedarf hängt nur
+    von chunk_size ab, nicht von n_sim.
+
+    Jeder Chunk zieht aus einem eigenen SeedSequence-Kindstream (mc_parallel),
+    daher ist das Ergebnis für workers=1 und workers=64 bitgleich. Die
+    Einzelwerte unterscheiden sich aber von simulate_npv mit gleichem Seed.
+    """
+    n = scenario.n_sim if n_sim is None else n_sim
+    seed = scenario.seed if seed is None else seed
+
+    # reduzierte Statistik hängt nicht von workers ab → gehört nicht in den Schlüssel
+    key = cache_key("npv_stream", scenario.key_parts(), n, seed, chunk_size, method) if cache else None
+    if cache is not None:
+        state = cache.get_stats(key)
+        if state is not None:
+            return StreamStats.from_state(state)
+
+    task = partial(_npv_chunk, scenario, method)
+    # Ziehen, Auswerten und Reduzieren laufen je Chunk (ggf. in Worker-Prozessen) → eine Stufe
+    with stage("sample+evaluate+reduce", n, chunk_size=chunk_size, workers=workers):
+        stats = run_chunks(task, n, seed, chunk_size=chunk_size, workers=workers)
+    if cache is not None:
+        cache.put_stats(key, stats.state())
+    return stats
+
+
+def npv_stats(npv: np.ndarray) -> Dict[str, float]:
+    """Kennzahlen wie in NPV_gut.py (in M€, außer Wahrscheinlichkeit)."""
+    return {
+        "Mean NPV (M€)"  : np.mean(npv)        / 1e6,
+        "Median NPV (M€)": np.median(npv)      / 1e6,
+        "P05 NPV (M€)"   : np.percentile(npv, 5)  / 1e6,
+        "P10 NPV (M€)"   : np.percentile(npv, 10) / 1e6,
+        "P90 NPV (M€)"   : np.percentile(npv, 90) / 1e6,
+        "P95 NPV (M€)"   : np.percentile(npv, 95) / 1e6,
+        "Prob NPV < 0"   : np.mean(npv < 0),
+    }
+
+
+# ----------------------------- Szenario-Achse -----------------------------
+def scenario_axis(scenarios: Sequence[NPVScenario], dtype=np.float64) -> Dict[str, np.ndarray]:
+    """
+    Skalare Parameter und Rentenfaktoren je Szenario als (S, 1)-Spalten,
+    damit sie direkt gegen (S, N)-Stichproben broadcasten.
+    """
+    def col(values):
+        return np.asarray(values, dtype=dtype)[:, None]
+
+    return {
+        "price": col([sc.price_per_mwh for sc in scenarios]),
+        "maint": col([sc.maint_pct for sc in scenarios]),
+        "subsidy": col([sc.subsidy for sc in scenarios]),
+        "a_rev": col([annuity_factor(sc.discount_rate, sc.years) for sc in scenarios]),
+        "a_opex": col([pv_factor_escalating(sc.opex_growth, sc.discount_rate, sc.years) for sc in scenarios]),
+        "crf": col([capital_recovery_factor(sc.discount_rate, sc.years) for sc in scenarios]),
+    }
+
+
+def scenario_block(
+    scenarios: Sequence[NPVScenario],
+    n: int,
+    seed: int | np.random.SeedSequence = 42,
+    sampler: str = "pseudo",
+    cache: SampleCache | None = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Stichproben aller Szenarien als {name: (S, N)} mit Common Random Numbers.
+
+    pseudo: jedes Szenario zieht aus demselben Seed. Für Verteilungen mit
+    parameterunabhängigem Zufallszahlen-Verbrauch (stream_invariant) ist das
+    exakt dieselbe Standard-Zufallszahl je Ziehung – und jede Zeile ist
+    bitgleich zu simulate_npv des Einzelszenarios. Gleiche Spalten (z. B. Q,
+    OPEX) werden über den Cache nur einmal gezogen – ohne cache über einen
+    MemoryCache für diesen Aufruf. Der Strom wird je Szenario nur bis zur
+    letzten abweichenden Spalte durchlaufen; unterscheidet sich nur CAPEX,
+    kostet jedes weitere Szenario eine Spalte statt eines ganzen Blocks.
+    Sonst (sobol/lhs oder nicht-invariante Verteilungen): eine gemeinsame
+    Punktmenge u, je Szenario über ppf transformiert.
+    """
+    from mc_engine import uniform_points
+
+    names = list(scenarios[0].inputs)
+    if any(list(sc.inputs) != names for sc in scenarios):
+        raise ValueError("Alle Szenarien brauchen dieselben Eingangsgrößen in derselben Reihenfolge")
+
+    dists = [[as_distribution(sc.inputs[name]) for name in names] for sc in scenarios]
+    invariant = all(getattr(d, "stream_invariant", False) for row in dists for d in row)
+    if sampler == "pseudo" and invariant:
+        cache = MemoryCache() if cache is None else cache
+        rows = [cached_sample_block(sc.inputs, n, seed, sampler, cache, scenarios[0].dtype) for sc in scenarios]
+        return {name: np.stack([row[name] for row in rows]) for name in names}
+
+    rng = np.random.default_rng(seed)
+    u = rng.random((n, len(names))) if sampler == "pseudo" else uniform_points(sampler, n, len(names), rng)
+    dtype = DTYPES.get(scenarios[0].dtype, scenarios[0].dtype)
+    return {name: np.stack([row[j].ppf(u[:, j]) for row in dists]).astype(dtype, copy=False)
+            for j, name in enumerate(names)}
+
+
+def npv_scenarios(
+    capex: np.ndarray,
+    q: np.ndarray,
+    opex1: np.ndarray,
+    scenarios: Sequence[NPVScenario],
+) -> np.ndarray:
+    """Geschlossene NPV-Formel (wie npv_closed_form) für (S, N)-Eingänge in einem Durchlauf."""
+    ax = scenario_axis(scenarios, np.result_type(capex, q, opex1))
+    capex = capex * (1.0 - ax["subsidy"])
+    opex_base = opex1 + ax["maint"] * capex
+    return -capex + q * (1_000 * ax["price"] * ax["a_rev"]) - opex_base * ax["a_opex"]
+
+
+def lcoh_scenarios(
+    capex: np.ndarray,
+    q: np.ndarray,
+    opex1: np.ndarray,
+    scenarios: Sequence[NPVScenario],
+) -> np.ndarray:
+    """
+    Wärmegestehungskosten (€/MWh) wie im LCOH-Skript:
+        LCOH = CRF · (CAPEX_netto + OPEX₁ · PV-Faktor_wachsend) / Wärme
+    mit OPEX₁ = variable OPEX + maint_pct · CAPEX_netto und Wärme = Q · 1000 MWh/a.
+    """
+    ax = scenario_axis(scenarios, np.result_type(capex, q, opex1))
+    capex = capex * (1.0 - ax["subsidy"])
+    opex_base = opex1 + ax["maint"] * capex
+    return ax["crf"] * (capex + opex_base * ax["a_opex"]) / (q * 1_000)
+
+
+def simulate_scenarios(
+    scenarios: Sequence[NPVScenario],
+    n_sim: int | None = None,
+    seed: int | None = None,
+    *,
+    metric: str = "npv",
+    cache: SampleCache | None = None,
+) -> tuple[Dict[str, np.ndarray], np.ndarray]:
+    """
+    Alle Szenarien in einem vektorisierten Durchlauf: liefert
+    ({name: (S, N)}, Ergebnis (S, N)) mit metric="npv" (€) oder "lcoh" (€/MWh).
+    N, Seed und Sampler kommen aus dem ersten Szenario, falls nicht angegeben.
+    """
+    kernels = {"npv": npv_scenarios, "lcoh": lcoh_scenarios}
+    if metric not in kernels:
+        raise ValueError(f"Unbekannte Kennzahl '{metric}' (npv, lcoh)")
+    first = scenarios[0]
+    n = first.n_sim if n_sim is None else n_sim
+    with stage("sample", n * len(scenarios), scenarios=len(scenarios)):
+        block = scenario_block(scenarios, n, first.seed if seed is None else seed, first.sampler, cache)
+    with stage("evaluate", n * len(scenarios), metric=metric):
+        values = kernels[metric](block["capex"], block["q"], block["opex1"], scenarios)
+    return block, values
@@ -0,0 +1,267 @@
+"""
+Szenario-Dateien + Abhängigkeitsgraph der Arbeit statt kopierter Zahlen.
+
+    heat ──┐
+    opex ──┼──► npv ──► decision
+    capex ─┘
+
+Jede Stufe bekommt ihren Abschnitt aus der Szenario-Datei (TOML, optional YAML)
+und die Ergebnisse ihrer Vorgänger. Ergebnisse werden im SampleCache abgelegt;
+der Schlüssel einer Stufe hängt von ihren Parametern, ihrem Quelltext und den
+Schlüsseln der Vorgänger ab. Ändert sich ein Parameter, werden nur diese Stufe
+und ihre Nachfolger neu gerechnet.
+
+Aufruf:
+    python pipeline.py scenarios/basis.toml
+    python pipeline.py scenarios/basis.toml --set npv.price_per_mwh=90
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import inspect
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from mc_trace import stage as trace_stage, trace_run
+from sample_cache import SampleCache, cache_key
+
+__all__ = [
+    "Stage",
+    "STAGES",
+    "pipeline_stage",
+    "load_scenario",
+    "stage_order",
+    "run_pipeline",
+]
+
+
+@dataclass
+class Stage:
+    name: str
+    fn: Callable[..., Dict[str, np.ndarray]]
+    deps: Tuple[str, ...] = ()
+
+    def code_hash(self) -> str:
+        # Quelltext der Stufe geht in den Schlüssel ein → Code-Änderung = neu rechnen
+        return hashlib.sha256(inspect.getsource(self.fn).encode("utf-8")).hexdigest()[:16]
+
+
+# Registry wie in mc_engine: Name → Stufe
+STAGES: Dict[str, Stage] = {}
+
+
+def pipeline_stage(name: str, deps: Sequence[str] = ()):
+    def deco(fn):
+        STAGES[name] = Stage(name, fn, tuple(deps))
+        return fn
+    return deco
+
+
+def load_scenario(path: str | Path) -> Dict[str, object]:
+    """Liest eine Szenario-Datei (.toml, .yaml/.yml)."""
+    path = Path(path)
+    if path.suffix in (".yaml", ".yml"):
+        import yaml
+
+        return yaml.safe_load(path.read_text(encoding="utf-8"))
+    try:
+        import tomllib
+    except ImportError:         # Python < 3.11
+        import tomli as tomllib
+    with path.open("rb") as f:
+        return tomllib.load(f)
+
+
+def _percentiles(x: np.ndarray) -> np.ndarray:
+    return np.percentile(x, [10, 50, 90])
+
+
+# ----------------------------- Stufen -----------------------------
+@pipeline_stage("heat")
+def heat_stage(cfg: Mapping[str, object]) -> Dict[str, np.ndarray]:
+    """
+    Jahreswärme Q (GWh_th/a) wie heatproduktion_MC.py. Mit [[heat.layers]]
+    statt `gradient` gilt das geschichtete Temperaturprofil (layered_gradient).
+    """
+    from Pth import Pth, b, c_p
+    from massenstrom import m_dot
+
+    rng = np.random.default_rng(cfg["seed"])
+    x = rng.uniform(*cfg["depth_m"], cfg["n_sim"])
+    if "layers" in cfg:
+        from layered_gradient import LayeredGradient, layers_from_config
+
+        model = LayeredGradient(layers_from_config(cfg["layers"]), b=b)
+        p = model.power(x, model.sample_gradients(cfg["n_sim"], rng), m_dot=m_dot, c_p=c_p)
+    else:
+        g = rng.uniform(*cfg["gradient"], cfg["n_sim"])
+        p = Pth(x, g, m_dot=m_dot, c_p=c_p, b=b)
+    q = p * cfg["full_load_hours"] / 1e9
+    return {"q_gwh": q, "q_p10_p50_p90": _percentiles(q)}
+
+
+@pipeline_stage("opex")
+def opex_stage(cfg: Mapping[str, object]) -> Dict[str, np.ndarray]:
+    """
+    OPEX im 1. Jahr (fix + variabel) wie JPD_OPEX_N_2 Bohrungen richtig.py,
+    die Schleife über die Pumpenanteile vektorisiert (np.interp statt interp1d).
+    Der CAPEX-Anteil (2 %) wird in der NPV-Stufe über maint_pct addiert.
+    """
+    rng = np.random.default_rng(cfg["seed"])
+    n = cfg["n_sim"]
+    z = 2 * 1.2816          # P90 − P10 ≈ 2 · 1.2816 · σ
+    pct = np.asarray(cfg["pump_share_pct"], dtype=float)
+    var_p10, var_p50, var_p90 = (np.asarray(cfg[k], dtype=float) for k in ("var_p10", "var_p50", "var_p90"))
+    fix_p10, fix_p50, fix_p90 = cfg["fix_p10_p50_p90"]
+
+    share = rng.uniform(pct[0], pct[-1], n)
+    mu_var = np.interp(share, pct, var_p50)
+    sigma_var = np.interp(share, pct, (var_p90 - var_p10) / z)
+    fix = rng.normal(fix_p50, (fix_p90 - fix_p10) / z, n)
+    var = rng.normal(mu_var, sigma_var)
+    opex = fix + var
+    return {"opex1": opex, "opex_p10_p50_p90": _percentiles(opex)}
+
+
+@pipeline_stage("capex")
+def capex_stage(cfg: Mapping[str, object]) -> Dict[str, np.ndarray]:
+    """Netto-CAPEX = Bohrkosten · (1 − Förderung) + Pipeline, wie JPD_capex_n.py."""
+    from Drilling_MC import drilling_cost
+    from mc_engine import TruncNormal, sample_block
+
+    block = sample_block(
+        {"depth": TruncNormal(*cfg["depth_m"]), "length": TruncNormal(*cfg["pipeline_length_m"])},
+        cfg["n_sim"], cfg["seed"],
+    )
+    drilling = drilling_cost(block["depth"]) * (1.0 - cfg["subsidy"])
+    capex = drilling + cfg["pipeline_eur_per_m"] * block["length"]
+    return {"capex": capex, "capex_p10_p50_p90": _percentiles(capex)}
+
+
+@pipeline_stage("npv", deps=("heat", "opex", "capex"))
+def npv_stage(cfg: Mapping[str, object], heat, opex, capex) -> Dict[str, np.ndarray]:
+    """NPV wie NPV Bohrkosten_alle Ps_richtig.py – P10/P50/P90 der Vorstufen statt Handkopie."""
+    from npv_model import lognormal_scenario, simulate_npv
+
+    scenario = lognormal_scenario(
+        capex=tuple(capex["capex_p10_p50_p90"]),
+        q=tuple(heat["q_p10_p50_p90"]),
+        opex=tuple(opex["opex_p10_p50_p90"]),
+        **{k: cfg[k] for k in ("price_per_mwh", "opex_growth", "discount_rate", "years",
+                               "maint_pct", "n_sim", "seed") if k in cfg},
+    )
+    _, npv = simulate_npv(scenario)
+    return {"npv": npv, "npv_p10_p50_p90": _percentiles(npv), "npv_mean": np.mean(npv),
+            "prob_loss": np.mean(npv < 0)}
+
+
+@pipeline_stage("decision", deps=("npv",))
+def decision_stage(cfg: Mapping[str, object], npv) -> Dict[str, np.ndarray]:
+    """EMV der Bohrentscheidung wie Decision tree.py (mean_success aus der NPV-Stufe)."""
+    p = cfg["p_success"]
+    mean_success = float(npv["npv_mean"]) / 1e6                 # Mio €
+    emv = p * mean_success + (1 - p) * cfg["npv_failure_meur"]
+    return {"mean_success_meur": mean_success, "emv_meur": emv}
+
+
+# ----------------------------- Runner -----------------------------
+def stage_order(targets: Sequence[str] | None = None) -> list:
+    """Topologische Reihenfolge aller Stufen, die für `targets` nötig sind."""
+    order, seen = [], set()
+
+    def visit(name, path=()):
+        if name in path:
+            raise ValueError(f"Zyklus im Stufengraph: {' → '.join(path + (name,))}")
+        if name in seen:
+            return
+        if name not in STAGES:
+            raise KeyError(f"Unbekannte Stufe '{name}' (bekannt: {sorted(STAGES)})")
+        for dep in STAGES[name].deps:
+            visit(dep, path + (name,))
+        seen.add(name)
+        order.append(name)
+
+    for name in targets or STAGES:
+        visit(name)
+    return order
+
+
+def run_pipeline(
+    config: Mapping[str, Mapping[str, object]],
+    targets: Sequence[str] | None = None,
+    *,
+    cache: SampleCache | None = None,
+    force: Sequence[str] = (),
+    verbose: bool = True,
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Führt die Stufen in Abhängigkeitsreihenfolge aus und liefert {Stufe: Ergebnis}.
+    Stufen mit unverändertem Schlüssel kommen aus dem Cache; `force` rechnet
+    die genannten Stufen immer neu (der Schlüssel kennt nur den Quelltext der
+    Stufe selbst, nicht den importierter Module wie Pth oder npv_model).
+    """
+    cache = SampleCache() if cache is None else cache
+    keys: Dict[str, str] = {}
+    results: Dict[str, Dict[str, np.ndarray]] = {}
+
+    for name in stage_order(targets):
+        st = STAGES[name]
+        cfg = config.get(name, {})
+        keys[name] = cache_key("stage", name, st.code_hash(), cfg, [keys[d] for d in st.deps])
+
+        out = None if name in force else cache.get_stats(keys[name])
+        status = "Cache"
+        if out is None:
+            with trace_stage(name, cfg.get("n_sim")):
+                out = st.fn(cfg, **{d: results[d] for d in st.deps})
+            out = {k: np.asarray(v) for k, v in out.items()}
+            cache.put_stats(keys[name], out)
+            status = "neu gerechnet"
+        results[name] = out
+        if verbose:
+            print(f"{name:<10} {status:<14} {keys[name][:12]}")
+    return results
+
+
+def _apply_override(config: dict, item: str) -> None:
+    # "npv.price_per_mwh=90" → config["npv"]["price_per_mwh"] = 90
+    path, _, raw = item.partition("=")
+    section, _, key = path.partition(".")
+    try:
+        import tomllib
+    except ImportError:
+        import tomli as tomllib
+    config.setdefault(section, {})[key] = tomllib.loads(f"v = {raw}")["v"]
+
+
+def _cli():
+    ap = argparse.ArgumentParser(description="Szenario-Pipeline heat → opex → capex → npv → decision")
+    ap.add_argument("scenario", type=Path, help="Szenario-Datei (.toml / .yaml)")
+    ap.add_argument("--target", nargs="+", default=None, help="nur diese Stufen (inkl. Vorgänger)")
+    ap.add_argument("--set", dest="overrides", action="append", default=[], metavar="STUFE.PARAM=WERT")
+    ap.add_argument("--force", nargs="+", default=[], help="Stufen unabhängig vom Cache neu rechnen")
+    args = ap.parse_args()
+
+    config = load_scenario(args.scenario)
+    for item in args.overrides:
+        _apply_override(config, item)
+
+    with trace_run(f"pipeline_{args.scenario.stem}"):
+        res = run_pipeline(config, args.target, force=args.force)
+
+    if "npv" in res:
+        p10, p50, p90 = res["npv"]["npv_p10_p50_p90"] / 1e6
+        print(f"\nNPV  P10 {p10:,.2f}  P50 {p50:,.2f}  P90 {p90:,.2f} Mio €   "
+              f"P(NPV<0) = {float(res['npv']['prob_loss']):.3f}")
+    if "decision" in res:
+        print(f"EMV  {float(res['decision']['emv_meur']):,.2f} Mio €  "
+              f"(Erfolg Ø {float(res['decision']['mean_success_meur']):,.2f} Mio €)")
+
+
+if __name__ == "__main__":
+    _cli()
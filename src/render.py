@@ -0,0 +1,266 @@
+"""
+Headless Abbildungs-Pipeline: Simulation und Darstellung sind getrennt.
+
+• Die Simulation bint einmal (np.histogram / np.histogram2d) und gibt nur
+  kleine Figure-Spezifikationen weiter – keine 100k-Rohdaten-Arrays.
+• render_all() zeichnet alle Spezifikationen mit dem Agg-Backend in einem
+  Prozess-Pool als PNG/SVG, ohne Fenster und ohne plt.show().
+
+Aufruf (alle Abbildungen der Arbeit nach figures/):
+    python render.py --out figures --formats png svg
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+__all__ = [
+    "Hist1D",
+    "Hist2D",
+    "Panel",
+    "FigureSpec",
+    "hist1d",
+    "hist2d",
+    "render",
+    "render_all",
+    "thesis_figures",
+]
+
+
+@dataclass
+class Hist1D:
+    counts: np.ndarray          # Höhe je Bin (bei percent=True in %)
+    edges: np.ndarray
+    label: str | None = None
+    color: str | None = None
+    step: bool = False          # nur Umriss (für überlagerte Verteilungen)
+
+
+@dataclass
+class Hist2D:
+    counts: np.ndarray          # (nx, ny) wie np.histogram2d
+    xedges: np.ndarray
+    yedges: np.ndarray
+    log: bool = True            # Farbskala log₁₀(N) wie hexbin(bins="log")
+    cmap: str = "viridis"
+    cbar_label: str = "log₁₀(N)"
+
+
+@dataclass
+class Panel:
+    layers: List[object] = field(default_factory=list)   # Hist1D / Hist2D
+    xlabel: str = ""
+    ylabel: str = ""
+    title: str = ""
+    vlines: List[Tuple[float, str | None]] = field(default_factory=list)   # (x, Legende)
+    bands: List[Tuple[float, float]] = field(default_factory=list)         # (x_lo, x_hi), z. B. KI
+
+
+@dataclass
+class FigureSpec:
+    name: str                                  # Dateiname ohne Endung
+    panels: List[Panel]
+    title: str = ""
+    figsize: Tuple[float, float] = (8, 5)
+
+
+def hist1d(
+    x: np.ndarray,
+    bins: int | np.ndarray = 50,
+    *,
+    scale: float = 1.0,
+    percent: bool = True,
+    range: Tuple[float, float] | None = None,
+    **kwargs,
+) -> Hist1D:
+    """Bint x / scale einmal; percent=True → Anteil in % (wie weights=100/N in den Skripten)."""
+    counts, edges = np.histogram(np.asarray(x) / scale, bins=bins, range=range)
+    counts = counts * (100.0 / max(counts.sum(), 1)) if percent else counts.astype(float)
+    return Hist1D(counts, edges, **kwargs)
+
+
+def hist2d(x: np.ndarray, y: np.ndarray, bins: int = 60, **kwargs) -> Hist2D:
+    """Ersatz für plt.hexbin(x, y, gridsize=60): Rechteck-Bins, einmal gezählt."""
+    counts, xedges, yedges = np.histogram2d(x, y, bins=bins)
+    return Hist2D(counts, xedges, yedges, **kwargs)
+
+
+# ----------------------------- Zeichnen -----------------------------
+def _draw_panel(fig, ax, panel: Panel) -> None:
+    from matplotlib.colors import LogNorm
+
+    for layer in panel.layers:
+        if isinstance(layer, Hist1D):
+            if layer.step:
+                ax.stairs(layer.counts, layer.edges, label=layer.label, color=layer.color)
+            else:
+                ax.stairs(layer.counts, layer.edges, fill=True, label=layer.label, color=layer.color,
+                          edgecolor="white", linewidth=0.5)
+        elif isinstance(layer, Hist2D):
+            counts = np.ma.masked_equal(layer.counts.T, 0)
+            norm = LogNorm() if layer.log else None
+            mesh = ax.pcolormesh(layer.xedges, layer.yedges, counts, cmap=layer.cmap, norm=norm)
+            fig.colorbar(mesh, ax=ax, label=layer.cbar_label)
+        else:
+            raise TypeError(f"Unbekannter Layer-Typ: {type(layer).__name__}")
+
+    for lo, hi in panel.bands:
+        ax.axvspan(lo, hi, alpha=0.2)
+    for x, label in panel.vlines:
+        ax.axvline(x, linestyle="dashed", color="black" if label is None else None, label=label)
+
+    ax.set_xlabel(panel.xlabel)
+    ax.set_ylabel(panel.ylabel)
+    ax.set_title(panel.title)
+    if any(getattr(layer, "label", None) for layer in panel.layers) or any(l for _, l in panel.vlines):
+        ax.legend()
+
+
+def render(spec: FigureSpec, out_dir: str | Path, formats: Sequence[str] = ("png",), dpi: int = 150) -> List[Path]:
+    """Zeichnet eine Spezifikation und speichert sie je Format; liefert die Pfade."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, axes = plt.subplots(1, len(spec.panels), figsize=spec.figsize, squeeze=False)
+    for ax, panel in zip(axes[0], spec.panels):
+        _draw_panel(fig, ax, panel)
+    if spec.title:
+        fig.suptitle(spec.title)
+    fig.tight_layout()
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for fmt in formats:
+        path = out_dir / f"{spec.name}.{fmt}"
+        fig.savefig(path, dpi=dpi)
+        paths.append(path)
+    plt.close(fig)
+    return paths
+
+
+def render_all(
+    specs: Sequence[FigureSpec],
+    out_dir: str | Path,
+    formats: Sequence[str] = ("png", "svg"),
+    workers: int | None = None,
+) -> List[Path]:
+    """Rendert alle Spezifikationen parallel (workers=None → os.cpu_count())."""
+    job = partial(render, out_dir=out_dir, formats=tuple(formats))
+    workers = os.cpu_count() if workers is None else workers
+    if workers <= 1 or len(specs) <= 1:
+        results = list(map(job, specs))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(specs))) as pool:
+            results = list(pool.map(job, specs))
+    return [p for paths in results for p in paths]
+
+
+# ----------------------------- Abbildungen der Arbeit -----------------------------
+def _npv_figures() -> List[FigureSpec]:
+    from NPV_Szenarien_alle import SCENARIOS
+    from npv_model import simulate_scenarios
+
+    _, npv = simulate_scenarios(SCENARIOS)
+    specs = []
+    edges = np.histogram_bin_edges(npv / 1e6, bins=60)      # gemeinsame Bins → vergleichbar
+    overlay = Panel(xlabel="NPV (Million €)", ylabel="Frequency (%)", vlines=[(0.0, None)],
+                    title="Distribution of the Net Present Value – all drilling scenarios")
+    for sc, values in zip(SCENARIOS, npv):
+        overlay.layers.append(hist1d(values, edges, scale=1e6, label=sc.name, step=True))
+
+        p10, p50, p90 = np.percentile(values / 1e6, [10, 50, 90])
+        specs.append(FigureSpec(
+            name="npv_" + sc.name.lower().replace(" ", "_").replace("ö", "oe"),
+            panels=[Panel(
+                layers=[hist1d(values, 50, scale=1e6)],
+                xlabel="NPV (Million €)", ylabel="Frequency (%)",
+                title=f"Distribution of the Net Present Value – {sc.name}",
+                vlines=[(0.0, None), (p10, f"P10 ≈ {p10:,.2f} M€"),
+                        (p50, f"P50 ≈ {p50:,.2f} M€"), (p90, f"P90 ≈ {p90:,.2f} M€")],
+            )],
+        ))
+    specs.append(FigureSpec("npv_alle_szenarien", [overlay], figsize=(9, 5)))
+    return specs
+
+
+def _pth_figures(n: int = 100_000, seed: int = 42) -> List[FigureSpec]:
+    import Pth_MC as m
+
+    rng = np.random.default_rng(seed)
+    depths, gradients = m.draw_samples(rng, n)
+    delta_T = gradients * depths + m.b
+    P_th_kW = m.m_dot * m.c_p * delta_T / 1_000
+
+    def ci(a):
+        mean, half = a.mean(), 1.96 * a.std(ddof=1) / np.sqrt(a.size)
+        return mean, (mean - half, mean + half)
+
+    mu_dT, band_dT = ci(delta_T)
+    mu_P, band_P = ci(P_th_kW)
+    return [
+        FigureSpec("pth_hexbin_deltat", [Panel([hist2d(depths, delta_T)], "Tiefe z (m)", "ΔT (K)",
+                                               "ΔT – MC mit z ∈ [1700, 2200] m")]),
+        FigureSpec("pth_hexbin_pth", [Panel([hist2d(depths, P_th_kW, cmap="plasma")], "Tiefe z (m)", "P_th (kW)",
+                                            "P_th – abgeleitet aus denselben ΔT‑Samples")]),
+        FigureSpec("pth_histogramme", [
+            Panel([hist1d(delta_T, 60)], "ΔT (K)", "Häufigkeit (%)", "ΔT‑Verteilung",
+                  vlines=[(mu_dT, None)], bands=[band_dT]),
+            Panel([hist1d(P_th_kW, 60, color="tab:orange")], "P_th (kW)", "Häufigkeit (%)", "P_th‑Verteilung",
+                  vlines=[(mu_P, None)], bands=[band_P]),
+        ], title="Histogramme (z ∈ [1700, 2200] m, %-Skala)", figsize=(13, 4)),
+    ]
+
+
+def _cost_figures(n: int = 100_000, seed: int = 42) -> List[FigureSpec]:
+    from Drilling_MC import drilling_cost
+    from Pipeline_MC import pipeline_cost
+
+    rng = np.random.default_rng(seed)
+    drill = drilling_cost(rng.uniform(3_900, 4_000, n))
+    pipe = pipeline_cost(rng.uniform(1_000, 3_000, n))
+    return [
+        FigureSpec("drilling_costs", [Panel([hist1d(drill, 50, scale=1e6)], "costs (Mio. €)", "frequency (%)",
+                                            "Drilling costs with Monte‑Carlo simulation")]),
+        FigureSpec("pipeline_costs", [Panel([hist1d(pipe, 50, scale=1e6)], "costs (Mio. €)", "frequency (%)",
+                                            "Pipeline costs with Monte‑Carlo simulation")]),
+    ]
+
+
+def thesis_figures() -> List[FigureSpec]:
+    """Alle automatisch erzeugbaren Abbildungen (Simulation + Binning, ohne Zeichnen)."""
+    return _npv_figures() + _pth_figures() + _cost_figures()
+
+
+def _cli():
+    ap = argparse.ArgumentParser(description="Alle Abbildungen headless rendern.")
+    ap.add_argument("--out", type=Path, default=Path("figures"), help="Zielordner")
+    ap.add_argument("--formats", nargs="+", default=["png", "svg"], help="Dateiformate")
+    ap.add_argument("--workers", type=int, default=None, help="Prozesse (Standard: alle Kerne)")
+    args = ap.parse_args()
+
+    import matplotlib
+
+    matplotlib.use("Agg")       # Skripte, die beim Import plotten, öffnen so keine Fenster
+    from mc_trace import stage, trace_run
+
+    with trace_run("render", verbose=True):
+        with stage("simulate+bin"):
+            specs = thesis_figures()
+        with stage("render", len(specs), workers=args.workers):
+            paths = render_all(specs, args.out, args.formats, args.workers)
+    print(f"{len(paths)} Dateien gespeichert unter: {args.out.resolve()}")
+
+
+if __name__ == "__main__":
+    _cli()
@@ -0,0 +1,194 @@
+"""
+Spaltenorientierter Ergebnisspeicher statt Excel-Dumps ganzer Läufe.
+
+Aufbau eines Speichers (Ordner):
+    meta.json                 Spaltennamen, dtypes, Zeilen je Chunk, freie Attribute
+    chunk_00000/c0.npy …      eine .npy-Datei je Spalte und Chunk
+
+• append() hängt einen neuen Chunk an (dict mit Arrays oder DataFrame)
+• iter_chunks() / read() lesen chunkweise bzw. komplett, optional nur
+  ausgewählte Spalten (Projektion) – gelesen per Memory-Map
+• export_excel() schreibt nur eine Kennzahlen-Zusammenfassung (oder auf
+  Wunsch die Tabelle, wenn sie klein ist), export_parquet() optional mit pyarrow
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, Mapping, Sequence
+
+import numpy as np
+
+__all__ = ["ResultStore"]
+
+META = "meta.json"
+
+
+class ResultStore:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        meta_path = self.path / META
+        if meta_path.exists():
+            self.meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        else:
+            self.meta = {"columns": [], "dtypes": [], "chunks": [], "attrs": {}}
+
+    # ---------- Eigenschaften ----------
+    @property
+    def columns(self) -> list:
+        return list(self.meta["columns"])
+
+    @property
+    def attrs(self) -> dict:
+        return self.meta["attrs"]
+
+    def __len__(self) -> int:
+        return sum(self.meta["chunks"])
+
+    def exists(self) -> bool:
+        return (self.path / META).exists()
+
+    # ---------- Schreiben ----------
+    @classmethod
+    def create(cls, path: str | Path, overwrite: bool = True, **attrs) -> "ResultStore":
+        """Neuer, leerer Speicher; overwrite=True löscht einen vorhandenen."""
+        store = cls(path)
+        if store.exists():
+            if not overwrite:
+                raise FileExistsError(f"Ergebnisspeicher existiert bereits: {store.path}")
+            store.clear()
+        store.meta["attrs"].update(attrs)
+        store.path.mkdir(parents=True, exist_ok=True)
+        store._save_meta()
+        return store
+
+    def append(self, data) -> "ResultStore":
+        """Hängt einen Chunk an; data = {Spalte: Array} oder pandas.DataFrame."""
+        cols = {str(k): np.asarray(v) for k, v in _as_columns(data).items()}
+        lengths = {len(v) for v in cols.values()}
+        if len(lengths) != 1:
+            raise ValueError("Alle Spalten eines Chunks brauchen dieselbe Länge")
+        if not self.meta["columns"]:
+            self.meta["columns"] = list(cols)
+            self.meta["dtypes"] = [_storage_dtype(v).str for v in cols.values()]
+        elif list(cols) != self.meta["columns"]:
+            raise ValueError(f"Spalten passen nicht zum Speicher: {list(cols)} ≠ {self.meta['columns']}")
+
+        chunk_dir = self.path / f"chunk_{len(self.meta['chunks']):05d}"
+        chunk_dir.mkdir(parents=True, exist_ok=True)
+        for j, (name, values) in enumerate(cols.items()):
+            np.save(chunk_dir / f"c{j}.npy", values.astype(_storage_dtype(values), copy=False))
+        self.meta["chunks"].append(lengths.pop())
+        self._save_meta()
+        return self
+
+    def _save_meta(self) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp = self.path / (META + ".tmp")
+        tmp.write_text(json.dumps(self.meta, indent=1, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path / META)
+
+    def clear(self) -> None:
+        for chunk_dir in self.path.glob("chunk_*"):
+            for f in chunk_dir.glob("*.npy"):
+                f.unlink()
+            chunk_dir.rmdir()
+        (self.path / META).unlink(missing_ok=True)
+        self.meta = {"columns": [], "dtypes": [], "chunks": [], "attrs": {}}
+
+    # ---------- Lesen ----------
+    def _col_index(self, columns: Sequence[str] | None) -> Dict[str, int]:
+        names = self.meta["columns"]
+        if columns is None:
+            return {name: j for j, name in enumerate(names)}
+        missing = [c for c in columns if c not in names]
+        if missing:
+            raise KeyError(f"Unbekannte Spalten: {missing} (vorhanden: {names})")
+        return {c: names.index(c) for c in columns}
+
+    def iter_chunks(self, columns: Sequence[str] | None = None) -> Iterator[Dict[str, np.ndarray]]:
+        """Liefert die gespeicherten Chunks nacheinander als {Spalte: Memory-Map}."""
+        index = self._col_index(columns)
+        for i in range(len(self.meta["chunks"])):
+            chunk_dir = self.path / f"chunk_{i:05d}"
+            yield {name: np.load(chunk_dir / f"c{j}.npy", mmap_mode="r") for name, j in index.items()}
+
+    def read(self, columns: Sequence[str] | None = None) -> Dict[str, np.ndarray]:
+        """Liest (ausgewählte) Spalten vollständig in den Speicher."""
+        index = self._col_index(columns)
+        parts = {name: [] for name in index}
+        for chunk in self.iter_chunks(columns):
+            for name, values in chunk.items():
+                parts[name].append(values)
+        return {
+            name: np.concatenate(p) if p else np.empty(0, dtype=self.meta["dtypes"][index[name]])
+            for name, p in parts.items()
+        }
+
+    def to_frame(self, columns: Sequence[str] | None = None):
+        import pandas as pd
+
+        return pd.DataFrame(self.read(columns))
+
+    # ---------- Exporte ----------
+    def summary(self, percentiles: Sequence[float] = (10, 50, 90)) -> Dict[str, Dict[str, float]]:
+        """Mittelwert und Perzentile je numerischer Spalte (spaltenweise gelesen)."""
+        out = {}
+        for name, dtype in zip(self.meta["columns"], self.meta["dtypes"]):
+            if np.dtype(dtype).kind not in "fiub":
+                continue
+            values = self.read([name])[name]
+            row = {"Mittelwert": float(values.mean())} if values.size else {}
+            row.update({f"P{p:g}": float(v) for p, v in zip(percentiles, np.percentile(values, percentiles))}
+                       if values.size else {})
+            out[name] = row
+        return out
+
+    def export_excel(self, path: str | Path, full: bool = False, max_rows: int = 100_000) -> Path:
+        """Excel nur als Zusammenfassung; full=True schreibt die Tabelle (bis max_rows Zeilen)."""
+        import pandas as pd
+
+        if full:
+            if len(self) > max_rows:
+                raise ValueError(f"{len(self):,} Zeilen – zu groß für Excel (max_rows={max_rows:,})")
+            df = self.to_frame()
+        else:
+            df = pd.DataFrame(self.summary()).T.rename_axis("Spalte").reset_index()
+        path = Path(path)
+        df.to_excel(path, index=False)
+        return path
+
+    def export_parquet(self, path: str | Path) -> Path:
+        """Optional: Parquet-Datei (benötigt pyarrow), ein Row-Group je Chunk."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = Path(path)
+        writer = None
+        try:
+            for chunk in self.iter_chunks():
+                table = pa.table({k: np.asarray(v) for k, v in chunk.items()})
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        return path
+
+
+def _as_columns(data) -> Mapping[str, object]:
+    if isinstance(data, Mapping):
+        return data
+    if hasattr(data, "columns") and hasattr(data, "to_numpy"):        # pandas.DataFrame
+        return {c: data[c].to_numpy() for c in data.columns}
+    raise TypeError(f"Erwartet dict oder DataFrame, nicht {type(data).__name__}")
+
+
+def _storage_dtype(values: np.ndarray) -> np.dtype:
+    # Objekt-Spalten (z. B. Strings aus pandas) als Unicode speichern → ohne Pickle ladbar
+    if values.dtype == object:
+        return np.asarray(values.astype(str)).dtype
+    return values.dtype
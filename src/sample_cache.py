@@ -0,0 +1,251 @@
+"""
+Inhaltsadressierter Festplatten-Cache für Stichproben und reduzierte Statistik.
+
+• Schlüssel = SHA-256 über (Verteilungsparameter, Seed, N, Sampler, Position)
+• Arrays als .npy, gelesen per Memory-Map (np.load(mmap_mode="r"))
+• Statistiken als .npz
+• LRU-Verdrängung nach Gesamtgröße (Zugriffszeit = mtime, wird bei Treffern erneuert)
+
+Spaltenweise Schlüssel: Bei sampler="pseudo" hängt eine Spalte nur von Seed, N,
+ihrer eigenen Verteilung und dem Zufallszahlen-*Verbrauch* der vorherigen
+Spalten ab. Log-Normal, Normal und Gleichverteilung verbrauchen unabhängig von
+ihren Parametern gleich viele Zufallszahlen – dort geht nur der Typ in den
+Schlüssel ein. So teilen sich z. B. NPV_Verteilung_Bohrung_P10/P50/P90 (nur
+CAPEX verschieden) die Q- und OPEX-Ziehungen.
+
+Cache-Verzeichnis: Umgebungsvariable MC_CACHE_DIR, sonst ~/.cache/masterthesis_mc
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Mapping
+
+import numpy as np
+
+__all__ = ["SampleCache", "MemoryCache", "cache_key", "cached_sample_block"]
+
+MAX_BYTES_DEFAULT = 2 * 1024 ** 3   # 2 GiB
+
+
+def cache_key(*parts) -> str:
+    """Stabiler Hash über JSON-serialisierbare Bestandteile."""
+    blob = json.dumps(parts, sort_keys=True, default=_json_default).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()[:32]
+
+
+def _json_default(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.random.SeedSequence):
+        return {"entropy": obj.entropy, "spawn_key": list(obj.spawn_key)}
+    if hasattr(obj, "params") and hasattr(obj, "kind"):
+        return _dist_signature(obj)
+    raise TypeError(f"Nicht hashbar für den Cache: {type(obj).__name__}")
+
+
+class SampleCache:
+    def __init__(self, root: str | Path | None = None, max_bytes: int = MAX_BYTES_DEFAULT):
+        root = root or os.environ.get("MC_CACHE_DIR") or Path.home() / ".cache" / "masterthesis_mc"
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    # ---------- Arrays ----------
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.root / key[:2] / f"{key}{suffix}"
+
+    def get_array(self, key: str) -> np.ndarray | None:
+        path = self._path(key, ".npy")
+        try:
+            arr = np.load(path, mmap_mode="r")
+        except (FileNotFoundError, ValueError, OSError):
+            self.misses += 1
+            return None
+        self._touch(path)
+        self.hits += 1
+        return arr
+
+    def put_array(self, key: str, arr: np.ndarray) -> None:
+        self._write(self._path(key, ".npy"), lambda f: np.save(f, np.ascontiguousarray(arr)))
+
+    # ---------- Statistik ----------
+    def get_stats(self, key: str) -> Dict[str, np.ndarray] | None:
+        path = self._path(key, ".npz")
+        try:
+            with np.load(path) as data:
+                out = {k: data[k] for k in data.files}
+        except (FileNotFoundError, ValueError, OSError):
+            self.misses += 1
+            return None
+        self._touch(path)
+        self.hits += 1
+        return out
+
+    def put_stats(self, key: str, arrays: Mapping[str, np.ndarray]) -> None:
+        self._write(self._path(key, ".npz"), lambda f: np.savez(f, **arrays))
+
+    # ---------- Verwaltung ----------
+    def _write(self, path: Path, writer) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # erst temporär schreiben, dann atomar umbenennen (parallele Läufe)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                writer(f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _entries(self):
+        for path in self.root.glob("*/*"):
+            if path.suffix in (".npy", ".npz"):
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    continue
+                yield st.st_mtime, st.st_size, path
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> None:
+        """Älteste Einträge löschen, bis die Gesamtgröße ≤ max_bytes ist."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        for _, _, path in list(self._entries()):
+            path.unlink(missing_ok=True)
+
+
+class MemoryCache:
+    """Cache im Arbeitsspeicher mit derselben Schnittstelle – für einen einzelnen Lauf ohne Festplatte."""
+
+    def __init__(self):
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._stats: Dict[str, Dict[str, np.ndarray]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, store: dict, key: str):
+        value = store.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def get_array(self, key: str) -> np.ndarray | None:
+        return self._get(self._arrays, key)
+
+    def put_array(self, key: str, arr: np.ndarray) -> None:
+        self._arrays[key] = arr
+
+    def get_stats(self, key: str) -> Dict[str, np.ndarray] | None:
+        return self._get(self._stats, key)
+
+    def put_stats(self, key: str, arrays: Mapping[str, np.ndarray]) -> None:
+        self._stats[key] = dict(arrays)
+
+    def clear(self) -> None:
+        self._arrays.clear()
+        self._stats.clear()
+
+
+def _dist_signature(dist) -> dict:
+    # sampler_version: wird erhöht, wenn sich der Ziehungs-Algorithmus einer
+    # Verteilung ändert → alte Cache-Einträge passen nicht mehr zum Schlüssel
+    sig = {"kind": dist.kind, **dist.params()}
+    version = getattr(dist, "sampler_version", None)
+    if version is not None:
+        sig["sampler_version"] = version
+    return sig
+
+
+def _stream_signature(dist) -> object:
+    # Verteilungen mit parameterunabhängigem Zufallszahlen-Verbrauch → nur Typ (+ Version)
+    if getattr(dist, "stream_invariant", False):
+        version = getattr(dist, "sampler_version", None)
+        return dist.kind if version is None else [dist.kind, version]
+    return _dist_signature(dist)
+
+
+def cached_sample_block(
+    inputs: Mapping[str, object],
+    n: int,
+    seed: int | np.random.SeedSequence,
+    sampler: str = "pseudo",
+    cache: SampleCache | None = None,
+    dtype=np.float64,
+) -> Dict[str, np.ndarray]:
+    """
+    Wie mc_engine.sample_block, aber spaltenweise über den Cache.
+
+    pseudo: der Zufallsstrom wird nur bis zur letzten fehlenden Spalte
+    durchlaufen; alle späteren Spalten kommen aus dem Cache. Fehlt z. B. nur
+    CAPEX (erste Spalte), wird nur CAPEX gezogen.
+    sobol/lhs: die Punktmenge wird neu erzeugt, ppf nur für fehlende Spalten.
+    """
+    from mc_engine import DTYPES, as_distribution, sample_block, uniform_points
+
+    if cache is None or isinstance(seed, np.random.Generator):
+        return sample_block(inputs, n, seed, sampler, dtype)
+
+    dtype = np.dtype(DTYPES.get(dtype, dtype)).type
+    # float32 zieht aus einem anderen Strom → eigener Schlüsselraum
+    tag = "col" if dtype == np.float64 else f"col-{np.dtype(dtype).name}"
+    dists = {name: as_distribution(spec) for name, spec in inputs.items()}
+    keys, prefix = {}, []
+    for j, (name, dist) in enumerate(dists.items()):
+        if sampler == "pseudo":
+            keys[name] = cache_key(tag, sampler, seed, n, prefix, dist)
+            prefix = prefix + [_stream_signature(dist)]
+        else:
+            # QMC/LHS: Spalte j = ppf_j(u[:, j]); u hängt nur von (Seed, N, d) ab
+            keys[name] = cache_key(tag, sampler, seed, n, len(dists), j, dist)
+
+    cols = {name: cache.get_array(key) for name, key in keys.items()}
+    missing = [j for j, col in enumerate(cols.values()) if col is None]
+    if not missing:
+        return cols
+
+    rng = np.random.default_rng(seed)
+    if sampler == "pseudo":
+        for j, (name, dist) in enumerate(dists.items()):
+            if j > missing[-1]:
+                break
+            # auch bei Treffer ziehen → Strom bleibt synchron
+            draw = dist.sample(rng, n) if dtype == np.float64 else dist.sample(rng, n, dtype)
+            if cols[name] is None:
+                cols[name] = draw
+                cache.put_array(keys[name], draw)
+    else:
+        u = uniform_points(sampler, n, len(dists), rng)
+        for j, (name, dist) in enumerate(dists.items()):
+            if cols[name] is None:
+                cols[name] = dist.ppf(u[:, j]).astype(dtype, copy=False)
+                cache.put_array(keys[name], cols[name])
+    return cols
@@ -0,0 +1,138 @@
+"""
+Thermische Leistung und Jahreswärme als Fläche über (Tiefe, Gradient, ṁ).
+
+• thermal_surface() rechnet P_th = ṁ · c_p · (g · z + b) auf dem ganzen Gitter
+  in einem Broadcast (statt einer Python-Schleife je Gradient) und legt das
+  Gitter im SampleCache ab – gleiche Achsen/Konstanten → Laden statt Rechnen
+• ThermalSurface.power() / annual_heat() interpolieren (multilinear) auf dem
+  Gitter; P_th ist linear in z, g und ṁ getrennt, die Interpolation ist auf
+  den Gitterzellen also exakt
+• ThermalSurface.range_mean() liefert die mittlere Leistung über Tiefen-
+  intervalle [z_lo, z_hi] (z ~ U) für viele Kandidaten auf einmal – für das
+  Standort-Screening
+
+    from thermal_surface import thermal_surface
+    surf = thermal_surface(np.arange(1000, 4001, 10), np.linspace(0.025, 0.035, 21))
+    q = surf.annual_heat(depths, gradients)                 # GWh_th/a je Ziehung
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import numpy as np
+
+from Pth import Pth, b as B_DEFAULT, c_p as C_P_DEFAULT
+from massenstrom import m_dot as M_DOT_DEFAULT
+from sample_cache import SampleCache, cache_key
+
+__all__ = ["VLS", "ThermalSurface", "thermal_surface"]
+
+VLS = 8_000         # Volllaststunden [h/a] wie annualyheatproduction.py / heatproduktion_MC.py
+
+
+@dataclass
+class ThermalSurface:
+    depths: np.ndarray          # (Z,) m, aufsteigend
+    gradients: np.ndarray       # (G,) °C/m, aufsteigend
+    m_dots: np.ndarray          # (M,) kg/s, aufsteigend
+    p_th: np.ndarray            # (Z, G, M) W
+    full_load_hours: float = VLS
+
+    @property
+    def q_gwh(self) -> np.ndarray:
+        """Jahreswärme auf dem Gitter (GWh_th/a)."""
+        return self.p_th * (self.full_load_hours / 1e9)
+
+    # ---------- Interpolation ----------
+    def _blend(self, fn: Callable[[np.ndarray, np.ndarray], np.ndarray], gradient, m_dot) -> np.ndarray:
+        # bilinear in (g, ṁ): fn(j, k) liefert den Wert je Ziehung auf Gitterlinie (j, k)
+        j0, j1, tj = _locate(self.gradients, gradient, "Gradient")
+        k0, k1, tk = _locate(self.m_dots, self.m_dots[0] if m_dot is None else m_dot, "Massenstrom")
+        return ((1 - tj) * (1 - tk) * fn(j0, k0) + tj * (1 - tk) * fn(j1, k0)
+                + (1 - tj) * tk * fn(j0, k1) + tj * tk * fn(j1, k1))
+
+    def power(self, depth, gradient, m_dot=None) -> np.ndarray:
+        """P_th (W) an beliebigen Punkten; m_dot=None → erster (bzw. einziger) Gitterwert."""
+        depth = np.asarray(depth, dtype=float)
+        i0, i1, ti = _locate(self.depths, depth, "Tiefe")
+        return self._blend(lambda j, k: (1 - ti) * self.p_th[i0, j, k] + ti * self.p_th[i1, j, k],
+                           gradient, m_dot)
+
+    def annual_heat(self, depth, gradient, m_dot=None) -> np.ndarray:
+        """Jahreswärme Q (GWh_th/a) an beliebigen Punkten."""
+        return self.power(depth, gradient, m_dot) * (self.full_load_hours / 1e9)
+
+    def range_mean(self, z_lo, z_hi, gradient, m_dot=None) -> np.ndarray:
+        """
+        Mittlere Leistung (W) bei z ~ U(z_lo, z_hi) je Kandidat: exaktes Integral
+        der stückweise linearen Fläche über das Tiefenintervall.
+        """
+        z_lo, z_hi = np.asarray(z_lo, dtype=float), np.asarray(z_hi, dtype=float)
+        if np.any(z_hi <= z_lo):
+            raise ValueError("Tiefenintervalle brauchen z_hi > z_lo")
+        # Stammfunktion auf den Knoten (Trapez = exakt für lineare Stücke)
+        dz = np.diff(self.depths)[:, None, None]
+        cum = np.concatenate([np.zeros((1,) + self.p_th.shape[1:]),
+                              np.cumsum(dz * (self.p_th[1:] + self.p_th[:-1]) / 2, axis=0)])
+
+        def integral(z):
+            i0, i1, t = _locate(self.depths, z, "Tiefe")
+            h = self.depths[i1] - self.depths[i0]
+
+            def fn(j, k):
+                p0, p1 = self.p_th[i0, j, k], self.p_th[i1, j, k]
+                return cum[i0, j, k] + h * (t * p0 + t * t / 2 * (p1 - p0))
+            return fn
+
+        lo, hi = integral(z_lo), integral(z_hi)
+        return self._blend(lambda j, k: hi(j, k) - lo(j, k), gradient, m_dot) / (z_hi - z_lo)
+
+
+def _locate(grid: np.ndarray, x, name: str):
+    """Zellindex (links/rechts) und Gewicht t ∈ [0, 1] je Punkt; außerhalb des Gitters → Fehler."""
+    x = np.asarray(x, dtype=float)
+    if x.size and (x.min() < grid[0] or x.max() > grid[-1]):
+        raise ValueError(f"{name} außerhalb des Gitters [{grid[0]}, {grid[-1]}]")
+    if grid.size == 1:
+        i = np.zeros(x.shape, dtype=np.intp)
+        return i, i, np.zeros(x.shape)
+    i0 = np.clip(np.searchsorted(grid, x, side="right") - 1, 0, grid.size - 2)
+    i1 = i0 + 1
+    return i0, i1, (x - grid[i0]) / (grid[i1] - grid[i0])
+
+
+def _axis(values, name: str) -> np.ndarray:
+    a = np.atleast_1d(np.asarray(values, dtype=float))
+    if a.ndim != 1 or np.any(np.diff(a) <= 0):
+        raise ValueError(f"{name}-Achse muss eindimensional und streng aufsteigend sein")
+    return a
+
+
+def thermal_surface(
+    depths: Sequence[float],
+    gradients: Sequence[float],
+    m_dots: Sequence[float] = (M_DOT_DEFAULT,),
+    *,
+    c_p: float = C_P_DEFAULT,
+    b: float = B_DEFAULT,
+    full_load_hours: float = VLS,
+    cache: SampleCache | None = None,
+) -> ThermalSurface:
+    """P_th auf dem Gitter depths × gradients × m_dots (ein Broadcast, gecacht)."""
+    z, g, m = _axis(depths, "Tiefen"), _axis(gradients, "Gradienten"), _axis(m_dots, "Massenstrom")
+
+    # Quelltext von Pth im Schlüssel → Modelländerung = neu rechnen
+    code = hashlib.sha256(inspect.getsource(Pth).encode("utf-8")).hexdigest()[:16]
+    key = cache_key("thermal_surface", code, z, g, m, c_p, b)
+    hit = cache.get_stats(key) if cache is not None else None
+    if hit is not None:
+        p_th = hit["p_th"]
+    else:
+        p_th = Pth(z[:, None, None], g[None, :, None], m_dot=m[None, None, :], c_p=c_p, b=b)
+        if cache is not None:
+            cache.put_stats(key, {"p_th": p_th})
+    return ThermalSurface(z, g, m, p_th, full_load_hours)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# die Module liegen flach in src/ (wie beim Start der Skripte aus src/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
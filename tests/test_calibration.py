@@ -0,0 +1,31 @@
+"""Kalibrierte Bohrkosten-Kurven (user-025)."""
+
+import numpy as np
+import pytest
+
+from calibration import fit_cost_curve
+
+DEPTH = np.array([1_750.0, 1_950.0, 2_150.0])
+COST = np.array([6_436_000.0, 7_041_000.0, 7_644_000.0])
+
+
+@pytest.mark.parametrize("method", ["bootstrap", "posterior"])
+def test_no_degrees_of_freedom_is_rejected(method):
+    # drei Punkte, drei Parameter → σ = 0, keine messbare Koeffizienten-Unsicherheit
+    with pytest.raises(ValueError, match="n − p > 0"):
+        fit_cost_curve(DEPTH, COST, degree=2, method=method)
+
+
+def test_default_line_has_uncertainty():
+    curve = fit_cost_curve(DEPTH, COST + [0.0, 3_000.0, 0.0])
+    lo, hi = curve.interval(DEPTH)
+    assert curve.degree == 1 and curve.sigma > 0
+    assert np.all(hi > lo)
+
+
+def test_no_silent_extrapolation():
+    curve = fit_cost_curve(DEPTH, COST + [0.0, 3_000.0, 0.0])
+    with pytest.raises(ValueError):
+        curve(np.array([2_500.0]))
+    curve.extrapolate = True
+    assert np.isfinite(curve(np.array([2_500.0]))).all()
@@ -0,0 +1,44 @@
+"""Exakte Kostenverteilung monotoner Kurven (user-024)."""
+
+import numpy as np
+import pytest
+
+from cost_analytic import PolyCurve, analytic_cost, shifted_moments
+from Drilling_MC import DRILLING_CURVE
+from mc_engine import Lognormal, Normal, TruncNormal, Truncated, Uniform
+
+
+@pytest.mark.parametrize("dist", [
+    Uniform(3_900, 4_000),
+    Normal(4_000, 50),
+    TruncNormal(4_000, 80, 3_850, 4_100),
+    Truncated(Normal(4_000, 80), low=3_950),
+    Lognormal(3_800, 4_000, 4_250),
+])
+def test_matches_large_sample(dist):
+    cost = analytic_cost(DRILLING_CURVE, dist)
+    y = DRILLING_CURVE(dist.ppf(np.random.default_rng(0).random(400_000)))
+    assert cost.mean == pytest.approx(y.mean(), rel=1e-3)
+    assert cost.std == pytest.approx(y.std(), rel=1e-2)
+    np.testing.assert_allclose(cost.percentile([10, 50, 90]), np.percentile(y, [10, 50, 90]), rtol=1e-3)
+
+
+def test_moments_match_quadrature():
+    d = TruncNormal(4_000, 80, 3_850, 4_100)
+    x = d.ppf((np.arange(200_000) + 0.5) / 200_000)
+    ref = [np.mean((x - 4_000.0) ** j) for j in range(5)]
+    np.testing.assert_allclose(shifted_moments(d, 4, 4_000.0), ref, rtol=1e-6, atol=1e-6)
+
+
+def test_decreasing_curve_and_cdf():
+    curve = PolyCurve((10.0, -2.0))            # fallend
+    cost = analytic_cost(curve, Uniform(0.0, 1.0))
+    assert not cost.increasing
+    np.testing.assert_allclose(cost.percentile([10, 50, 90]), [8.2, 9.0, 9.8])
+    np.testing.assert_allclose(cost.cdf(cost.ppf([0.1, 0.5, 0.9])), [0.1, 0.5, 0.9])
+    assert cost.bin_probabilities(np.linspace(*cost.range(), 11)).sum() == pytest.approx(1.0)
+
+
+def test_vertex_inside_support_is_rejected():
+    with pytest.raises(ValueError, match="nicht monoton"):
+        analytic_cost(PolyCurve((0.0, -2.0, 1.0)), Uniform(0.0, 2.0))
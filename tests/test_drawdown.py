@@ -0,0 +1,50 @@
+"""Thermischer Durchbruch und Jahreswärme (user-019)."""
+
+import numpy as np
+import pytest
+from scipy.optimize import brentq
+
+from drawdown import annual_ratio, simulate_npv_drawdown, temperature_ratio
+from mc_engine import Fixed
+from npv_model import lognormal_scenario, simulate_npv
+
+
+def _tau(theta):
+    return (np.sin(theta) - theta * np.cos(theta)) / np.sin(theta) ** 3
+
+
+@pytest.mark.parametrize("x", [0.4, 0.7, 1.0, 2.0, 5.0, 20.0])
+def test_ratio_table_matches_streamline_root(x):
+    theta = brentq(lambda t: _tau(t) - x, 1e-6, np.pi - 1e-9)
+    assert temperature_ratio(x) == pytest.approx(1.0 - theta / np.pi, abs=1e-4)
+
+
+def test_ratio_is_one_before_breakthrough():
+    np.testing.assert_array_equal(temperature_ratio(np.array([0.0, 0.1, 1.0 / 3.0])), 1.0)
+
+
+def test_annual_ratio_is_yearly_mean():
+    t0 = np.array([12.0, 45.0])
+    got = annual_ratio(t0, years=30)
+    mid = (np.arange(4_000) + 0.5) / 4_000          # Mittelpunktregel je Jahr
+    for i, t in enumerate(t0):
+        ref = [temperature_ratio((y - 1 + mid) / t).mean() for y in range(1, 31)]
+        np.testing.assert_allclose(got[i], ref, atol=2e-4)
+
+
+def test_no_breakthrough_equals_simulate_npv():
+    # Kurze Laufzeit, riesiges Reservoir: kein Durchbruch → NPV wie ohne Abkühlung
+    sc = lognormal_scenario(capex=(9.1e6, 9.8e6, 10.5e6), q=(77.66, 88.76, 100.70),
+                            opex=(1.9e6, 2.6e6, 3.3e6), years=10, n_sim=2_000)
+    doublet = {"spacing_m": Fixed(5_000.0), "thickness_m": Fixed(80.0), "rho_c_aquifer": Fixed(2.7e6)}
+    draws, npv = simulate_npv_drawdown(sc, doublet=doublet, chunk_size=700)
+    assert draws["t0_years"].min() > 3 * sc.years
+    np.testing.assert_allclose(npv, simulate_npv(sc)[1], rtol=1e-9)
+
+
+def test_chunk_size_does_not_change_result():
+    sc = lognormal_scenario(capex=(9.1e6, 9.8e6, 10.5e6), q=(77.66, 88.76, 100.70),
+                            opex=(1.9e6, 2.6e6, 3.3e6), n_sim=3_000)
+    _, a = simulate_npv_drawdown(sc, chunk_size=3_000)
+    _, b = simulate_npv_drawdown(sc, chunk_size=512)
+    np.testing.assert_array_equal(a, b)
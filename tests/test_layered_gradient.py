@@ -0,0 +1,28 @@
+"""Geschichtetes Temperaturprofil (user-018)."""
+
+import numpy as np
+import pytest
+
+from layered_gradient import Layer, LayeredGradient, layers_from_config
+from mc_engine import Uniform
+
+
+def test_single_layer_matches_linear_gradient():
+    model = LayeredGradient([Layer("alle", 0, 0.03)], b=10.0)
+    depth = np.array([0.0, 1_000.0, 2_500.0])
+    np.testing.assert_allclose(model.delta_T(depth, np.array([0.03])), 10.0 + 0.03 * depth)
+
+
+def test_gradients_follow_layer_order():
+    model = LayeredGradient([Layer("oben", 0, Uniform(0.020, 0.021)), Layer("unten", 1_000, Uniform(0.040, 0.041))])
+    g = model.sample_gradients(100, 1)
+    assert np.all((0.020 <= g[:, 0]) & (g[:, 0] <= 0.021))
+    assert np.all((0.040 <= g[:, 1]) & (g[:, 1] <= 0.041))
+
+
+def test_duplicate_layer_names_rejected():
+    layers = [Layer("A", 0, Uniform(0.020, 0.021)), Layer("A", 1_000, Uniform(0.040, 0.041))]
+    with pytest.raises(ValueError, match="eindeutig"):
+        LayeredGradient(layers)
+    with pytest.raises(ValueError, match="eindeutig"):
+        layers_from_config([{"name": "A", "top": 0, "gradient": 0.02}, {"name": "A", "top": 1_000, "gradient": 0.04}])
@@ -0,0 +1,44 @@
+"""Reproduzierbare Mehrprozess-Läufe (user-005) und Streaming-Statistik (user-003)."""
+
+import numpy as np
+import pytest
+
+from mc_parallel import chunk_sizes, run_chunks, spawn_streams
+from npv_model import lognormal_scenario, simulate_npv_stream
+from sample_cache import SampleCache
+
+SCENARIO = lognormal_scenario(capex=(8_710_000, 9_120_000, 9_530_000), q=(77.66, 88.76, 100.70),
+                              opex=(1_842_494.42, 2_493_592.47, 3_218_984.25), seed=42)
+
+
+def test_chunk_sizes_cover_n():
+    assert chunk_sizes(10, 4) == [4, 4, 2]
+    assert chunk_sizes(8, 4) == [4, 4]
+
+
+def test_spawn_streams_accepts_seed_sequence():
+    a = [s.generate_state(2) for s in spawn_streams(7, 3)]
+    b = [s.generate_state(2) for s in spawn_streams(np.random.SeedSequence(7), 3)]
+    np.testing.assert_array_equal(a, b)
+
+
+def test_stream_bitidentical_across_workers():
+    one = simulate_npv_stream(SCENARIO, 40_000, chunk_size=10_000, workers=1).state()
+    two = simulate_npv_stream(SCENARIO, 40_000, chunk_size=10_000, workers=2).state()
+    assert one.keys() == two.keys()
+    for key in one:
+        np.testing.assert_array_equal(one[key], two[key])
+
+
+def test_empty_run_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="n_sim"):
+        run_chunks(print, 0, 42)
+    with pytest.raises(ValueError, match="n_sim"):
+        simulate_npv_stream(SCENARIO, 0, cache=SampleCache(tmp_path))
+
+
+def test_run_chunks_accepts_seed_sequence():
+    a = simulate_npv_stream(SCENARIO, 10_000, seed=7, chunk_size=4_000).state()
+    b = simulate_npv_stream(SCENARIO, 10_000, seed=np.random.SeedSequence(7), chunk_size=4_000).state()
+    for key in a:
+        np.testing.assert_array_equal(a[key], b[key])
@@ -0,0 +1,23 @@
+"""Laufzeit-Traces (user-013)."""
+
+import json
+
+from mc_trace import current, stage, trace_run
+
+
+def test_stage_is_noop_without_run():
+    assert current() is None
+    with stage("sample", 10) as rec:
+        assert rec == {}
+
+
+def test_same_name_runs_do_not_overwrite(tmp_path):
+    for _ in range(3):      # schneller als eine Sekunde hintereinander
+        with trace_run("npv", tmp_path):
+            with stage("sample", 1_000):
+                pass
+    traces = sorted(tmp_path.glob("npv_*.json"))
+    assert len([p for p in traces if not p.name.endswith(".trace.json")]) == 3
+    assert len([p for p in traces if p.name.endswith(".trace.json")]) == 3
+    data = json.loads(next(p for p in traces if not p.name.endswith(".trace.json")).read_text(encoding="utf-8"))
+    assert data["run"] == "npv" and [s["stage"] for s in data["stages"]] == ["sample"]
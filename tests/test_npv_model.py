@@ -0,0 +1,58 @@
+"""NPV-Kern und Szenario-Achse."""
+
+import numpy as np
+import pytest
+
+from mc_engine import sample_block
+from npv_model import (
+    lognormal_scenario,
+    npv_closed_form,
+    npv_matrix,
+    scenario_block,
+    simulate_npv,
+    simulate_scenarios,
+)
+from sample_cache import SampleCache
+
+Q = (77.66, 88.76, 100.70)
+OPEX = (1_842_494.42, 2_493_592.47, 3_218_984.25)
+CAPEX = {
+    "P10": (8_710_000, 9_120_000, 9_530_000),
+    "P50": (9_430_000, 9_840_000, 10_260_000),
+    "P90": (10_160_000, 10_570_000, 10_980_000),
+}
+
+
+def _scenario(capex=CAPEX["P10"], **kwargs):
+    kwargs = {"price_per_mwh": 80.0, "opex_growth": 0.02, "discount_rate": 0.06,
+              "years": 30, "n_sim": 5_000, "seed": 42, **kwargs}
+    return lognormal_scenario(capex=capex, q=Q, opex=OPEX, **kwargs)
+
+
+# user-004: geschlossene Form = abgezinste Jahressumme, auch für g = r und r = 0
+@pytest.mark.parametrize("opex_growth, discount_rate", [(0.02, 0.06), (0.06, 0.06), (0.0, 0.0)])
+def test_closed_form_equals_matrix(opex_growth, discount_rate):
+    sc = _scenario(opex_growth=opex_growth, discount_rate=discount_rate)
+    block = sample_block(sc.inputs, sc.n_sim, sc.seed)
+    args = block["capex"], block["q"], block["opex1"], sc
+    np.testing.assert_allclose(npv_closed_form(*args), npv_matrix(*args), rtol=1e-9, atol=1e-3)
+
+
+# user-010: jede Zeile des Szenario-Blocks = Einzelszenario (Common Random Numbers)
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_scenario_block_rows_match_simulate_npv(tmp_path, use_cache):
+    scenarios = [_scenario(capex, name=name) for name, capex in CAPEX.items()]
+    cache = SampleCache(tmp_path) if use_cache else None
+    block = scenario_block(scenarios, 2_000, 42, cache=cache)
+    for i, sc in enumerate(scenarios):
+        draws, _ = simulate_npv(sc, 2_000, 42)
+        for name, col in draws.items():
+            np.testing.assert_array_equal(block[name][i], col)
+
+
+def test_simulate_scenarios_matches_single_runs():
+    scenarios = [_scenario(CAPEX["P50"], name="mit Förderung", subsidy=0.4),
+                 _scenario(CAPEX["P50"], name="8 % Zins", discount_rate=0.08)]
+    _, npv = simulate_scenarios(scenarios)
+    for i, sc in enumerate(scenarios):
+        np.testing.assert_allclose(npv[i], simulate_npv(sc)[1], rtol=1e-9, atol=1e-3)
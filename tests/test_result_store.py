@@ -0,0 +1,29 @@
+"""Spaltenspeicher für Ergebnistabellen (user-012)."""
+
+import numpy as np
+import pandas as pd
+
+from Opexcosts_all_table import build_rows
+from result_store import ResultStore
+
+
+def test_round_trip_over_chunks(tmp_path):
+    df = pd.DataFrame(build_rows())
+    store = ResultStore.create(tmp_path / "opex", discount_rate=0.06)
+    store.append(df.iloc[:100]).append(df.iloc[100:])
+
+    reopened = ResultStore(tmp_path / "opex")
+    assert len(reopened) == len(df) and reopened.columns == list(df.columns)
+    assert reopened.attrs == {"discount_rate": 0.06}
+    pd.testing.assert_frame_equal(reopened.to_frame(), df, check_dtype=False)
+
+
+def test_projection_and_summary(tmp_path):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=1_000)
+    store = ResultStore.create(tmp_path / "s").append({"x": x[:400], "y": 2 * x[:400]}).append({"x": x[400:], "y": 2 * x[400:]})
+    assert list(store.read(["y"])) == ["y"]
+    np.testing.assert_array_equal(store.read(["x"])["x"], x)
+    summary = store.summary()["x"]
+    np.testing.assert_allclose([summary["P10"], summary["P50"], summary["P90"]], np.percentile(x, [10, 50, 90]))
+    assert summary["Mittelwert"] == x.mean()
@@ -0,0 +1,64 @@
+"""Inhaltsadressierter Stichproben-Cache (user-009)."""
+
+import numpy as np
+
+from mc_engine import Lognormal, TruncNormal, Uniform, sample_block
+from npv_model import lognormal_scenario, simulate_npv_stream
+from sample_cache import SampleCache, cache_key, cached_sample_block
+
+Q = (77.66, 88.76, 100.70)
+OPEX = (1_842_494.42, 2_493_592.47, 3_218_984.25)
+
+
+def test_cached_equals_uncached(tmp_path):
+    inputs = {"capex": Lognormal(8_710_000, 9_120_000, 9_530_000), "depth": TruncNormal(4_000, 100, 3_800, 4_200),
+              "q": Uniform(70, 100)}
+    cache = SampleCache(tmp_path)
+    fresh = sample_block(inputs, 1_000, 7)
+    for _ in range(2):      # 1. Lauf füllt den Cache, 2. Lauf liest nur noch
+        cached = cached_sample_block(inputs, 1_000, 7, cache=cache)
+        for name in inputs:
+            np.testing.assert_array_equal(cached[name], fresh[name])
+    assert cache.hits == len(inputs)
+
+
+def test_scenarios_share_later_columns(tmp_path):
+    # nur CAPEX (erste Spalte) verschieden → Q und OPEX kommen aus dem Cache
+    cache = SampleCache(tmp_path)
+    p10 = {"capex": Lognormal(8_710_000, 9_120_000, 9_530_000), "q": Lognormal(*Q), "opex1": Lognormal(*OPEX)}
+    p90 = {**p10, "capex": Lognormal(10_160_000, 10_570_000, 10_980_000)}
+    cached_sample_block(p10, 1_000, 7, cache=cache)
+    hits = cache.hits
+    cached = cached_sample_block(p90, 1_000, 7, cache=cache)
+    assert cache.hits - hits == 2
+    fresh = sample_block(p90, 1_000, 7)
+    for name in p90:
+        np.testing.assert_array_equal(cached[name], fresh[name])
+
+
+def test_stream_stats_from_cache(tmp_path):
+    sc = lognormal_scenario(capex=(8_710_000, 9_120_000, 9_530_000), q=Q, opex=OPEX)
+    cache = SampleCache(tmp_path)
+    plain = simulate_npv_stream(sc, 20_000, chunk_size=5_000).state()
+    for _ in range(2):
+        cached = simulate_npv_stream(sc, 20_000, chunk_size=5_000, cache=cache).state()
+        for key in plain:
+            np.testing.assert_array_equal(cached[key], plain[key])
+    assert cache.hits == 1
+
+
+def test_sampler_version_invalidates_cache(tmp_path, monkeypatch):
+    inputs = {"depth": TruncNormal(4_000, 100, 3_800, 4_200), "q": Uniform(70, 100)}
+    cache = SampleCache(tmp_path)
+    old_key = cache_key("col", inputs["depth"])
+    cached_sample_block(inputs, 1_000, 7, cache=cache)
+
+    # user-016: neuer Ziehungs-Algorithmus: gespiegelte Gleichverteilte, Version erhöht
+    monkeypatch.setattr(TruncNormal, "sampler_version", TruncNormal.sampler_version + 1)
+    monkeypatch.setattr(TruncNormal, "sample", lambda self, rng, size, dtype=np.float64: self.ppf(1.0 - rng.random(size)))
+    assert cache_key("col", inputs["depth"]) != old_key
+
+    fresh = sample_block(inputs, 1_000, 7)
+    cached = cached_sample_block(inputs, 1_000, 7, cache=cache)
+    for name in inputs:
+        np.testing.assert_array_equal(cached[name], fresh[name])